@@ -0,0 +1,133 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Series: Dict von Symbol zu (Datumswerte, Werte), jeweils nach Datum sortiert
+Series = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def align(series: Series) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """
+    Richtet die Reihen vieler Symbole in einem Schritt auf einen gemeinsamen Datumsindex aus. Statt einer Schleife
+    über Symbolpaare werden alle Reihen aneinandergehängt, der Index per np.unique gebildet und die Werte mit einer
+    einzigen Zuweisung in die Matrix übertragen.
+
+    :param series: Dict von Symbol zu (Datumswerte, Werte).
+    :return: Tupel (Datumsindex, Symbole, Matrix der Form (Tage, Symbole)); Tage ohne Wert eines Symbols sind NaN.
+    """
+    symbols = list(series)
+    if not symbols:
+        return np.empty(0, dtype="datetime64[ns]"), [], np.empty((0, 0))
+    dates = np.concatenate([np.asarray(series[symbol][0]) for symbol in symbols])
+    values = np.concatenate([np.asarray(series[symbol][1], dtype=np.float64) for symbol in symbols])
+    columns = np.repeat(np.arange(len(symbols)), [len(series[symbol][0]) for symbol in symbols])
+
+    index, rows = np.unique(dates, return_inverse=True)
+    matrix = np.full((len(index), len(symbols)), np.nan)
+    # Bei doppelten Tagen eines Symbols gewinnt der letzte Wert
+    matrix[rows, columns] = values
+    return index, symbols, matrix
+
+
+def returns(series: Series, log: bool = False) -> Series:
+    """
+    Berechnet die Renditen jedes Symbols gegenüber seinem eigenen Vorwert, bevor die Reihen ausgerichtet werden.
+    Fehlende Tage eines Symbols (z. B. abweichende Feiertage) erzeugen so keine zusätzlichen Lücken.
+
+    :param series: Dict von Symbol zu (Datumswerte, Kurse).
+    :param log: Logarithmische statt einfacher Renditen.
+    :return: Dict von Symbol zu (Datumswerte ab dem zweiten Tag, Renditen).
+    """
+    result = {}
+    for symbol, (dates, values) in series.items():
+        values = np.asarray(values, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = values[1:] / values[:-1]
+        result[symbol] = (np.asarray(dates)[1:], np.log(ratio) if log else ratio - 1)
+    return result
+
+
+def _pairwise_sums(matrix: np.ndarray):
+    """
+    Summen für paarweise vollständige Statistiken: Für jedes Spaltenpaar zählen nur die Zeilen, in denen beide
+    Werte vorhanden sind. Alle Summen entstehen als Matrixprodukte über die Maske der gültigen Werte.
+
+    :return: Tupel (Anzahl, Summe x, Summe x², Summe x·y), jeweils als Matrix (Spalten, Spalten); die Summen von y
+        sind die transponierten Summen von x.
+    """
+    valid = ~np.isnan(matrix)
+    values = np.where(valid, matrix, 0.0)
+    mask = valid.astype(np.float64)
+    count = mask.T @ mask
+    sum_x = values.T @ mask
+    sum_xx = (values * values).T @ mask
+    sum_xy = values.T @ values
+    return count, sum_x, sum_xx, sum_xy
+
+
+def covariance_matrix(matrix: np.ndarray, min_periods: int = 2) -> np.ndarray:
+    """
+    Paarweise Kovarianz aller Spalten (Stichprobenkovarianz, ddof=1) über die jeweils gemeinsam vorhandenen Zeilen.
+
+    :param matrix: Werte der Form (Zeilen, Spalten), z. B. Renditen aus align; NaN für fehlende Werte.
+    :param min_periods: Mindestanzahl gemeinsamer Zeilen; darunter ist das Ergebnis NaN.
+    :return: Symmetrische Matrix (Spalten, Spalten).
+    """
+    count, sum_x, _, sum_xy = _pairwise_sums(matrix)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = (sum_xy - sum_x * sum_x.T / count) / (count - 1)
+    cov[count < max(min_periods, 2)] = np.nan
+    return cov
+
+
+def correlation_matrix(matrix: np.ndarray, min_periods: int = 2) -> np.ndarray:
+    """
+    Paarweise Pearson-Korrelation aller Spalten über die jeweils gemeinsam vorhandenen Zeilen (wie
+    pandas.DataFrame.corr, aber mit wenigen Matrixprodukten statt einer Schleife über alle Paare).
+
+    :param matrix: Werte der Form (Zeilen, Spalten), z. B. Renditen aus align; NaN für fehlende Werte.
+    :param min_periods: Mindestanzahl gemeinsamer Zeilen; darunter ist das Ergebnis NaN.
+    :return: Symmetrische Matrix (Spalten, Spalten) mit Werten zwischen -1 und 1.
+    """
+    count, sum_x, sum_xx, sum_xy = _pairwise_sums(matrix)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sum_xy - sum_x * sum_x.T / count
+        var_x = sum_xx - sum_x * sum_x / count
+        corr = cov / np.sqrt(var_x * var_x.T)
+    corr[count < max(min_periods, 2)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def rolling_beta(asset: np.ndarray, index: np.ndarray, window: int, min_periods: int = None) -> np.ndarray:
+    """
+    Rollierendes Beta von Renditen gegenüber einem Index: Kovarianz geteilt durch die Varianz des Index über die
+    letzten window Zeilen. Über kumulierte Summen wird jedes Fenster in konstanter Zeit berechnet; asset darf auch
+    eine Matrix (Zeilen, Symbole) sein, dann entsteht das Beta aller Symbole auf einmal.
+
+    :param asset: Renditen eines oder mehrerer Symbole, am Index ausgerichtet (siehe align); NaN für fehlende Werte.
+    :param index: Renditen des Index mit gleicher Zeilenzahl.
+    :param window: Fensterlänge in Zeilen.
+    :param min_periods: Mindestanzahl gemeinsamer Werte im Fenster; standardmäßig window.
+    :return: Beta mit derselben Form wie asset; NaN, solange das Fenster nicht genug Werte enthält.
+    """
+    asset = np.asarray(asset, dtype=np.float64)
+    index = np.asarray(index, dtype=np.float64)
+    if asset.ndim == 2:
+        index = index[:, None]
+    valid = ~np.isnan(asset) & ~np.isnan(index)
+    x = np.where(valid, index, 0.0)
+    y = np.where(valid, asset, 0.0)
+
+    def window_sum(values: np.ndarray) -> np.ndarray:
+        cumulative = np.cumsum(values, axis=0)
+        result = cumulative.copy()
+        result[window:] -= cumulative[:-window]
+        return result
+
+    count = window_sum(valid.astype(np.float64))
+    sum_x, sum_y = window_sum(x), window_sum(y)
+    sum_xx, sum_xy = window_sum(x * x), window_sum(x * y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = (sum_xy - sum_x * sum_y / count) / (sum_xx - sum_x * sum_x / count)
+    beta[count < max(min_periods or window, 2)] = np.nan
+    return beta
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Rendert Diagramme ohne GUI (z. B. für nächtliche Reports). Es wird weder PySide6 noch eine QApplication benötigt:
+Die Daten werden über den DataManager geladen und mit derselben Plot-Logik wie in der GUI (PlotFigure) auf dem
+Agg-Backend gezeichnet. Jeder Datensatz wird in einem eigenen Prozess eines ProcessPoolExecutor gerendert.
+
+Beispiele:
+    python BatchRender.py --symbols AAPL,MSFT,GOOGL
+    python BatchRender.py --files Exports/AAPL.npz Exports/MSFT.csv --plot date:close --plot date:volume:Bar
+    python BatchRender.py --symbols AAPL --plot "date:RSI(close,14)" --plot date:close:Kerzen
+    python BatchRender.py --symbols AAPL --spec specs.json --format svg --workers 8 --out ./Exports/Charts
+    python BatchRender.py --files Exports/AAPL.npz --dashboard 2x3
+
+Eine Spec-Datei enthält eine JSON-Liste von Plot-Beschreibungen, z. B.
+    [{"x": "date", "y": "close", "typ": "Linie", "color": "auto", "title": "Schlusskurs"}]
+Für x und y sind neben den Spalten auch Indikatoren wie "SMA(close,20)" oder "RSI(close,14)" möglich.
+Zulässige Schlüssel: x, y, typ ("Linie", "Scatter", "Bar" oder "Kerzen"; bei "Kerzen" entfallen x und y, gezeichnet
+werden open, high, low, close und volume), color ("auto" = grün bei steigendem, rot bei fallendem Verlauf wie im
+Standardplot), title, x_label, y_label, legend, legend_title, legend_text.
+
+Mit --dashboard ZxS wird pro Datensatz zusätzlich ein Dashboard mit Z Zeilen und S Spalten gerendert (Kurs, Volumen
+und Indikatoren in einer Figure mit gemeinsamer x-Achse, wie im Dashboard-Modus der GUI).
+
+Die Bilder heißen <Datensatz>_<x>_<y>, <Datensatz>_ohlc bzw. <Datensatz>_dashboard. Haben mehrere Dateien denselben
+Namen ohne Endung, enthält der Datensatzname die Endung (eod_csv, eod_json); doppelte Plots erhalten einen Zähler.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from ColumnStore import ColumnStore
+from DashboardFigure import DashboardFigure
+from DataManager import DataManager
+from EodCache import EodCache
+from Indicators import IndicatorEngine
+from PlotFigure import PlotFigure
+
+# Standard: derselbe Plot wie der Standardplot der GUI
+DEFAULT_SPEC = {"x": "date", "y": "close", "typ": "Linie", "color": "auto"}
+
+
+class AggPlotCanvas(PlotFigure, FigureCanvasAgg):
+    """PlotFigure auf dem Agg-Backend ohne Qt. Gezeichnet wird erst beim Speichern mit save_figure."""
+
+    def draw(self):
+        # Ohne Bildschirm wäre jedes Zeichnen vor dem Speichern verschwendet; savefig zeichnet selbst
+        pass
+
+    def draw_idle(self, *args, **kwargs):
+        pass
+
+
+class AggDashboardCanvas(DashboardFigure, FigureCanvasAgg):
+    """DashboardFigure auf dem Agg-Backend ohne Qt. Gezeichnet wird erst beim Speichern mit save_figure."""
+
+    def draw(self):
+        pass
+
+    def draw_idle(self, *args, **kwargs):
+        pass
+
+
+def is_growing(y) -> bool:
+    """Wie MainWindow.is_growing: True, wenn der letzte Wert größer als der erste ist."""
+    return len(y) > 1 and y[-1] > y[0]
+
+
+def output_path(out_dir: str, stem: str, fmt: str, used: Optional[Set[str]] = None) -> str:
+    """
+    Bildet den Pfad einer Ausgabedatei. Kommt ein Name für denselben Datensatz mehrfach vor (z. B. derselbe Plot
+    als Linie und als Balken), wird ein Zähler angehängt: _2, _3 usw.
+
+    :param out_dir: Zielordner.
+    :param stem: Dateiname ohne Endung; unzulässige Zeichen werden durch "_" ersetzt.
+    :param fmt: Bildformat als Dateiendung.
+    :param used: Bereits vergebene Namen; der neue Name wird ergänzt.
+    :return: Pfad der Datei.
+    """
+    stem = candidate = re.sub(r"[^\w.-]+", "_", stem)
+    if used is not None:
+        counter = 1
+        while candidate in used:
+            counter += 1
+            candidate = f"{stem}_{counter}"
+        used.add(candidate)
+    return os.path.join(out_dir, f"{candidate}.{fmt}")
+
+
+def dataset_names(file_paths: List[str]) -> Dict[str, str]:
+    """
+    Ordnet Dateien den Namen zu, unter denen sie gerendert werden: dem Dateinamen ohne Endung. Haben mehrere
+    Dateien denselben Namen (z. B. eod.csv und eod.json), wird die Endung angehängt (eod_csv, eod_json); bleiben
+    Namen gleich (gleiche Datei in verschiedenen Ordnern), wird ein Zähler angehängt.
+
+    :param file_paths: Pfade der Dateien.
+    :return: Dict Pfad -> Name.
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in file_paths]
+    names, used = {}, set()
+    for path, stem in zip(file_paths, stems):
+        if stems.count(stem) > 1:
+            stem = os.path.basename(path).replace(".", "_")
+        name, counter = stem, 1
+        while name in used:
+            counter += 1
+            name = f"{stem}_{counter}"
+        used.add(name)
+        names[path] = name
+    return names
+
+
+def render_store(store: ColumnStore, name: str, specs: List[Dict[str, Any]], out_dir: str, fmt: str = "png",
+                 width: float = 12, height: float = 6, dpi: int = 100,
+                 dashboard: Optional[Tuple[int, int]] = None) -> List[str]:
+    """
+    Rendert alle Plot-Specs für einen Datensatz. Die Figure wird zwischen den Specs wiederverwendet.
+
+    :param store: Zu plottende Daten.
+    :param name: Name des Datensatzes (Symbol oder Dateiname), erscheint im Titel und im Dateinamen.
+    :param specs: Liste von Plot-Beschreibungen (siehe Moduldokumentation).
+    :param out_dir: Zielordner.
+    :param fmt: Bildformat, z. B. "png" oder "svg".
+    :param width: Breite in Zoll.
+    :param height: Höhe in Zoll.
+    :param dpi: Auflösung.
+    :param dashboard: Optionales Raster (Zeilen, Spalten) für ein zusätzliches Dashboard (siehe render_dashboard).
+    :return: Pfade der geschriebenen Dateien.
+    :raises ValueError: Wenn eine Spalte fehlt oder nicht plottbar ist.
+    """
+    paths, used = [], set()
+    if dashboard is not None:
+        paths.append(render_dashboard(store, name, *dashboard, out_dir, fmt, width=width, height=height, dpi=dpi,
+                                      used=used))
+    canvas = AggPlotCanvas(width=width, height=height, dpi=dpi)
+    indicators = IndicatorEngine()
+    for spec in specs:
+        if spec.get("typ") == "Kerzen":
+            paths.append(render_candles(canvas, store, name, spec, out_dir, fmt, used))
+            continue
+        x_key, y_key = spec["x"], spec["y"]
+        x_data, y_data = [indicators.compute(store, key, name) if key not in store and indicators.is_indicator(key)
+                          else store.plottable(key) for key in (x_key, y_key)]
+        if not len(x_data) or not len(y_data):
+            raise ValueError(f"{name}: Die Spalten '{x_key}' und '{y_key}' sind nicht verfügbar.")
+
+        x_label = spec.get("x_label") or x_key.capitalize()
+        y_label = spec.get("y_label") or y_key.capitalize()
+        color = spec.get("color", "auto")
+        if color == "auto":
+            color = "lime" if is_growing(y_data) else "crimson"
+        canvas.plot(x_data, y_data, title=spec.get("title") or f"{name}  {x_label} vs. {y_label}",
+                    x_label=x_label, y_label=y_label, diagram_typ=spec.get("typ", "Linie"), color=color,
+                    legend=bool(spec.get("legend", False)), legend_title=spec.get("legend_title"),
+                    legend_text=spec.get("legend_text"))
+
+        path = output_path(out_dir, f"{name}_{x_key}_{y_key}", fmt, used)
+        canvas.save_figure(path, format=fmt)
+        paths.append(path)
+    return paths
+
+
+def render_candles(canvas: AggPlotCanvas, store: ColumnStore, name: str, spec: Dict[str, Any], out_dir: str,
+                   fmt: str, used: Optional[Set[str]] = None) -> str:
+    """
+    Rendert ein Kerzendiagramm mit Volumen aus den Spalten date, open, high, low, close und volume.
+
+    :param used: Bereits vergebene Dateinamen des Datensatzes (siehe output_path).
+    :return: Pfad der geschriebenen Datei.
+    :raises ValueError: Wenn eine der OHLC-Spalten fehlt.
+    """
+    ohlc = [store.plottable(key) for key in ("open", "high", "low", "close")]
+    if not all(len(values) for values in ohlc):
+        raise ValueError(f"{name}: Für ein Kerzendiagramm werden die Spalten open, high, low und close benötigt.")
+    volume = store.plottable("volume")
+    canvas.plot_candles(store.plottable("date"), *ohlc, volume=volume if len(volume) else None,
+                        title=spec.get("title") or f"{name}  OHLC", x_label=spec.get("x_label") or "Date",
+                        y_label=spec.get("y_label") or "Price")
+    path = output_path(out_dir, f"{name}_ohlc", fmt, used)
+    canvas.save_figure(path, format=fmt)
+    return path
+
+
+def render_dashboard(store: ColumnStore, name: str, rows: int, cols: int, out_dir: str, fmt: str,
+                     width: float = 12, height: float = 6, dpi: int = 100, used: Optional[Set[str]] = None) -> str:
+    """
+    Rendert Kurs, Volumen und Indikatoren eines Datensatzes als Dashboard (siehe DataManager.dashboard_panels).
+
+    :param used: Bereits vergebene Dateinamen des Datensatzes (siehe output_path).
+    :return: Pfad der geschriebenen Datei.
+    :raises ValueError: Wenn der Datensatz keine Datumsspalte hat.
+    """
+    data_manager = DataManager()
+    data_manager.set_store(store)
+    panels = data_manager.dashboard_panels(rows * cols)
+    if not panels:
+        raise ValueError(f"{name}: Für ein Dashboard wird eine Datumsspalte benötigt.")
+    for panel in panels:
+        if panel["key"] == "close":
+            panel["color"] = "lime" if is_growing(panel["y"]) else "crimson"
+    canvas = AggDashboardCanvas(width=width, height=height, dpi=dpi)
+    canvas.show_panels(panels, rows, cols)
+    path = output_path(out_dir, f"{name}_dashboard", fmt, used)
+    canvas.save_figure(path, format=fmt)
+    return path
+
+
+def parse_grid(value: str) -> Tuple[int, int]:
+    """Wandelt eine Rasterangabe wie "2x3" in (Zeilen, Spalten) um."""
+    match = re.fullmatch(r"\s*(\d+)\s*[x×]\s*(\d+)\s*", value)
+    if match is None or not all(int(part) for part in match.groups()):
+        raise argparse.ArgumentTypeError(f"Ungültiges Raster '{value}', erwartet z. B. 2x3.")
+    return int(match.group(1)), int(match.group(2))
+
+
+def render_file(file_path: str, specs: List[Dict[str, Any]], out_dir: str, name: Optional[str] = None,
+                **kwargs) -> List[str]:
+    """
+    Lädt eine Datei im Worker-Prozess und rendert sie (siehe render_store).
+
+    :param file_path: JSON-, CSV- oder Binärdatei.
+    :param name: Name im Titel und in den Dateinamen; standardmäßig der Dateiname ohne Endung.
+    :return: Pfade der geschriebenen Dateien.
+    """
+    name = name or os.path.splitext(os.path.basename(file_path))[0]
+    return render_store(DataManager.read_file(file_path), name, specs, out_dir, **kwargs)
+
+
+def load_specs(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Sammelt die Plot-Specs aus --spec und --plot; ohne Angabe wird der Standardplot gerendert."""
+    specs = []
+    if args.spec:
+        with open(args.spec, 'r', encoding='utf-8') as f:
+            specs.extend(json.load(f))
+    for plot in args.plot or []:
+        parts = plot.split(":")
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Ungültige Plot-Angabe '{plot}', erwartet X:Y oder X:Y:TYP.")
+        spec = dict(DEFAULT_SPEC, x=parts[0], y=parts[1])
+        if len(parts) == 3:
+            spec["typ"] = parts[2]
+        specs.append(spec)
+    return specs or [dict(DEFAULT_SPEC)]
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Rendert Diagramme für mehrere Symbole oder Dateien ohne GUI.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--symbols", help="Kommagetrennte Börsensymbole, geladen über die Marketstack-API "
+                                          "(Schlüssel in der Umgebungsvariable API_KEY).")
+    source.add_argument("--files", nargs="+", help="JSON-, CSV-, NPZ-, Feather- oder Parquet-Dateien.")
+    parser.add_argument("--spec", help="JSON-Datei mit einer Liste von Plot-Specs.")
+    parser.add_argument("--plot", action="append", metavar="X:Y[:TYP]",
+                        help="Zusätzlicher Plot, z. B. date:close oder date:volume:Bar (mehrfach möglich).")
+    parser.add_argument("--dashboard", type=parse_grid, metavar="ZxS",
+                        help="Zusätzlich ein Dashboard mit Z Zeilen und S Spalten rendern, z. B. 2x3.")
+    parser.add_argument("--out", default="./Exports/Charts", help="Zielordner (Standard: ./Exports/Charts).")
+    parser.add_argument("--format", default="png", choices=["png", "svg", "pdf", "jpg"], help="Bildformat.")
+    parser.add_argument("--width", type=float, default=12, help="Breite in Zoll.")
+    parser.add_argument("--height", type=float, default=6, help="Höhe in Zoll.")
+    parser.add_argument("--dpi", type=int, default=100, help="Auflösung.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Anzahl Prozesse.")
+    parser.add_argument("--no-cache", action="store_true", help="API-Daten nicht aus dem lokalen Cache laden.")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    specs = load_specs(args)
+    os.makedirs(args.out, exist_ok=True)
+    options = dict(fmt=args.format, width=args.width, height=args.height, dpi=args.dpi, dashboard=args.dashboard)
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        if args.symbols:
+            # Alle Symbole mit einer gebündelten Anfrage laden; gerendert wird parallel
+            symbols = [symbol.strip().upper() for symbol in args.symbols.split(",") if symbol.strip()]
+            data_manager = DataManager(cache=None if args.no_cache else EodCache())
+            stores = data_manager.fetch_api_batch(os.getenv("API_KEY"), symbols, sort="DESC", limit=1000)
+            for symbol in symbols:
+                if symbol not in stores:
+                    print(f"{symbol}: Keine Daten erhalten.", file=sys.stderr)
+                    failed += 1
+            futures = {executor.submit(render_store, store, symbol, specs, args.out, **options): symbol
+                       for symbol, store in stores.items()}
+        else:
+            names = dataset_names(args.files)
+            futures = {executor.submit(render_file, file_path, specs, args.out, names[file_path], **options): file_path
+                       for file_path in args.files}
+
+        for future in as_completed(futures):
+            try:
+                for path in future.result():
+                    print(path)
+            except Exception as e:
+                print(f"{futures[future]}: {e}", file=sys.stderr)
+                failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
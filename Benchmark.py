@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Reproduzierbare Benchmarks für das Laden, Umwandeln, Plotten und Exportieren von Kursdaten. Die Datensätze werden
+synthetisch im Format der Marketstack-API erzeugt (Minutenkurse, fester Zufalls-Seed) und einmalig als CSV und JSON
+im Datenordner abgelegt. Geplottet wird wie in BatchRender auf dem Agg-Backend ohne Qt.
+
+Für jeden Benchmark und jede Größe werden die minimale und die mittlere Laufzeit (Median) sowie in einem
+zusätzlichen Durchlauf der Spitzen-Speicherbedarf (tracemalloc) gemessen. Die Ergebnisse werden als JSON unter
+dem Commit-Hash gespeichert und lassen sich mit --compare gegen einen früheren Stand vergleichen. Ohne --sizes wird
+nur mit 1.000 Zeilen gemessen; größere Datensätze (bis 1e7) werden ausdrücklich angegeben.
+
+Die Ergebnisse hängen vom Rechner ab und werden nicht eingecheckt. Als Vergleichsbasis wird die Suite zuerst auf dem
+Vergleichs-Commit ausgeführt (git checkout <basis>; python Benchmark.py) und danach auf dem aktuellen Stand mit
+--compare Benchmarks/results/<basis>.json.
+
+Beispiele:
+    python Benchmark.py
+    python Benchmark.py --sizes 1e3,1e4,1e7 --filter load_ --repeat 3
+    python Benchmark.py --compare Benchmarks/results/<basis>.json
+    python Benchmark.py --startup --startup-budget 500
+
+Mit --startup wird stattdessen die Importzeit des Hauptfensters (MarketDataAPIv3) in einem frischen Interpreter mit
+"python -X importtime" gemessen. Die Prüfung schlägt fehl (Rückgabewert 1), wenn das Zeitbudget überschritten wird
+oder eine der beim Start aufgeschobenen Bibliotheken (STARTUP_DEFERRED) bereits importiert wurde.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Any, Callable, Optional
+
+import numpy as np
+
+import Analytics
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from BatchRender import AggDashboardCanvas, AggPlotCanvas
+from ColumnStore import ColumnStore
+from DataManager import DataManager
+
+# Standardgröße für einen schnellen Lauf; größere Datensätze über --sizes
+DEFAULT_SIZES = [1_000]
+DEFAULT_DATA_DIR = "./Benchmarks/data"
+DEFAULT_RESULTS_DIR = "./Benchmarks/results"
+# Ab dieser relativen Verlangsamung wird ein Benchmark beim Vergleich markiert
+REGRESSION_THRESHOLD = 0.10
+# Startprüfung: gemessenes Modul, Zeitbudget (ms) und Bibliotheken, die erst bei Bedarf importiert werden dürfen
+STARTUP_MODULE = "MarketDataAPIv3"
+STARTUP_BUDGET_MS = 600
+STARTUP_DEFERRED = ("pandas", "requests", "matplotlib", "pyarrow")
+
+
+def make_store(n_rows: int, symbol: str = "BENCH", seed: int = 0) -> ColumnStore:
+    """
+    Erzeugt einen synthetischen Datensatz mit allen Feldern der Marketstack-API (Minutenkurse ab 2000-01-03).
+
+    :param n_rows: Anzahl Zeilen.
+    :param symbol: Symbol aller Zeilen.
+    :param seed: Zufalls-Seed; gleiche Parameter ergeben immer dieselben Daten.
+    :return: Nach Datum sortierter ColumnStore.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_rows)))
+    open_ = close * (1 + rng.normal(0, 0.0005, n_rows))
+    high = np.maximum(open_, close) * (1 + rng.random(n_rows) * 0.001)
+    low = np.minimum(open_, close) * (1 - rng.random(n_rows) * 0.001)
+    volume = rng.integers(1_000, 1_000_000, n_rows)
+    dates = np.datetime64("2000-01-03T00:00", "ns") + np.arange(n_rows) * np.timedelta64(1, "m")
+    return ColumnStore.from_typed({
+        "open": open_.round(4), "high": high.round(4), "low": low.round(4), "close": close.round(4),
+        "volume": volume, "adj_high": high.round(4), "adj_low": low.round(4), "adj_close": close.round(4),
+        "adj_open": open_.round(4), "adj_volume": volume, "split_factor": np.ones(n_rows),
+        "dividend": np.zeros(n_rows), "symbol": np.full(n_rows, symbol, dtype=object),
+        "exchange": np.full(n_rows, "XNAS", dtype=object), "date": dates,
+    })
+
+
+def dataset_path(data_dir: str, n_rows: int, suffix: str) -> str:
+    """
+    Gibt den Pfad eines synthetischen Datensatzes zurück und erzeugt die Datei beim ersten Aufruf.
+
+    :param data_dir: Ordner der Datensätze.
+    :param n_rows: Anzahl Zeilen.
+    :param suffix: ".csv" oder ".json".
+    :return: Pfad zur Datei.
+    """
+    path = os.path.join(data_dir, f"eod_{n_rows}{suffix}")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        data_manager = DataManager()
+        data_manager.set_store(make_store(n_rows))
+        # Erst vollständig schreiben, dann umbenennen, damit abgebrochene Läufe keine halben Dateien hinterlassen
+        temp_path = path + ".tmp"
+        (data_manager.save_csv if suffix == ".csv" else data_manager.save_json)(temp_path)
+        os.replace(temp_path, path)
+    return path
+
+
+class Benchmark:
+    """Ein Benchmark: setup bereitet einmal pro Größe die Eingaben vor, run ist der gemessene Teil."""
+
+    def __init__(self, name: str, setup: Callable[[int, str], Any], run: Callable[[Any], Any],
+                 max_rows: Optional[int] = None, number: int = 1):
+        """
+        :param name: Name des Benchmarks.
+        :param setup: setup(n_rows, data_dir) liefert den Kontext für run; wird nicht gemessen.
+        :param run: run(kontext) wird gemessen.
+        :param max_rows: Größte sinnvolle Datensatzgröße (z. B. ein Rechteck pro Zeile beim Balkendiagramm).
+        :param number: Aufrufe pro Messung wie bei timeit, für sehr kurze Laufzeiten; gemeldet wird die Zeit pro
+            Aufruf.
+        """
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.max_rows = max_rows
+        self.number = number
+
+
+def _loaded_data_manager(n_rows: int, data_dir: str) -> DataManager:
+    data_manager = DataManager()
+    data_manager.set_store(make_store(n_rows))
+    return data_manager
+
+
+def _fresh_data_manager(store: ColumnStore) -> DataManager:
+    """DataManager mit einer neuen Hülle um dieselben Spalten, damit keine Umwandlung zwischengespeichert ist."""
+    data_manager = DataManager()
+    data_manager.set_store(ColumnStore.from_typed({key: store.column(key) for key in store.keys()}))
+    return data_manager
+
+
+def _convert_standard(store: ColumnStore):
+    # Wie plot_standard: Datum und Schlusskurs für die gesamte Historie
+    data_manager = _fresh_data_manager(store)
+    return data_manager.get_window("date"), data_manager.get_window("close")
+
+
+def _convert_custom(store: ColumnStore):
+    # Wie update_custom_plot: eine Ganzzahlspalte und ein Indikator für das letzte Viertel der Historie
+    data_manager = _fresh_data_manager(store)
+    dates = data_manager.get_plot_data("date")
+    start = dates[len(dates) * 3 // 4]
+    return data_manager.get_window("volume", start), data_manager.get_window("SMA(close,20)", start)
+
+
+def _plot(diagram_typ: str) -> Callable[[ColumnStore], None]:
+    def run(store: ColumnStore):
+        canvas = AggPlotCanvas(width=12, height=6, dpi=100)
+        if diagram_typ == "Kerzen":
+            canvas.plot_candles(*(store.plottable(key) for key in ("date", "open", "high", "low", "close", "volume")),
+                                title="Benchmark OHLC")
+        else:
+            canvas.plot(store.plottable("date"), store.plottable("close"), title="Benchmark",
+                        x_label="Date", y_label="Close", diagram_typ=diagram_typ)
+        # AggPlotCanvas zeichnet erst beim Speichern; hier wird das Rendern explizit mitgemessen
+        FigureCanvasAgg.draw(canvas)
+    return run
+
+
+def _dashboard_panels(n_rows: int, data_dir: str) -> List[Dict[str, Any]]:
+    # Wie update_dashboard im Raster 3×4: sechs Panels des aktuellen Symbols und sechs Vergleichssymbole
+    data_manager = DataManager(max_datasets=12)
+    for seed in range(7):
+        data_manager.set_store(make_store(n_rows, symbol=f"BENCH{seed}", seed=seed))
+    return data_manager.dashboard_panels(12)
+
+
+def _plot_dashboard(panels: List[Dict[str, Any]]):
+    canvas = AggDashboardCanvas(width=16, height=9, dpi=100)
+    canvas.show_panels(panels, 3, 4)
+    FigureCanvasAgg.draw(canvas)
+
+
+def _plot_canvases(panels: List[Dict[str, Any]]):
+    # Zum Vergleich: dieselben Panels als einzelne Canvases, wie mit einem PlotCanvas pro Diagramm
+    for panel in panels:
+        canvas = AggPlotCanvas(width=4, height=3, dpi=100)
+        canvas.plot(panel["x"], panel["y"], title=panel["title"], diagram_typ=panel["typ"])
+        FigureCanvasAgg.draw(canvas)
+
+
+def _dashboard_unchanged(n_rows: int, data_dir: str):
+    # Bereits gezeichnetes Dashboard, das mit unveränderten Daten erneut aktualisiert wird
+    panels = _dashboard_panels(n_rows, data_dir)
+    canvas = AggDashboardCanvas(width=16, height=9, dpi=100)
+    canvas.show_panels(panels, 3, 4)
+    FigureCanvasAgg.draw(canvas)
+    return canvas, panels
+
+
+def _basket_series(n_rows: int, data_dir: str, n_symbols: int = 500) -> Dict[str, Any]:
+    # Schlusskurse von n_symbols Symbolen mit leicht versetzten Historien, damit die Ausrichtung Lücken füllen muss
+    rng = np.random.default_rng(0)
+    dates = np.datetime64("2000-01-03", "ns") + np.arange(n_rows + n_symbols) * np.timedelta64(1, "D")
+    return {f"SYM{index}": (dates[index:index + n_rows], 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_rows))))
+            for index in range(n_symbols)}
+
+
+def _correlation(series: Dict[str, Any]):
+    _, _, matrix = Analytics.align(Analytics.returns(series))
+    return Analytics.correlation_matrix(matrix, min_periods=20)
+
+
+def _export(method: str, suffix: str, **kwargs) -> Callable[[DataManager], None]:
+    def run(data_manager: DataManager):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            getattr(data_manager, method)(os.path.join(temp_dir, f"export{suffix}"), **kwargs)
+    return run
+
+
+BENCHMARKS = [
+    Benchmark("load_csv", lambda n, data_dir: dataset_path(data_dir, n, ".csv"),
+              lambda path: DataManager().load_from_file(path)),
+    Benchmark("load_json", lambda n, data_dir: dataset_path(data_dir, n, ".json"),
+              lambda path: DataManager().load_from_file(path)),
+    Benchmark("get_column_data", _loaded_data_manager,
+              lambda data_manager: data_manager.get_column_data("close"), number=10_000),
+    Benchmark("convert_standard", lambda n, data_dir: make_store(n), _convert_standard, number=100),
+    Benchmark("convert_custom", lambda n, data_dir: make_store(n), _convert_custom, number=10),
+    Benchmark("plot_linie", lambda n, data_dir: make_store(n), _plot("Linie")),
+    Benchmark("plot_scatter", lambda n, data_dir: make_store(n), _plot("Scatter")),
+    Benchmark("plot_bar", lambda n, data_dir: make_store(n), _plot("Bar"), max_rows=10_000),
+    Benchmark("plot_kerzen", lambda n, data_dir: make_store(n), _plot("Kerzen")),
+    Benchmark("plot_dashboard12", _dashboard_panels, _plot_dashboard),
+    Benchmark("plot_canvases12", _dashboard_panels, _plot_canvases, max_rows=10_000),
+    Benchmark("dashboard_unchanged", _dashboard_unchanged,
+              lambda context: context[0].show_panels(context[1], 3, 4), number=100),
+    Benchmark("correlation500", _basket_series, _correlation, max_rows=10_000),
+    Benchmark("export_json", _loaded_data_manager, _export("save_json", ".json")),
+    Benchmark("export_json_compact", _loaded_data_manager, _export("save_json", ".json", indent=None)),
+    Benchmark("export_json_gz", _loaded_data_manager, _export("save_json", ".json.gz", indent=None)),
+    Benchmark("export_csv", _loaded_data_manager, _export("save_csv", ".csv")),
+]
+
+
+def measure(benchmark: Benchmark, context: Any, repeat: int) -> Dict[str, float]:
+    """
+    Misst einen Benchmark: ein verworfener Aufwärmdurchlauf (z. B. für aufgeschobene Importe wie pandas und
+    gefüllte Caches), repeat Durchläufe für die Laufzeit und ein weiterer Durchlauf unter tracemalloc für den
+    Spitzen-Speicher (getrennt, weil tracemalloc die Laufzeit verfälscht).
+
+    :return: Dict mit min_s, median_s (jeweils pro Aufruf) und peak_mb.
+    """
+    benchmark.run(context)
+    times = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        for _ in range(benchmark.number):
+            benchmark.run(context)
+        times.append((time.perf_counter() - start) / benchmark.number)
+
+    tracemalloc.start()
+    try:
+        benchmark.run(context)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"min_s": min(times), "median_s": statistics.median(times), "peak_mb": peak / 2 ** 20}
+
+
+def git_revision() -> Dict[str, Any]:
+    """Commit-Hash und ob der Arbeitsstand davon abweicht; ohne Git-Repository "unknown"."""
+    repository = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True, cwd=repository).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                                    text=True, check=True, cwd=repository).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": False}
+    return {"commit": commit, "dirty": dirty}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline_path: str) -> List[str]:
+    """
+    Vergleicht Ergebnisse mit einer früheren Ergebnisdatei.
+
+    :return: Tabellenzeilen; Verlangsamungen über REGRESSION_THRESHOLD sind markiert.
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)["results"]
+    lines = [f"{'Benchmark':<32}{'alt (s)':>12}{'neu (s)':>12}{'Faktor':>9}{'Speicher (MB)':>22}"]
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        old = baseline[key]
+        ratio = result["min_s"] / old["min_s"] if old["min_s"] else float("inf")
+        marker = "  langsamer" if ratio > 1 + REGRESSION_THRESHOLD else ""
+        lines.append(f"{key:<32}{old['min_s']:>12.6f}{result['min_s']:>12.6f}{ratio:>8.2f}x"
+                     f"{old['peak_mb']:>11.1f} -> {result['peak_mb']:>7.1f}{marker}")
+    return lines
+
+
+def measure_startup(module: str = STARTUP_MODULE, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Misst die Importzeit eines Moduls in einem frischen Interpreter mit "python -X importtime".
+
+    :param module: Zu importierendes Modul.
+    :param repeat: Anzahl der Messungen; gewertet wird die schnellste (warmer Dateisystem-Cache).
+    :return: Dict mit total_ms, imported (Namen aller importierten Module) und largest (die zehn Module mit der
+             größten eigenen Importzeit als (Name, ms)).
+    :raises RuntimeError: Wenn der Import fehlschlägt.
+    """
+    repository = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for _ in range(max(1, repeat)):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True,
+                                 text=True, cwd=repository)
+        if process.returncode != 0:
+            raise RuntimeError(f"Import von {module} fehlgeschlagen:\n{process.stderr.strip()}")
+        # Zeilenformat: "import time: <eigene µs> | <kumulierte µs> | <Einrückung><Modul>"
+        rows = []
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            own, cumulative, name = line[len("import time:"):].split("|", 2)
+            if own.strip().isdigit():
+                rows.append((name.strip(), int(own) / 1000, int(cumulative) / 1000, name.startswith("  ")))
+        total = sum(cumulative for _, _, cumulative, nested in rows if not nested)
+        if best is None or total < best["total_ms"]:
+            best = {"total_ms": total, "imported": [name for name, _, _, _ in rows],
+                    "largest": sorted(((name, own) for name, own, _, _ in rows), key=lambda row: -row[1])[:10]}
+    return best
+
+
+def check_startup(budget_ms: float, module: str = STARTUP_MODULE) -> int:
+    """
+    Prüft die Importzeit gegen das Budget und gibt die größten Importe aus.
+
+    :return: 0 bei Erfolg, sonst 1.
+    """
+    result = measure_startup(module)
+    deferred = sorted({name.split(".")[0] for name in result["imported"]} & set(STARTUP_DEFERRED))
+    print(f"Import {module}: {result['total_ms']:.1f} ms (Budget {budget_ms:.0f} ms)")
+    for name, own in result["largest"]:
+        print(f"    {name:<48}{own:>8.1f} ms")
+    failed = False
+    if result["total_ms"] > budget_ms:
+        print("Das Zeitbudget für den Start ist überschritten.", file=sys.stderr)
+        failed = True
+    if deferred:
+        print(f"Beim Start importiert, obwohl erst bei Bedarf benötigt: {', '.join(deferred)}", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Misst Laufzeit und Speicherbedarf von Laden, Umwandeln, Plotten "
+                                                 "und Exportieren mit synthetischen Kursdaten.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="Kommagetrennte Datensatzgrößen in Zeilen, z. B. 1e3,1e4,1e7.")
+    parser.add_argument("--filter", default="", help="Nur Benchmarks, deren Name diesen Text enthält.")
+    parser.add_argument("--repeat", type=int, default=5, help="Durchläufe pro Messung (Standard: 5).")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Ordner für die synthetischen Datensätze.")
+    parser.add_argument("--out", default=DEFAULT_RESULTS_DIR, help="Ordner für die Ergebnisdateien.")
+    parser.add_argument("--compare", help="Frühere Ergebnisdatei, mit der verglichen wird.")
+    parser.add_argument("--startup", action="store_true",
+                        help="Nur die Importzeit des Hauptfensters gegen das Zeitbudget prüfen.")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS,
+                        help=f"Zeitbudget für --startup in Millisekunden (Standard: {STARTUP_BUDGET_MS}).")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    if args.startup:
+        return check_startup(args.startup_budget)
+    sizes = [int(float(size)) for size in args.sizes.split(",") if size.strip()]
+    revision = git_revision()
+
+    results = {}
+    for benchmark in BENCHMARKS:
+        if args.filter not in benchmark.name:
+            continue
+        for n_rows in sizes:
+            if benchmark.max_rows is not None and n_rows > benchmark.max_rows:
+                continue
+            key = f"{benchmark.name}[{n_rows}]"
+            results[key] = measure(benchmark, benchmark.setup(n_rows, args.data_dir), args.repeat)
+            print(f"{key:<32}{results[key]['min_s']:>12.6f} s (Median {results[key]['median_s']:.6f} s)"
+                  f"{results[key]['peak_mb']:>10.1f} MB", flush=True)
+
+    os.makedirs(args.out, exist_ok=True)
+    file_name = revision["commit"] + ("-dirty" if revision["dirty"] else "") + ".json"
+    result_path = os.path.join(args.out, file_name)
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(revision, date=time.strftime("%Y-%m-%dT%H:%M:%S"), python=platform.python_version(),
+                       machine=platform.platform(), repeat=args.repeat, results=results), f, indent=4)
+    print(f"Ergebnisse gespeichert: {result_path}")
+
+    if args.compare:
+        print("\n".join(compare(results, args.compare)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lokaler HTTP-Dienst, der Diagramme als PNG oder SVG ausliefert, damit Charts ohne die Desktop-App geteilt werden
+können. Die Daten kommen über den DataManager (API mit lokalem Cache oder Dateien), gezeichnet wird mit derselben
+Plot-Logik wie in der GUI (PlotFigure auf dem Agg-Backend, siehe BatchRender) in einem ProcessPoolExecutor.
+
+Fertige Bilder werden im Arbeitsspeicher gehalten (begrenzt nach Bytes, verdrängt wird das am längsten nicht
+abgerufene Bild) und mit einem ETag ausgeliefert; "If-None-Match" wird mit 304 beantwortet, ohne neu zu zeichnen.
+Gleiche Anfragen, die gleichzeitig eintreffen, teilen sich einen Rendervorgang.
+
+Endpunkte:
+    /chart?symbol=AAPL&x=date&y=close&type=Linie
+        Weitere Parameter: format (png, svg), width, height (Zoll), dpi, start, end (YYYY-MM-DD), title, color
+        ("auto" = grün bei steigendem, rot bei fallendem Verlauf). Für y sind auch Indikatoren wie SMA(close,20)
+        möglich; type ist "Linie", "Scatter", "Bar" oder "Kerzen" (x und y entfallen).
+    /metrics
+        Zähler und Zeiten als JSON.
+
+Beispiele:
+    python ChartServer.py --port 8080
+    python ChartServer.py --files Exports/AAPL.npz Exports/MSFT.parquet --workers 8
+    python ChartServer.py --check --clients 40
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+
+from ColumnStore import ColumnStore
+from DataManager import DataManager
+from EodCache import EodCache
+from MarketstackClient import MarketstackClient
+from Metrics import metrics
+
+CONTENT_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+DIAGRAM_TYPES = ("Linie", "Scatter", "Bar", "Kerzen")
+OHLC_KEYS = ("date", "open", "high", "low", "close", "volume")
+
+# Gezeichnete Canvases je Worker-Prozess und Bildgröße; die Figure wird wie in BatchRender wiederverwendet
+_canvases: Dict[Tuple[float, float, int], Any] = {}
+
+
+def _init_worker():
+    """
+    Initialisiert einen Render-Prozess: Matplotlib (Agg), die Plot-Logik und die Indikatoren werden beim Start des
+    Prozesses importiert statt bei der ersten Anfrage.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import BatchRender  # noqa: F401 (lädt PlotFigure und DashboardFigure)
+    import Indicators  # noqa: F401
+    import PlotFigure  # noqa: F401
+
+
+def _warm_up() -> int:
+    """
+    Zeichnet ein kleines Diagramm, damit Schriften, Ticker und der Canvas der Standardgröße vor der ersten Anfrage
+    bereitstehen.
+
+    :return: Prozess-ID des Workers.
+    """
+    dates = np.arange("2024-01-01", "2024-03-01", dtype="datetime64[D]").astype("datetime64[ns]")
+    options = {"symbol": "", "x": "date", "y": "close", "type": "Linie", "format": "png", "title": "",
+               "color": "auto", "width": 12.0, "height": 6.0, "dpi": 100}
+    render_chart({"x": dates, "y": np.linspace(1.0, 2.0, len(dates))}, options)
+    return os.getpid()
+
+
+def render_chart(arrays: Dict[str, np.ndarray], options: Dict[str, Any]) -> bytes:
+    """
+    Zeichnet ein Diagramm im Worker-Prozess und gibt das Bild zurück.
+
+    :param arrays: Plotdaten; "x" und "y" bzw. bei Kerzen die Spalten aus OHLC_KEYS.
+    :param options: Normalisierte Anfrageparameter (siehe ChartService.parse_query).
+    :return: Bilddaten im gewünschten Format.
+    """
+    from BatchRender import AggPlotCanvas, is_growing
+
+    size = (options["width"], options["height"], options["dpi"])
+    canvas = _canvases.get(size)
+    if canvas is None:
+        canvas = _canvases[size] = AggPlotCanvas(width=size[0], height=size[1], dpi=size[2])
+    symbol = options["symbol"]
+    if options["type"] == "Kerzen":
+        volume = arrays.get("volume")
+        canvas.plot_candles(arrays["date"], arrays["open"], arrays["high"], arrays["low"], arrays["close"],
+                            volume=volume if volume is not None and len(volume) else None,
+                            title=options["title"] or f"{symbol}  OHLC", x_label="Date", y_label="Price")
+    else:
+        x_label, y_label = options["x"].capitalize(), options["y"].capitalize()
+        color = options["color"]
+        if color == "auto":
+            color = "lime" if is_growing(arrays["y"]) else "crimson"
+        canvas.plot(arrays["x"], arrays["y"], title=options["title"] or f"{symbol}  {x_label} vs. {y_label}",
+                    x_label=x_label, y_label=y_label, diagram_typ=options["type"], color=color)
+    buffer = BytesIO()
+    canvas.save_figure(buffer, format=options["format"])
+    return buffer.getvalue()
+
+
+class ImageCache:
+    """
+    Hält gerenderte Bilder samt ETag im Arbeitsspeicher. Begrenzt wird wie beim DatasetCache nach Anzahl und Bytes;
+    verdrängt wird das am längsten nicht abgerufene Bild.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        :param max_entries: Maximale Anzahl gehaltener Bilder.
+        :param max_bytes: Maximaler Speicherbedarf aller Bilder in Bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def get(self, etag: str) -> Optional[bytes]:
+        """Gibt ein Bild zurück und markiert es als zuletzt verwendet; None, wenn es nicht (mehr) gehalten wird."""
+        with self._lock:
+            body = self._entries.get(etag)
+            if body is not None:
+                self._entries.move_to_end(etag)
+        metrics.increment("chart.cache_hits" if body is not None else "chart.cache_misses")
+        return body
+
+    def put(self, etag: str, body: bytes):
+        """Legt ein Bild ab und verdrängt bei Bedarf die am längsten nicht verwendeten Bilder."""
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop(etag, None)
+            if previous is not None:
+                self.nbytes -= len(previous)
+            self._entries[etag] = body
+            self.nbytes += len(body)
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+                _, removed = self._entries.popitem(last=False)
+                self.nbytes -= len(removed)
+                evicted += 1
+        if evicted:
+            metrics.increment("chart.evictions", evicted)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class ChartService:
+    """
+    Lädt Datensätze über den DataManager, schneidet die Plotdaten zu und verteilt das Zeichnen auf Worker-Prozesse.
+    Kann von beliebig vielen Threads gleichzeitig verwendet werden.
+    """
+
+    def __init__(self, data_manager: DataManager, access_key: Optional[str] = None,
+                 files: Optional[Dict[str, str]] = None, workers: int = None, ttl: float = 15 * 60,
+                 image_cache: Optional[ImageCache] = None):
+        """
+        :param data_manager: Quelle der Datensätze; geladene Symbole liegen in data_manager.datasets.
+        :param access_key: API-Zugriffsschlüssel für Symbole, die nicht als Datei angegeben sind.
+        :param files: Optionales Dict von Symbol zu Dateipfad; diese Symbole werden nicht über die API geladen.
+        :param workers: Anzahl Render-Prozesse; standardmäßig die Anzahl CPU-Kerne.
+        :param ttl: Sekunden, nach denen ein über die API geladenes Symbol neu geladen wird (mit Cache inkrementell).
+        :param image_cache: Cache der gerenderten Bilder.
+        """
+        self.data_manager = data_manager
+        self.access_key = access_key
+        self.files = dict(files or {})
+        self.ttl = ttl
+        self.images = image_cache if image_cache is not None else ImageCache()
+        workers = max(1, workers or os.cpu_count())
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        # Je Worker eine Aufwärm-Aufgabe, bevor der Server Anfragen annimmt; die Prozesse starten dabei alle
+        wait([self.executor.submit(_warm_up) for _ in range(workers)])
+        self._loaded: Dict[str, float] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._data_lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+
+    @staticmethod
+    def parse_query(query: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Prüft und normalisiert die Parameter einer /chart-Anfrage.
+
+        :param query: Parameter der URL (jeweils der letzte Wert).
+        :return: Dict mit allen Optionen, ergänzt um Standardwerte.
+        :raises ValueError: Bei fehlenden oder ungültigen Parametern.
+        """
+        symbol = query.get("symbol", "").strip().upper()
+        if not symbol:
+            raise ValueError("Der Parameter 'symbol' fehlt.")
+        options = {"symbol": symbol, "x": query.get("x", "date"), "y": query.get("y", "close"),
+                   "type": query.get("type", "Linie"), "format": query.get("format", "png").lower(),
+                   "start": query.get("start") or None, "end": query.get("end") or None,
+                   "title": query.get("title", ""), "color": query.get("color", "auto")}
+        if options["type"] not in DIAGRAM_TYPES:
+            raise ValueError(f"Unbekannter Diagrammtyp '{options['type']}', erlaubt: {', '.join(DIAGRAM_TYPES)}.")
+        if options["format"] not in CONTENT_TYPES:
+            raise ValueError(f"Unbekanntes Format '{options['format']}', erlaubt: {', '.join(CONTENT_TYPES)}.")
+        try:
+            options["width"] = min(max(float(query.get("width", 12)), 1.0), 40.0)
+            options["height"] = min(max(float(query.get("height", 6)), 1.0), 40.0)
+            options["dpi"] = min(max(int(query.get("dpi", 100)), 30), 300)
+        except ValueError:
+            raise ValueError("width, height und dpi müssen Zahlen sein.")
+        return options
+
+    def dataset(self, symbol: str) -> ColumnStore:
+        """
+        Gibt den Datensatz eines Symbols zurück und lädt ihn bei Bedarf. Gleichzeitige Anfragen für dasselbe Symbol
+        warten auf einen gemeinsamen Ladevorgang.
+
+        :param symbol: Börsensymbol.
+        :return: Nach Datum sortierter ColumnStore.
+        :raises LookupError: Wenn für das Symbol keine Daten vorliegen.
+        """
+        datasets = self.data_manager.datasets
+        with self._data_lock:
+            lock = self._load_locks.setdefault(symbol, threading.Lock())
+        with lock:
+            store = datasets.get(symbol)
+            expired = symbol not in self.files and time.monotonic() - self._loaded.get(symbol, 0.0) > self.ttl
+            if store is None or expired:
+                if symbol in self.files:
+                    store = DataManager.read_file(self.files[symbol])
+                elif self.access_key:
+                    store = self.data_manager.fetch_api(self.access_key, symbol)
+                else:
+                    raise LookupError(f"Für {symbol} ist weder eine Datei noch ein API-Schlüssel angegeben.")
+                if not len(store):
+                    raise LookupError(f"Für {symbol} liegen keine Daten vor.")
+                with self._data_lock:
+                    # Ein neu geladener Datensatz ersetzt den alten samt gemerkten Indikatoren
+                    datasets.discard(symbol)
+                    datasets.put(symbol, store)
+                self._loaded[symbol] = time.monotonic()
+        return store
+
+    def prepare(self, options: Dict[str, Any]) -> Tuple[str, Dict[str, np.ndarray]]:
+        """
+        Schneidet die Plotdaten einer Anfrage zu und bestimmt den ETag. Er hängt von den Optionen und vom Stand der
+        Daten ab, sodass sich ein Bild nach dem Neuladen eines Symbols ändert.
+
+        :param options: Normalisierte Optionen (siehe parse_query).
+        :return: Tupel (ETag, Plotdaten für render_chart).
+        :raises LookupError: Wenn für das Symbol keine Daten vorliegen.
+        :raises ValueError: Wenn eine Spalte fehlt oder nicht plottbar ist.
+        """
+        symbol = options["symbol"]
+        store = self.dataset(symbol)
+        keys = OHLC_KEYS if options["type"] == "Kerzen" else (options["x"], options["y"])
+        with self._data_lock:
+            if store is not self.data_manager.datasets.peek(symbol):
+                self.data_manager.datasets.put(symbol, store)
+            values = [self.data_manager.get_window(key, options["start"], options["end"], symbol) for key in keys]
+            version = (len(store), str(store.plottable("date")[-1:]))
+        arrays = dict(zip(("x", "y") if len(keys) == 2 else keys, values))
+        missing = [key for key, column in zip(keys, values) if not len(column) and key != "volume"]
+        if missing:
+            raise ValueError(f"{symbol}: Keine Daten für {', '.join(missing)} (Spalte fehlt oder Zeitraum leer).")
+        etag = hashlib.sha1(json.dumps([sorted(options.items()), version]).encode("utf-8")).hexdigest()
+        return f'"{etag}"', arrays
+
+    def render(self, etag: str, arrays: Dict[str, np.ndarray], options: Dict[str, Any]) -> bytes:
+        """
+        Gibt das Bild aus dem Cache zurück oder zeichnet es in einem Worker-Prozess. Trifft dieselbe Anfrage ein,
+        während sie noch gezeichnet wird, wird auf dasselbe Ergebnis gewartet.
+
+        :return: Bilddaten.
+        """
+        body = self.images.get(etag)
+        if body is not None:
+            return body
+        with self._pending_lock:
+            future = self._pending.get(etag)
+            owner = future is None
+            if owner:
+                future = self._pending[etag] = self.executor.submit(render_chart, arrays, options)
+            else:
+                metrics.increment("chart.coalesced")
+        try:
+            with metrics.timer("chart.render") if owner else nullcontext():
+                body = future.result()
+            if owner:
+                self.images.put(etag, body)
+            return body
+        finally:
+            if owner:
+                with self._pending_lock:
+                    self._pending.pop(etag, None)
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+class ChartHandler(BaseHTTPRequestHandler):
+    """Beantwortet GET-Anfragen an /chart und /metrics."""
+
+    service: ChartService = None
+    max_age = 60
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if url.path == "/metrics":
+            snapshot = metrics.snapshot()
+            snapshot["images"] = {"entries": len(self.service.images), "bytes": self.service.images.nbytes}
+            return self.send_json(200, snapshot)
+        if url.path != "/chart":
+            return self.send_json(404, {"error": "Unbekannter Pfad, erwartet /chart oder /metrics."})
+
+        metrics.increment("chart.requests")
+        with metrics.timer("chart.request"):
+            try:
+                options = ChartService.parse_query(query)
+                etag, arrays = self.service.prepare(options)
+                if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+                    metrics.increment("chart.not_modified")
+                    return self.send_body(304, b"", options["format"], etag)
+                body = self.service.render(etag, arrays, options)
+            except LookupError as e:
+                return self.send_json(404, {"error": str(e)})
+            except ValueError as e:
+                return self.send_json(400, {"error": str(e)})
+            except Exception as e:
+                metrics.increment("chart.errors")
+                return self.send_json(500, {"error": f"Fehler beim Zeichnen: {e}"})
+            self.send_body(200, body, options["format"], etag)
+
+    def send_body(self, status: int, body: bytes, fmt: str, etag: str):
+        self.send_response(status)
+        self.send_header("Content-Type", CONTENT_TYPES[fmt])
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", f"public, max-age={self.max_age}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keine Zeile pro Anfrage auf stderr
+        pass
+
+
+def start_server(service: ChartService, host: str = "127.0.0.1", port: int = 0,
+                 max_age: int = 60) -> ThreadingHTTPServer:
+    """
+    Startet den Server in einem Hintergrund-Thread.
+
+    :param service: Datenquelle und Render-Pool.
+    :param host: Adresse, an die der Server gebunden wird.
+    :param port: Port; 0 wählt einen freien Port.
+    :param max_age: Sekunden, die Clients ein Bild ohne Nachfrage verwenden dürfen (Cache-Control).
+    :return: Laufender Server (Adresse in server.server_address, beenden mit shutdown()).
+    """
+    handler = type("Handler", (ChartHandler,), {"service": service, "max_age": max_age})
+    # Die Standard-Warteschlange von 5 Verbindungen ließe gleichzeitige Clients auf Wiederholungen warten
+    server = type("Server", (ThreadingHTTPServer,), {"request_queue_size": 128})((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_check(args: argparse.Namespace) -> int:
+    """
+    Startet Mock-API und Chart-Server im Hintergrund und lässt clients Threads gleichzeitig Diagramme abrufen:
+    zuerst ungecacht, dann erneut (aus dem Bild-Cache) und zuletzt mit If-None-Match.
+
+    :return: 0 bei Erfolg, sonst 1.
+    """
+    from MockServer import MockState, start_server as start_mock
+
+    mock = start_mock(MockState(days=args.days, rate=0))
+    client = MarketstackClient(f"http://127.0.0.1:{mock.server_address[1]}")
+    service = ChartService(DataManager(client), access_key="mock-key", workers=args.workers)
+    server = start_server(service)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/chart"
+    charts = [f"symbol={symbol}&y={y}&type={typ}&format={fmt}"
+              for symbol in ("AAPL", "MSFT", "AMZN", "GOOGL")
+              for y, typ, fmt in (("close", "Linie", "png"), ("volume", "Bar", "png"),
+                                  ("SMA(close,20)", "Linie", "svg"), ("close", "Kerzen", "png"))]
+    metrics.reset()
+
+    def fetch(index: int, etag: Optional[str] = None) -> Tuple[int, float, Optional[str], bytes]:
+        request = urllib.request.Request(f"{base_url}?{charts[index % len(charts)]}",
+                                         headers={"If-None-Match": etag} if etag else {})
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                return response.status, time.perf_counter() - start, response.headers["ETag"], response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, time.perf_counter() - start, e.headers.get("ETag"), e.read()
+
+    failed = False
+    etags: Dict[int, str] = {}
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        for label, conditional in (("Erster Abruf", False), ("Aus dem Cache", False), ("If-None-Match", True)):
+            start = time.perf_counter()
+            results = list(pool.map(lambda index: fetch(index, etags.get(index % len(charts)) if conditional
+                                                        else None), range(args.clients)))
+            elapsed = time.perf_counter() - start
+            latencies = np.array([latency for _, latency, _, _ in results]) * 1000
+            statuses = sorted({status for status, _, _, _ in results})
+            print(f"{label:<14} {len(results)} Anfragen in {elapsed:.2f} s, Status {statuses}, Latenz Median "
+                  f"{np.median(latencies):.0f} ms, p95 {np.percentile(latencies, 95):.0f} ms")
+            expected = 304 if conditional else 200
+            if statuses != [expected]:
+                print(f"Erwartet wurde Status {expected}: "
+                      f"{[body[:200] for status, _, _, body in results if status != expected][:3]}", file=sys.stderr)
+                failed = True
+            for index, (status, _, etag, body) in enumerate(results):
+                if status == 200 and not (body.startswith(b"\x89PNG") or b"<svg" in body[:1000]):
+                    print(f"Anfrage {index} lieferte kein Bild.", file=sys.stderr)
+                    failed = True
+                etags.setdefault(index % len(charts), etag)
+
+    counters = metrics.snapshot()["counters"]
+    server.shutdown()
+    mock.shutdown()
+    service.close()
+    client.close()
+    print(f"Server: {counters}")
+    rendered = counters.get("chart.cache_misses", 0) - counters.get("chart.coalesced", 0)
+    if rendered > len(charts):
+        print(f"{rendered} Bilder wurden gezeichnet, erwartet höchstens {len(charts)}.", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+def parse_files(paths: List[str]) -> Dict[str, str]:
+    """Ordnet Dateien ihrem Symbol zu (Dateiname ohne Endung und ohne "_data", z. B. AAPL_data.npz -> AAPL)."""
+    files = {}
+    for path in paths or []:
+        name = os.path.splitext(os.path.basename(path))[0]
+        files[name.upper().removesuffix("_DATA")] = path
+    return files
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Liefert Diagramme als PNG oder SVG über HTTP aus.")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse des Servers (Standard: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8080, help="Port des Servers (Standard: 8080).")
+    parser.add_argument("--files", nargs="+", help="JSON-, CSV-, NPZ-, Feather- oder Parquet-Dateien; das Symbol "
+                                                   "ergibt sich aus dem Dateinamen.")
+    parser.add_argument("--base-url", default=MarketstackClient.DEFAULT_BASE_URL,
+                        help="Basis-URL der API (z. B. ein lokaler MockServer).")
+    parser.add_argument("--no-cache", action="store_true", help="API-Daten nicht aus dem lokalen Cache laden.")
+    parser.add_argument("--ttl", type=float, default=15 * 60,
+                        help="Sekunden, nach denen ein Symbol erneut über die API geladen wird.")
+    parser.add_argument("--datasets", type=int, default=64, help="Anzahl der im Arbeitsspeicher gehaltenen Symbole.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Anzahl Render-Prozesse.")
+    parser.add_argument("--cache-mb", type=float, default=64, help="Größe des Bild-Caches in MB.")
+    parser.add_argument("--max-age", type=int, default=60, help="Cache-Control max-age der Bilder in Sekunden.")
+    parser.add_argument("--check", action="store_true",
+                        help="Gegen den MockServer viele gleichzeitige Abrufe ausführen und das Ergebnis prüfen.")
+    parser.add_argument("--clients", type=int, default=40, help="Gleichzeitige Clients für --check.")
+    parser.add_argument("--days", type=int, default=2500, help="Handelstage pro Symbol für --check.")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    if args.check:
+        return run_check(args)
+    data_manager = DataManager(MarketstackClient(args.base_url), cache=None if args.no_cache else EodCache(),
+                               max_datasets=args.datasets)
+    service = ChartService(data_manager, access_key=os.getenv("API_KEY"), files=parse_files(args.files),
+                           workers=args.workers, ttl=args.ttl,
+                           image_cache=ImageCache(max_bytes=int(args.cache_mb * 2 ** 20)))
+    server = start_server(service, args.host, args.port, args.max_age)
+    print(f"Chart-Server läuft auf http://{args.host}:{server.server_address[1]}/chart?symbol=AAPL "
+          f"(Beenden mit Strg+C)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,578 @@
+import datetime
+import re
+import sys
+from typing import Dict, List, Any, Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from Metrics import metrics
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Erkennt ISO-Datumswerte wie "2024-01-05" oder "2024-01-05T00:00:00+0000"
+_ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def _to_python_list(values: np.ndarray) -> List[Any]:
+    """
+    Wandelt eine typisierte Spalte in eine Liste von Python-Werten im Format der Marketstack-API um: Datumswerte als
+    ISO-Strings ("2024-01-02T00:00:00+0000"), fehlende Werte (NaN, NaT) als None.
+    """
+    if np.issubdtype(values.dtype, np.datetime64):
+        strings = np.datetime_as_string(values.astype("datetime64[s]"), unit="s").tolist()
+        return [None if value == "NaT" else value + "+0000" for value in strings]
+    if values.dtype.kind == "f":
+        missing = np.isnan(values)
+        if missing.any():
+            result = values.astype(object)
+            result[missing] = None
+            return result.tolist()
+    return values.tolist()
+
+
+def _to_typed_array(values: Any) -> np.ndarray:
+    """
+    Wandelt eine Folge von Werten in ein typisiertes NumPy-Array um.
+
+    Zahlen werden zu int64 (ganzzahlig ohne Lücken) bzw. float64, ISO-Datumswerte zu datetime64[ns] (UTC, ohne
+    Zeitzone) und alle übrigen Werte zu einem Objekt-Array mit Strings. Gleiche Strings (z. B. Symbol und Börse, die
+    in jeder Zeile wiederkehren) werden dabei interniert und teilen sich ein Objekt.
+
+    :param values: Liste, Pandas-Series oder NumPy-Array mit den Rohwerten.
+    :return: Typisiertes NumPy-Array.
+    """
+    array = np.asarray(values)
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype("datetime64[ns]", copy=False)
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64, copy=False)
+    if array.dtype.kind in "fb":
+        return array.astype(np.float64, copy=False)
+
+    # Pandas wird erst für Rohwerte (Strings, gemischte Typen) benötigt und deshalb erst hier importiert
+    import pandas as pd
+    series = pd.Series(array, dtype=object)
+    not_null = series.notna()
+    count = int(not_null.sum())
+    if count == 0:
+        return np.full(len(series), np.nan, dtype=np.float64)
+
+    numeric = pd.to_numeric(series, errors="coerce")
+    if int(numeric.notna().sum()) == count:
+        if numeric.dtype.kind in "iu":
+            return numeric.to_numpy(dtype=np.int64)
+        return numeric.to_numpy(dtype=np.float64)
+
+    first = series[not_null].iloc[0]
+    if isinstance(first, str) and _ISO_DATE_PATTERN.match(first):
+        dates = pd.to_datetime(series, utc=True, errors="coerce", format="ISO8601")
+        if int(dates.notna().sum()) == count:
+            return dates.dt.tz_convert(None).to_numpy(dtype="datetime64[ns]")
+
+    # Ein Objekt pro unterschiedlichem Wert statt eines pro Zeile; der Code -1 (fehlend) wählt das angehängte None
+    codes, uniques = pd.factorize(series)
+    uniques = np.array([sys.intern(value) if isinstance(value, str) else value for value in uniques] + [None],
+                       dtype=object)
+    return uniques[codes]
+
+
+def _to_plottable(values: np.ndarray) -> np.ndarray:
+    """
+    Wandelt eine Spalte in einem vektorisierten Durchlauf in eine plottbare Form um.
+
+    :param values: Typisierte Spalte.
+    :return: datetime64[ns]- oder float64-Array.
+    :raises ValueError: Wenn die Werte weder Zahlen noch Datumswerte sind.
+    """
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values
+    if values.dtype.kind in "iufb":
+        return values.astype(np.float64, copy=False)
+
+    import pandas as pd
+    series = pd.Series(values, dtype=object)
+    count = int(series.notna().sum())
+    numeric = pd.to_numeric(series, errors="coerce")
+    if int(numeric.notna().sum()) == count:
+        return numeric.to_numpy(dtype=np.float64)
+    dates = pd.to_datetime(series, errors="coerce", utc=True, format="mixed")
+    if int(dates.notna().sum()) == count:
+        return dates.dt.tz_convert(None).to_numpy(dtype="datetime64[ns]")
+    raise ValueError("Die Werte sind weder Zahlen noch Datumswerte.")
+
+
+def _concat_columns(parts: List[np.ndarray]) -> np.ndarray:
+    """
+    Hängt typisierte Spalten aneinander. Weichen die Datentypen einzelner Teile ab (z. B. int64 und float64 oder
+    eine in einem Teil komplett leere Datumsspalte), wird auf einen gemeinsamen Typ erweitert.
+
+    :param parts: Teilspalten in der gewünschten Reihenfolge.
+    :return: Zusammengefügtes Array.
+    """
+    kinds = {part.dtype.kind for part in parts}
+    if len(kinds) == 1 or kinds <= set("iuf"):
+        return np.concatenate(parts)
+    if kinds == {"M", "f"} and all(np.isnan(part).all() for part in parts if part.dtype.kind == "f"):
+        # Teile ohne Werte wurden als float64 (NaN) eingelesen und werden zu NaT
+        return np.concatenate([part if part.dtype.kind == "M" else np.full(len(part), np.datetime64("NaT", "ns"))
+                               for part in parts])
+    return np.concatenate([_to_object_array(part) for part in parts])
+
+
+def _to_object_array(values: np.ndarray) -> np.ndarray:
+    """Wandelt eine typisierte Spalte in ein Objekt-Array um; fehlende Werte werden zu None."""
+    import pandas as pd
+    series = pd.Series(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        series = series.dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+    return series.astype(object).where(series.notna(), None).to_numpy(dtype=object)
+
+
+def grow_buffer(buffer: Optional[np.ndarray], values: np.ndarray, new_values: np.ndarray) -> np.ndarray:
+    """
+    Hängt new_values an values an und nutzt dafür die Reservekapazität eines eigenen Puffers. Reicht sie nicht aus,
+    wird ein neuer Puffer mit doppelter Größe angelegt; das Anhängen kostet dadurch amortisiert nur Aufwand
+    proportional zur Anzahl der neuen Werte.
+
+    :param buffer: Bisheriger Puffer, dessen Anfang values ist, oder None. Ist values keine Sicht auf den
+        Pufferanfang, wird ein neuer Puffer angelegt.
+    :param values: Bisherige Werte.
+    :param new_values: Anzuhängende Werte mit dem Datentyp von values.
+    :return: Puffer, dessen erste len(values) + len(new_values) Einträge die Daten enthalten.
+    """
+    length, end = len(values), len(values) + len(new_values)
+    if (buffer is None or len(buffer) < end or buffer.dtype != values.dtype or values.base is not buffer
+            or values.__array_interface__["data"][0] != buffer.__array_interface__["data"][0]):
+        grown = np.empty(max(end, 2 * length, 1024), dtype=values.dtype)
+        grown[:length] = values
+        buffer = grown
+    buffer[length:end] = new_values
+    return buffer
+
+
+def _cast_appended(values: np.ndarray, new_values: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Wandelt anzuhängende Werte in den Datentyp einer vorhandenen Spalte um.
+
+    :return: Umgewandelte Werte oder None, wenn die Spalte dafür auf einen anderen Typ erweitert werden muss.
+    """
+    if new_values.dtype == values.dtype:
+        return new_values
+    if values.dtype.kind == "f" and new_values.dtype.kind in "iufb":
+        return new_values.astype(np.float64)
+    if values.dtype == object:
+        return _to_object_array(new_values)
+    if values.dtype.kind == "M" and new_values.dtype.kind == "f" and np.isnan(new_values).all():
+        return np.full(len(new_values), np.datetime64("NaT", "ns"))
+    return None
+
+
+def _sort_order(values: np.ndarray) -> np.ndarray:
+    """
+    Stabile Sortierreihenfolge einer Spalte. In String-Spalten stehen fehlende Werte (None) am Ende; Spalten mit
+    gemischten Typen werden nach ihrer Textdarstellung sortiert.
+
+    :param values: Typisierte Spalte.
+    :return: Indizes in sortierter Reihenfolge.
+    """
+    if values.dtype != object:
+        return np.argsort(values, kind="stable")
+    import pandas as pd
+    missing = pd.isna(values)
+    present = np.flatnonzero(~missing)
+    try:
+        order = np.argsort(values[present], kind="stable")
+    except TypeError:
+        order = np.argsort(values[present].astype(str), kind="stable")
+    return np.concatenate((present[order], np.flatnonzero(missing)))
+
+
+def _to_scalar(value: Any, dtype: np.dtype) -> Any:
+    """Wandelt eine Bereichsgrenze (String, date, datetime, Timestamp oder Zahl) in den Datentyp einer Spalte um."""
+    if np.issubdtype(dtype, np.datetime64):
+        import pandas as pd
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert(None)
+        return timestamp.to_datetime64().astype("datetime64[ns]")
+    return float(value)
+
+
+def _is_day(value: Any) -> bool:
+    """Prüft, ob eine Bereichsgrenze einen ganzen Tag ohne Uhrzeit bezeichnet."""
+    if isinstance(value, str):
+        return len(value.strip()) == 10
+    return isinstance(value, datetime.date) and not isinstance(value, datetime.datetime)
+
+
+class ColumnStore:
+    """Spaltenorientierter Datenspeicher: Jedes Feld wird als typisiertes NumPy-Array abgelegt."""
+
+    def __init__(self, columns: Optional[Dict[str, np.ndarray]] = None):
+        self._columns: Dict[str, np.ndarray] = {}
+        # Zwischenspeicher für bereits in plottbare Form umgewandelte Spalten
+        self._plottable: Dict[str, np.ndarray] = {}
+        # Gemerkte Sortierprüfungen für binäre Suchen (index_range)
+        self._sorted: Dict[str, bool] = {}
+        # Eigene Puffer mit Reservekapazität für angehängte Zeilen (append); die Spalten sind Sichten darauf
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._plottable_buffers: Dict[str, np.ndarray] = {}
+        self._length = 0
+        for key, values in (columns or {}).items():
+            self._set_column(key, _to_typed_array(values))
+
+    @classmethod
+    @metrics.timed("columns.extract")
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "ColumnStore":
+        """
+        Erstellt einen Speicher aus einer Liste von Datensätzen (z. B. der API-Antwort).
+
+        :param records: Liste von Dicts, ein Dict pro Zeile.
+        :return: Neuer ColumnStore.
+        """
+        records = list(records)
+        keys = dict.fromkeys(key for record in records for key in record)
+        return cls({key: [record.get(key) for record in records] for key in keys})
+
+    @classmethod
+    @metrics.timed("columns.extract")
+    def from_frame(cls, frame: "pd.DataFrame") -> "ColumnStore":
+        """
+        Erstellt einen Speicher aus einem Pandas-DataFrame.
+
+        :param frame: DataFrame, dessen Spalten übernommen werden.
+        :return: Neuer ColumnStore.
+        """
+        return cls({str(key): frame[key].to_numpy() for key in frame.columns})
+
+    @classmethod
+    def from_typed(cls, columns: Dict[str, np.ndarray]) -> "ColumnStore":
+        """
+        Erstellt einen Speicher aus bereits typisierten Spalten (z. B. aus einer Binärdatei), ohne die Typerkennung
+        erneut auszuführen. Arrays mit passendem Datentyp werden ohne Kopie übernommen.
+
+        :param columns: Dict von Spaltenname zu int64-, float64-, datetime64[ns]- oder Objekt-Array.
+        :return: Neuer ColumnStore.
+        """
+        store = cls()
+        for key, values in columns.items():
+            values = np.asarray(values)
+            if values.dtype.kind in "iu":
+                values = values.astype(np.int64, copy=False)
+            elif values.dtype.kind in "fb":
+                values = values.astype(np.float64, copy=False)
+            elif values.dtype.kind == "M":
+                values = values.astype("datetime64[ns]", copy=False)
+            else:
+                values = values.astype(object, copy=False)
+            store._set_column(key, values)
+        return store
+
+    @classmethod
+    def concat(cls, stores: Iterable["ColumnStore"]) -> "ColumnStore":
+        """
+        Hängt mehrere Speicher zeilenweise aneinander (z. B. die Teilstücke eines gestreamten Imports).
+
+        Spalten, die in einem Teilstück fehlen, werden dort mit NaN aufgefüllt; abweichende Datentypen werden auf
+        einen gemeinsamen Typ erweitert.
+
+        :param stores: Teilspeicher in der gewünschten Reihenfolge.
+        :return: Neuer ColumnStore.
+        """
+        stores = [store for store in stores if len(store)]
+        if len(stores) == 1:
+            return stores[0]
+        keys = dict.fromkeys(key for store in stores for key in store.keys())
+        store = cls()
+        for key in keys:
+            parts = [part._columns[key] if key in part else np.full(len(part), np.nan) for part in stores]
+            store._set_column(key, _concat_columns(parts))
+        return store
+
+    def append(self, other: "ColumnStore") -> "ColumnStore":
+        """
+        Hängt die Zeilen eines anderen Speichers an Ort und Stelle an (z. B. neue Kurse im Live-Modus).
+
+        Die Spalten wachsen in eigenen Puffern mit Reservekapazität, bereits umgewandelte plottbare Spalten und
+        gemerkte Sortierprüfungen werden nur für die neuen Zeilen fortgeschrieben. Der Aufwand hängt daher
+        (amortisiert) nur von der Anzahl der neuen Zeilen ab, nicht von der Länge der Historie. Zuvor
+        herausgegebene Sichten behalten ihren bisherigen Inhalt.
+
+        Spalten, die in einem der beiden Speicher fehlen, werden mit NaN aufgefüllt; abweichende Datentypen werden
+        wie bei concat erweitert (dann einmalig mit Kopie der Spalte).
+
+        :param other: Anzuhängende Zeilen.
+        :return: Dieser Speicher.
+        """
+        n_new = len(other)
+        if not n_new:
+            return self
+        if not self._columns:
+            for key in other.keys():
+                self._set_column(key, other._columns[key])
+            return self
+
+        length, end = self._length, self._length + n_new
+        for key in dict.fromkeys(self.keys() + other.keys()):
+            values = self._columns.get(key)
+            if values is None:
+                values = np.full(length, np.nan)
+            new_values = other._columns[key] if key in other else np.full(n_new, np.nan)
+            cast = _cast_appended(values, new_values)
+            if cast is None:
+                self._columns[key] = _concat_columns([values, new_values])
+                self._buffers.pop(key, None)
+            else:
+                self._buffers[key] = grow_buffer(self._buffers.get(key), values, cast)
+                self._columns[key] = self._buffers[key][:end]
+            self._append_plottable(key, values, self._columns[key][length:])
+
+            if self._sorted.get(key):
+                appended = self._plottable[key][length - 1:] if key in self._plottable else None
+                self._sorted[key] = appended is not None and bool(np.all(appended[1:] >= appended[:-1]))
+            else:
+                self._sorted.pop(key, None)
+        self._length = end
+        return self
+
+    def _append_plottable(self, key: str, values: np.ndarray, new_values: np.ndarray):
+        """Schreibt eine bereits umgewandelte plottbare Spalte für angehängte Zeilen fort."""
+        cached = self._plottable.get(key)
+        if cached is None:
+            return
+        if cached.dtype == values.dtype and self._columns[key].dtype == values.dtype:
+            # Zahlen- und Datumsspalten sind bereits plottbar; die Sicht zeigt direkt auf die Spalte
+            plottable = self._columns[key].view()
+        else:
+            try:
+                new_plottable = _to_plottable(new_values)
+            except ValueError:
+                self._plottable.pop(key)
+                return
+            if new_plottable.dtype != cached.dtype:
+                self._plottable.pop(key)
+                return
+            buffer = grow_buffer(self._plottable_buffers.get(key), cached, new_plottable)
+            self._plottable_buffers[key] = buffer
+            plottable = buffer[:len(cached) + len(new_plottable)]
+        plottable.flags.writeable = False
+        self._plottable[key] = plottable
+
+    def view(self, rows: slice) -> "ColumnStore":
+        """
+        Gibt einen Speicher mit einem Zeilenbereich zurück, dessen Spalten Sichten ohne Kopie sind (z. B. mit dem
+        Ergebnis von index_range).
+
+        :param rows: Zeilenbereich.
+        :return: Neuer ColumnStore.
+        """
+        store = ColumnStore()
+        for key, values in self._columns.items():
+            store._set_column(key, values[rows])
+        for key, values in self._plottable.items():
+            store._plottable[key] = values[rows]
+        return store
+
+    def _set_column(self, key: str, values: np.ndarray):
+        if self._columns and len(values) != self._length:
+            raise ValueError(f"Spalte '{key}' hat {len(values)} statt {self._length} Einträge.")
+        self._columns[key] = values
+        self._length = len(values)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._columns
+
+    def keys(self) -> List[str]:
+        """
+        Gibt die Spaltennamen in ihrer ursprünglichen Reihenfolge zurück.
+
+        :return: Liste von Strings (Keys)
+        """
+        return list(self._columns.keys())
+
+    @property
+    def schema(self) -> Dict[str, np.dtype]:
+        """Zuordnung von Spaltenname zu NumPy-Datentyp."""
+        return {key: values.dtype for key, values in self._columns.items()}
+
+    @property
+    def nbytes(self) -> int:
+        """Speicherbedarf aller Spalten in Bytes (ohne die Objekte in String-Spalten)."""
+        return sum(values.nbytes for values in self._columns.values())
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Tatsächlich belegter Speicher in Bytes: Spalten einschließlich der Reservekapazität angehängter Zeilen sowie
+        umgewandelte Spalten, soweit sie nicht nur Sichten auf die Spalten sind (ohne die Objekte in String-Spalten).
+        """
+        total = 0
+        for key, values in self._columns.items():
+            buffer = self._buffers.get(key)
+            total += buffer.nbytes if buffer is not None and values.base is buffer else values.nbytes
+        for key, values in self._plottable.items():
+            if key in self._columns and np.may_share_memory(values, self._columns[key]):
+                continue
+            buffer = self._plottable_buffers.get(key)
+            total += buffer.nbytes if buffer is not None and values.base is buffer else values.nbytes
+        return total
+
+    @property
+    def bytes_per_row(self) -> float:
+        """
+        Speicherbedarf pro Zeile in Bytes: memory_usage zuzüglich der String-Objekte, wobei gemeinsam genutzte
+        (internierte) Strings nur einmal zählen.
+        """
+        if not self._length:
+            return 0.0
+        total = self.memory_usage
+        for values in self._columns.values():
+            if values.dtype == object:
+                distinct = {id(value): value for value in values if value is not None}
+                total += sum(sys.getsizeof(value) for value in distinct.values())
+        return total / self._length
+
+    def column(self, key: str) -> np.ndarray:
+        """
+        Gibt die Spalte als schreibgeschützte Sicht (ohne Kopie) zurück.
+
+        :param key: Spaltenname.
+        :return: NumPy-Array; leer, wenn die Spalte nicht existiert.
+        """
+        values = self._columns.get(key)
+        if values is None:
+            return np.empty(0, dtype=np.float64)
+        view = values.view()
+        view.flags.writeable = False
+        return view
+
+    def plottable(self, key: str) -> np.ndarray:
+        """
+        Gibt die Spalte als datetime64[ns]- oder float64-Array zurück. Die Umwandlung erfolgt vektorisiert und nur
+        beim ersten Zugriff; danach wird das Ergebnis aus dem Zwischenspeicher geliefert.
+
+        :param key: Spaltenname.
+        :return: Schreibgeschütztes Array; leer, wenn die Spalte nicht existiert.
+        :raises ValueError: Wenn die Spalte nicht plottbar ist.
+        """
+        values = self._plottable.get(key)
+        if values is None:
+            if key not in self._columns:
+                return np.empty(0, dtype=np.float64)
+            with metrics.timer("columns.convert"):
+                values = _to_plottable(self._columns[key]).view()
+            values.flags.writeable = False
+            self._plottable[key] = values
+        return values
+
+    def index_range(self, start: Any = None, end: Any = None, key: str = "date") -> slice:
+        """
+        Bestimmt per binärer Suche den Zeilenbereich, in dem die Werte einer sortierten Spalte zwischen start und
+        end (jeweils inklusive) liegen. Mit dem Ergebnis lassen sich alle Spalten ohne Kopie zuschneiden.
+
+        :param start: Untere Grenze (z. B. "2024-01-01", date oder Timestamp); None für keinen Anfang.
+        :param end: Obere Grenze; None für kein Ende. Ein Tag ohne Uhrzeit (date oder "YYYY-MM-DD") schließt bei
+            Datumsspalten den ganzen Tag ein.
+        :param key: Sortierte Spalte, standardmäßig "date".
+        :return: slice über die passenden Zeilen; alle Zeilen, wenn keine Grenze gesetzt ist oder die Spalte fehlt.
+        :raises ValueError: Wenn die Spalte nicht aufsteigend sortiert ist.
+        """
+        if (start is None and end is None) or key not in self._columns:
+            return slice(0, self._length)
+        values = self.plottable(key)
+        if key not in self._sorted:
+            self._sorted[key] = len(values) < 2 or bool(np.all(values[1:] >= values[:-1]))
+        if not self._sorted[key]:
+            raise ValueError(f"Die Spalte '{key}' ist nicht aufsteigend sortiert.")
+
+        low = 0 if start is None else int(np.searchsorted(values, _to_scalar(start, values.dtype), side="left"))
+        if end is None:
+            high = self._length
+        elif np.issubdtype(values.dtype, np.datetime64) and _is_day(end):
+            high = int(np.searchsorted(values, _to_scalar(end, values.dtype) + np.timedelta64(1, "D"), side="left"))
+        else:
+            high = int(np.searchsorted(values, _to_scalar(end, values.dtype), side="right"))
+        return slice(low, max(low, high))
+
+    def sorted_by(self, key: str) -> "ColumnStore":
+        """
+        Gibt einen nach einer Spalte aufsteigend sortierten Speicher zurück (stabile Sortierung). Fehlende Werte in
+        String-Spalten stehen am Ende.
+
+        :param key: Spaltenname, nach dem sortiert wird.
+        :return: Sortierter ColumnStore; unverändert, wenn die Spalte fehlt oder bereits sortiert ist.
+        """
+        values = self._columns.get(key)
+        if values is None or len(values) < 2:
+            return self
+        # Schnelle Prüfung ohne argsort; Objektspalten können None enthalten und sind nicht direkt vergleichbar
+        if values.dtype != object and bool(np.all(values[1:] >= values[:-1])):
+            return self
+        order = _sort_order(values)
+        if np.all(order[1:] > order[:-1]):
+            return self
+        store = ColumnStore()
+        for name, column in self._columns.items():
+            store._set_column(name, column[order])
+        return store
+
+    def split_by(self, key: str) -> Dict[Any, "ColumnStore"]:
+        """
+        Teilt den Speicher anhand der Werte einer Spalte auf (z. B. ein Speicher pro Symbol).
+
+        Die Zeilen werden einmalig stabil nach der Spalte sortiert; jede Gruppe ist danach ein zusammenhängender
+        Abschnitt, auf den die Teilspeicher ohne weitere Kopie verweisen. Die Reihenfolge innerhalb einer Gruppe
+        bleibt erhalten.
+
+        :param key: Spaltenname, nach dessen Werten aufgeteilt wird.
+        :return: Dict von Spaltenwert zu ColumnStore; leer, wenn die Spalte fehlt. Zeilen ohne Wert in einer
+            String-Spalte bilden die Gruppe None.
+        """
+        values = self._columns.get(key)
+        if values is None or not self._length:
+            return {}
+        order = _sort_order(values)
+        columns = {name: column[order] for name, column in self._columns.items()}
+        if values.dtype == object:
+            # Gruppengrenzen dort, wo sich der Wert ändert; None ist mit None gleich
+            grouped = columns[key]
+            starts = np.flatnonzero(np.append(True, grouped[1:] != grouped[:-1]))
+            group_values = grouped[starts]
+        else:
+            group_values, starts = np.unique(columns[key], return_index=True)
+        ends = np.append(starts[1:], self._length)
+
+        groups = {}
+        for value, start, end in zip(group_values, starts, ends):
+            store = ColumnStore()
+            for name, column in columns.items():
+                store._set_column(name, column[start:end])
+            groups[value] = store
+        return groups
+
+    def to_frame(self) -> "pd.DataFrame":
+        """
+        Wandelt den Speicher in einen Pandas-DataFrame um.
+
+        :return: DataFrame mit einer Spalte pro Feld.
+        """
+        import pandas as pd
+        return pd.DataFrame(self._columns, copy=False)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Wandelt den Speicher zurück in eine Liste von Dicts im Format der Marketstack-API.
+
+        Datumswerte werden als ISO-Strings, fehlende Werte als None ausgegeben. Jede Spalte wird einmal als Ganzes in
+        Python-Werte umgewandelt (statt über einen DataFrame mit Objektspalten), die Datensätze entstehen danach
+        zeilenweise per zip.
+
+        :return: Liste von Datensätzen.
+        """
+        keys = list(self._columns)
+        columns = [_to_python_list(self._columns[key]) for key in keys]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
@@ -0,0 +1,245 @@
+import os
+import struct
+import zipfile
+from typing import Dict, Tuple
+
+import numpy as np
+
+from ColumnStore import ColumnStore
+
+# Unterstützte Binärformate, zugeordnet nach Dateiendung
+BINARY_SUFFIXES = (".npz", ".feather", ".arrow", ".parquet")
+
+# Kopf eines lokalen Eintrags im ZIP-Archiv (Signatur bis einschließlich Länge des Extra-Felds)
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+
+def is_binary_file(file_path: str) -> bool:
+    """
+    Prüft anhand der Dateiendung, ob es sich um ein unterstütztes Binärformat handelt.
+
+    :param file_path: Pfad zur Datei.
+    :return: True bei .npz, .feather, .arrow oder .parquet.
+    """
+    return file_path.lower().endswith(BINARY_SUFFIXES)
+
+
+def write_file(store: ColumnStore, file_path: str):
+    """
+    Speichert einen ColumnStore im Binärformat, das zur Dateiendung passt.
+
+    :param store: Zu speichernder Spaltenspeicher.
+    :param file_path: Zielpfad mit Endung .npz, .feather, .arrow oder .parquet.
+    :raises ValueError: Bei unbekannter Dateiendung.
+    """
+    suffix = os.path.splitext(file_path)[1].lower()
+    if suffix == ".npz":
+        write_npz(store, file_path)
+    elif suffix in (".feather", ".arrow"):
+        write_feather(store, file_path)
+    elif suffix == ".parquet":
+        write_parquet(store, file_path)
+    else:
+        raise ValueError(f"Unbekanntes Binärformat: {suffix}")
+
+
+def read_file(file_path: str) -> ColumnStore:
+    """
+    Lädt einen ColumnStore aus einer Binärdatei. Zahlen- und Datumsspalten werden, wo das Format es erlaubt, per
+    Memory-Mapping ohne Kopie eingebunden.
+
+    :param file_path: Pfad mit Endung .npz, .feather, .arrow oder .parquet.
+    :return: Geladener ColumnStore.
+    :raises ValueError: Bei unbekannter Dateiendung.
+    """
+    suffix = os.path.splitext(file_path)[1].lower()
+    if suffix == ".npz":
+        return read_npz(file_path)
+    if suffix in (".feather", ".arrow"):
+        return read_feather(file_path)
+    if suffix == ".parquet":
+        return read_parquet(file_path)
+    raise ValueError(f"Unbekanntes Binärformat: {suffix}")
+
+
+def _encode_strings(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Zerlegt eine String-Spalte in Codes (int32, -1 für fehlende Werte) und die eindeutigen Werte."""
+    import pandas as pd
+    codes, categories = pd.factorize(values)
+    return codes.astype(np.int32), np.asarray([str(value) for value in categories], dtype=str)
+
+
+def _decode_strings(codes: np.ndarray, categories: np.ndarray) -> np.ndarray:
+    """Setzt eine String-Spalte aus Codes und eindeutigen Werten zusammen; Code -1 wird zu None."""
+    lookup = np.append(np.asarray(categories, dtype=object), None)
+    # Gleiche Werte verweisen auf dasselbe String-Objekt
+    return lookup[np.where(codes < 0, len(lookup) - 1, codes)]
+
+
+def write_npz(store: ColumnStore, file_path: str):
+    """
+    Speichert einen ColumnStore als unkomprimiertes NumPy-Archiv (.npz).
+
+    Zahlen- und Datumsspalten werden unverändert abgelegt, String-Spalten als Codes plus eindeutige Werte. Das
+    Archiv bleibt unkomprimiert, damit read_npz die Spalten per Memory-Mapping einbinden kann.
+
+    :param store: Zu speichernder Spaltenspeicher.
+    :param file_path: Zielpfad.
+    """
+    arrays: Dict[str, np.ndarray] = {"columns": np.asarray(store.keys(), dtype=str)}
+    for i, key in enumerate(store.keys()):
+        values = store.column(key)
+        if values.dtype == object:
+            arrays[f"c{i}_codes"], arrays[f"c{i}_categories"] = _encode_strings(values)
+        else:
+            arrays[f"c{i}"] = values
+    np.savez(file_path, **arrays)
+
+
+def read_npz(file_path: str) -> ColumnStore:
+    """
+    Lädt einen mit write_npz gespeicherten ColumnStore. Unkomprimierte Einträge werden per Memory-Mapping
+    eingebunden, sodass auch sehr große Archive ohne Kopie der Zahlen- und Datumsspalten geöffnet werden.
+
+    :param file_path: Pfad zur .npz-Datei.
+    :return: Geladener ColumnStore.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(file_path) as archive, open(file_path, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            array = _memmap_member(file_path, f, info) if info.compress_type == zipfile.ZIP_STORED else None
+            if array is None:
+                with archive.open(info) as member:
+                    array = np.lib.format.read_array(member, allow_pickle=False)
+            arrays[name] = array
+
+    if "columns" not in arrays:
+        raise ValueError("Die NPZ-Datei wurde nicht mit dieser Anwendung gespeichert (Spaltenliste fehlt).")
+    columns = {}
+    for i, key in enumerate(arrays["columns"]):
+        if f"c{i}" in arrays:
+            columns[str(key)] = arrays[f"c{i}"]
+        else:
+            columns[str(key)] = _decode_strings(arrays[f"c{i}_codes"], arrays[f"c{i}_categories"])
+    return ColumnStore.from_typed(columns)
+
+
+def _memmap_member(file_path: str, f, info: zipfile.ZipInfo):
+    """
+    Bildet ein unkomprimiertes .npy im ZIP-Archiv per Memory-Mapping ab.
+
+    :return: Schreibgeschütztes Array oder None, wenn der Eintrag nicht abgebildet werden kann (z. B. Objekt-Array).
+    """
+    f.seek(info.header_offset)
+    header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+    if header[0] != b"PK\x03\x04":
+        return None
+    name_length, extra_length = header[-2], header[-1]
+    f.seek(info.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length)
+
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    else:
+        return None
+    if dtype.hasobject:
+        return None
+    if not int(np.prod(shape)):
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(file_path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def _import_pyarrow():
+    """Importiert pyarrow erst bei Bedarf; die Anwendung läuft auch ohne die Bibliothek."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ValueError("Für Parquet- und Feather-Dateien wird das Paket 'pyarrow' benötigt (pip install pyarrow).")
+    return pyarrow
+
+
+def _to_arrow_table(store: ColumnStore):
+    """Wandelt einen ColumnStore in eine Arrow-Tabelle um; String-Spalten werden dictionary-kodiert."""
+    pa = _import_pyarrow()
+    arrays = []
+    for key in store.keys():
+        values = store.column(key)
+        if values.dtype == object:
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        elif np.issubdtype(values.dtype, np.datetime64):
+            # NaT wird zu null; NaN in Zahlenspalten bleibt dagegen NaN, damit das Lesen ohne Kopie möglich ist
+            arrays.append(pa.array(values, from_pandas=True))
+        else:
+            arrays.append(pa.array(values))
+    return pa.Table.from_arrays(arrays, names=store.keys())
+
+
+def _from_arrow_table(table) -> ColumnStore:
+    """Wandelt eine Arrow-Tabelle in einen ColumnStore um, Zahlenspalten ohne fehlende Werte ohne Kopie."""
+    pa = _import_pyarrow()
+    columns = {}
+    for key, column in zip(table.column_names, table.columns):
+        array = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+        if pa.types.is_dictionary(array.type):
+            codes = array.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+            categories = np.asarray(array.dictionary.to_pylist(), dtype=object)
+            columns[key] = _decode_strings(codes, categories)
+        elif pa.types.is_timestamp(array.type):
+            columns[key] = array.cast(pa.timestamp("ns")).to_numpy(zero_copy_only=False)
+        else:
+            columns[key] = array.to_numpy(zero_copy_only=False)
+    return ColumnStore.from_typed(columns)
+
+
+def write_feather(store: ColumnStore, file_path: str):
+    """
+    Speichert einen ColumnStore als unkomprimierte Feather-Datei (Arrow IPC) in einem einzigen Block, damit sie
+    per Memory-Mapping ohne Kopie gelesen werden kann.
+
+    :param store: Zu speichernder Spaltenspeicher.
+    :param file_path: Zielpfad.
+    """
+    table = _to_arrow_table(store)
+    from pyarrow import feather
+    feather.write_feather(table, file_path, compression="uncompressed",
+                          chunksize=max(len(store), 1))
+
+
+def read_feather(file_path: str) -> ColumnStore:
+    """
+    Lädt eine Feather-Datei (Arrow IPC) per Memory-Mapping.
+
+    :param file_path: Pfad zur Datei.
+    :return: Geladener ColumnStore.
+    """
+    _import_pyarrow()
+    from pyarrow import feather
+    return _from_arrow_table(feather.read_table(file_path, memory_map=True))
+
+
+def write_parquet(store: ColumnStore, file_path: str):
+    """
+    Speichert einen ColumnStore als Parquet-Datei (komprimiert, für die Archivierung).
+
+    :param store: Zu speichernder Spaltenspeicher.
+    :param file_path: Zielpfad.
+    """
+    table = _to_arrow_table(store)
+    from pyarrow import parquet
+    parquet.write_table(table, file_path)
+
+
+def read_parquet(file_path: str) -> ColumnStore:
+    """
+    Lädt eine Parquet-Datei. Die Datei wird per Memory-Mapping gelesen, die Spalten müssen jedoch dekodiert werden.
+
+    :param file_path: Pfad zur Datei.
+    :return: Geladener ColumnStore.
+    """
+    _import_pyarrow()
+    from pyarrow import parquet
+    return _from_arrow_table(parquet.read_table(file_path, memory_map=True))
@@ -0,0 +1,22 @@
+from PySide6.QtWidgets import (QWidget, QSizePolicy)
+
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+
+from DashboardFigure import DashboardFigure
+
+
+class DashboardCanvas(DashboardFigure, FigureCanvas):
+    """Matplotlib-Canvas für das Dashboard, der in die Qt-GUI eingebettet wird."""
+
+    def __init__(self, parent: QWidget = None, width: float = 10, height: float = 6, dpi: int = 100,
+                 lod: bool = True):
+        """
+        :param parent: Übergeordnetes Widget.
+        :param width: Breite der Figure in Zoll.
+        :param height: Höhe der Figure in Zoll.
+        :param dpi: Auflösung der Figure.
+        :param lod: Ob lange Reihen auf etwa die Pixelbreite eines Panels reduziert werden (Level of Detail).
+        """
+        super().__init__(width=width, height=height, dpi=dpi, lod=lod)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setParent(parent)
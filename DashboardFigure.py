@@ -0,0 +1,301 @@
+import pickle
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.ticker import EngFormatter
+
+from Downsampling import is_sorted, minmax_downsample
+from Metrics import metrics
+from PlotFigure import PlotFigure
+
+
+class DashboardFigure:
+    """
+    Dashboard aus einem Raster von Panels (z. B. Kurs, Volumen, Indikatoren, Vergleichssymbole) in einer einzigen
+    Figure mit gemeinsamer x-Achse.
+
+    Statt eines Canvas pro Diagramm gibt es nur eine Figure, ein Layout und einen Zeichenvorgang für alle Panels.
+    Bei einer Aktualisierung werden Panels mit unveränderten Daten übersprungen. Bleiben die Achsengrenzen gleich,
+    werden nur die geänderten Panels per Blitting über ihren zwischengespeicherten Hintergrund gezeichnet. Lange
+    Reihen werden wie im PlotFigure auf etwa die Pixelbreite eines Panels reduziert (Level of Detail).
+
+    Wird wie PlotFigure als Mixin vor einer Matplotlib-FigureCanvas-Klasse verwendet (DashboardCanvas in der GUI,
+    AggDashboardCanvas in BatchRender).
+    """
+
+    # Linienfarben der Panels ohne eigene Farbe, der Reihe nach
+    PALETTE = ("deepskyblue", "orange", "violet", "gold", "turquoise", "salmon", "yellowgreen", "orchid")
+
+    def __init__(self, width: float = 10, height: float = 6, dpi: int = 100, lod: bool = True):
+        """
+        :param width: Breite der Figure in Zoll.
+        :param height: Höhe der Figure in Zoll.
+        :param dpi: Auflösung der Figure.
+        :param lod: Ob lange Reihen auf etwa die Pixelbreite eines Panels reduziert werden (Level of Detail).
+        """
+        self.lod = lod
+        # Aktuelles Raster (Zeilen, Spalten) und Achsen zeilenweise
+        self._shape = None
+        self.axes = []
+        # Pro Achse: angezeigtes Panel, Artist, vollständige Daten als float64 und zuletzt reduzierter Ausschnitt
+        self._slots: List[Dict[str, Any]] = []
+        # Hintergrund pro Achse für das Blitting, gespeichert nach jedem vollständigen Zeichnen
+        self._backgrounds: Dict[int, Any] = {}
+
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        self.fig.set_facecolor('#19232D')
+
+        # Die nächste Klasse in der MRO ist die FigureCanvas des jeweiligen Backends
+        super().__init__(self.fig)
+        self.mpl_connect("resize_event", lambda event: self._update_lod())
+        self.mpl_connect("draw_event", self._on_draw)
+
+    @metrics.timed("dashboard.update")
+    def show_panels(self, panels: List[Dict[str, Any]], rows: int, cols: int):
+        """
+        Zeigt Panels im Raster rows x cols an. Die Achsen werden nur bei einem neuen Raster neu angelegt; Panels,
+        deren Daten, Typ, Titel und Farbe unverändert sind, werden übersprungen.
+
+        :param panels: Liste von Dicts mit x (Datumswerte, aufsteigend), y, typ ("Linie" oder "Bar"), title und
+            optional color; überzählige Panels werden ignoriert, freie Felder bleiben leer.
+        :param rows: Anzahl Zeilen.
+        :param cols: Anzahl Spalten.
+        """
+        full_redraw = (rows, cols) != self._shape
+        if full_redraw:
+            self._build_axes(rows, cols)
+
+        changed = []
+        for index, slot in enumerate(self._slots):
+            panel = panels[index] if index < len(panels) else None
+            if self._same_panel(panel, slot["panel"]):
+                continue
+            changed.append(index)
+            full_redraw = self._set_panel(index, panel) or full_redraw
+        metrics.increment("dashboard.panels_updated", len(changed))
+        metrics.increment("dashboard.panels_skipped", len(self._slots) - len(changed))
+        if not changed and not full_redraw:
+            return
+
+        full_redraw = self._set_limits(changed) or full_redraw
+        if full_redraw:
+            self._update_tick_labels()
+            self.draw_idle()
+        else:
+            self._blit_panels(changed)
+
+    @staticmethod
+    def _same_panel(a: Optional[Dict[str, Any]], b: Optional[Dict[str, Any]]) -> bool:
+        """Prüft, ob zwei Panels dieselben Daten und dieselbe Darstellung haben (siehe PlotFigure._same_data)."""
+        if a is None or b is None:
+            return a is b
+        return (all(a.get(key) == b.get(key) for key in ("typ", "title", "color"))
+                and PlotFigure._same_data(a["x"], b["x"]) and PlotFigure._same_data(a["y"], b["y"]))
+
+    def _build_axes(self, rows: int, cols: int):
+        """Legt das Raster neu an; alle Panels teilen sich die x-Achse."""
+        self.fig.clear()
+        self._backgrounds = {}
+        axes = self.fig.subplots(rows, cols, sharex=True, squeeze=False)
+        self.fig.subplots_adjust(left=0.06, right=0.98, bottom=0.08, top=0.95, wspace=0.25, hspace=0.35)
+        self.axes = [PlotFigure._style_axes(ax) for ax in axes.flat]
+        self._slots = [dict(panel=None, artist=None, data=None, window=None) for _ in self.axes]
+        self._shape = (rows, cols)
+
+        # Locator und Formatter der x-Achse werden von allen Panels geteilt
+        locator = mdates.AutoDateLocator()
+        self.axes[0].xaxis.set_major_locator(locator)
+        self.axes[0].xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        for ax in self.axes:
+            ax.yaxis.set_major_formatter(EngFormatter(sep=""))
+            ax.tick_params(axis='both', labelsize="small")
+            ax.grid(True, axis='both', color='#404240', linestyle='-', linewidth=1)
+            ax.callbacks.connect("xlim_changed", lambda changed_ax: self._update_lod())
+            # Sichtbar werden nur Achsen, denen ein Panel zugewiesen wird
+            ax.set_visible(False)
+
+    def _set_panel(self, index: int, panel: Optional[Dict[str, Any]]) -> bool:
+        """
+        Überträgt ein Panel in seine Achse. Ein vorhandener Artist gleichen Typs wird weiterverwendet.
+
+        :return: True, wenn sich mehr als die Daten geändert haben (Titel, Typ, Sichtbarkeit) und die Figure daher
+            vollständig neu gezeichnet werden muss.
+        """
+        ax, slot = self.axes[index], self._slots[index]
+        previous = slot["panel"]
+        slot["panel"] = panel
+        slot["window"] = None
+        if panel is None:
+            slot["data"] = None
+            ax.set_visible(False)
+            return previous is not None
+
+        x_values = np.asarray(panel["x"])
+        if x_values.dtype.kind == "M":
+            x_values = mdates.date2num(x_values)
+        slot["data"] = (x_values.astype(np.float64, copy=False), np.asarray(panel["y"], dtype=np.float64))
+        color = panel.get("color") or self.PALETTE[index % len(self.PALETTE)]
+
+        rebuild = slot["artist"] is None or previous is None or previous.get("typ") != panel.get("typ")
+        if rebuild:
+            if slot["artist"] is not None:
+                slot["artist"].remove()
+            if panel.get("typ") == "Bar":
+                slot["artist"] = ax.add_collection(LineCollection([], linewidths=1))
+            else:
+                slot["artist"], = ax.plot([], [], marker='', linestyle='-', linewidth=1)
+            if self.supports_blit:
+                slot["artist"].set_animated(True)
+        slot["artist"].set_color(color)
+        self._set_artist_data(index)
+
+        structural = rebuild or not ax.get_visible() or previous.get("title") != panel.get("title")
+        ax.set_visible(True)
+        ax.set_title(panel.get("title", ""), color='white', fontsize="small")
+        return structural
+
+    def _set_artist_data(self, index: int):
+        """Setzt den sichtbaren, bei Bedarf reduzierten Ausschnitt der Daten eines Panels in dessen Artist."""
+        ax, slot = self.axes[index], self._slots[index]
+        if slot["data"] is None:
+            return
+        x_values, y_values = slot["data"]
+        x_min, x_max = ax.get_xlim()
+        target = max(100, int(ax.bbox.width))
+        window = (x_min, x_max, target)
+        if window == slot["window"]:
+            return
+        slot["window"] = window
+
+        if self.lod and len(x_values) > 2 * target and is_sorted(x_values):
+            # Je ein Punkt außerhalb des sichtbaren Bereichs, damit die Linie bis zum Rand reicht
+            start = max(int(np.searchsorted(x_values, x_min, side="left")) - 1, 0)
+            end = min(int(np.searchsorted(x_values, x_max, side="right")) + 1, len(x_values))
+            x_values, y_values = minmax_downsample(x_values[start:end], y_values[start:end], target)
+
+        artist = slot["artist"]
+        if isinstance(artist, LineCollection):
+            # Volumen als senkrechte Striche von 0 bis zum Wert; bei reduzierten Daten bleibt das Maximum erhalten
+            segments = np.empty((len(x_values), 2, 2))
+            segments[:, :, 0] = x_values[:, None]
+            segments[:, 0, 1] = 0
+            segments[:, 1, 1] = y_values
+            artist.set_segments(segments)
+        else:
+            artist.set_data(x_values, y_values)
+
+    def _update_lod(self):
+        """Berechnet nach Zoom, Verschieben oder Größenänderung die sichtbaren Ausschnitte aller Panels neu."""
+        for index in range(len(self._slots)):
+            self._set_artist_data(index)
+
+    def _set_limits(self, changed: List[int]) -> bool:
+        """
+        Setzt die gemeinsame x-Achse auf die Vereinigung aller Panels und die y-Achsen der geänderten Panels.
+
+        :return: True, wenn sich eine Achsengrenze geändert hat (Beschriftungen müssen neu gezeichnet werden).
+        """
+        limits_changed = False
+        spans = [(slot["data"][0][0], slot["data"][0][-1]) for slot in self._slots
+                 if slot["data"] is not None and len(slot["data"][0])]
+        if spans:
+            x_min, x_max = min(span[0] for span in spans), max(span[1] for span in spans)
+            if x_max <= x_min:
+                x_max = x_min + 1
+            if tuple(self.axes[0].get_xlim()) != (x_min, x_max):
+                # set_xlim berechnet über xlim_changed die LOD-Ausschnitte aller Panels neu
+                self.axes[0].set_xlim(x_min, x_max)
+                limits_changed = True
+
+        for index in changed:
+            slot = self._slots[index]
+            if slot["data"] is None:
+                continue
+            y_values = slot["data"][1]
+            finite = y_values[np.isfinite(y_values)]
+            if not len(finite):
+                continue
+            y_min, y_max = float(finite.min()), float(finite.max())
+            if isinstance(slot["artist"], LineCollection):
+                y_min, y_max = min(y_min, 0.0), max(y_max, 0.0) * 1.05
+            else:
+                margin = 0.05 * (y_max - y_min)
+                y_min, y_max = y_min - margin, y_max + margin
+            if y_max <= y_min:
+                y_min, y_max = y_min - 1, y_max + 1
+            if tuple(self.axes[index].get_ylim()) != (y_min, y_max):
+                self.axes[index].set_ylim(y_min, y_max)
+                limits_changed = True
+        return limits_changed
+
+    def _update_tick_labels(self):
+        """Beschriftet die x-Achse jeweils am untersten sichtbaren Panel einer Spalte."""
+        cols = self._shape[1]
+        for index, ax in enumerate(self.axes):
+            below = index + cols
+            ax.tick_params(axis='x', labelbottom=below >= len(self.axes) or not self.axes[below].get_visible())
+
+    def draw(self):
+        """Zeichnet die Figure vollständig neu; die Dauer wird unter "dashboard.draw" erfasst."""
+        with metrics.timer("dashboard.draw"):
+            super().draw()
+
+    def _on_draw(self, event):
+        """Speichert nach jedem vollständigen Zeichnen die Hintergründe und zeichnet die animierten Artists."""
+        animated = [(index, self.axes[index], slot["artist"]) for index, slot in enumerate(self._slots)
+                    if slot["artist"] is not None and slot["artist"].get_animated() and self.axes[index].get_visible()]
+        self._backgrounds = {index: self.copy_from_bbox(ax.bbox) for index, ax, _ in animated}
+        for _, ax, artist in animated:
+            ax.draw_artist(artist)
+
+    def _blit_panels(self, indices: List[int]):
+        """Zeichnet nur die Artists der angegebenen Panels über ihren zwischengespeicherten Hintergrund."""
+        if any(index not in self._backgrounds for index in indices):
+            self.draw_idle()
+            return
+        with metrics.timer("dashboard.blit"):
+            for index in indices:
+                ax = self.axes[index]
+                self.restore_region(self._backgrounds[index])
+                ax.draw_artist(self._slots[index]["artist"])
+                self.blit(ax.bbox)
+
+    def save_figure(self, file_path: str, **kwargs):
+        """
+        Speichert das Dashboard als Bild. Für das Blitting animierte Artists werden dabei regulär mitgezeichnet.
+
+        :param file_path: Zielpfad; das Format ergibt sich aus der Dateiendung.
+        :param kwargs: Weitere Argumente für Figure.savefig.
+        """
+        animated = [slot["artist"] for slot in self._slots
+                    if slot["artist"] is not None and slot["artist"].get_animated()]
+        for artist in animated:
+            artist.set_animated(False)
+        try:
+            with metrics.timer("dashboard.save"):
+                self.fig.savefig(file_path, **kwargs)
+        finally:
+            for artist in animated:
+                artist.set_animated(True)
+            self.draw_idle()
+
+    def snapshot(self) -> bytes:
+        """
+        Erstellt eine unabhängige Kopie des Dashboards zum Speichern im Hintergrund (siehe PlotFigure.snapshot und
+        save_snapshot).
+
+        :return: Serialisierte Figure.
+        """
+        animated = [slot["artist"] for slot in self._slots
+                    if slot["artist"] is not None and slot["artist"].get_animated()]
+        for artist in animated:
+            artist.set_animated(False)
+        try:
+            return pickle.dumps(self.fig)
+        finally:
+            for artist in animated:
+                artist.set_animated(True)
@@ -1,67 +1,763 @@
+import datetime
+import gzip
+import io
 import json
-from typing import Dict, List, Any
+import os
+import re
+import threading
+from typing import Dict, List, Any, Callable, Optional, Iterator, BinaryIO, Tuple
 
-import pandas as pd
-import requests
+import numpy as np
+
+import Analytics
+import ColumnarFiles
+from ColumnStore import ColumnStore
+from DatasetCache import DatasetCache
+from EodCache import EodCache
+from Metrics import metrics
+from Indicators import IndicatorEngine
+from MarketstackClient import MarketstackClient, LoadCancelled, RateLimited
+
+# Zeilen pro Teilstück und Blockgröße in Zeichen beim gestreamten Dateiimport
+FILE_CHUNK_ROWS = 100_000
+FILE_BLOCK_SIZE = 1 << 20
+# Zeilen pro Teilstück beim gestreamten Export
+EXPORT_CHUNK_ROWS = 10_000
+# Datumsformat der Marketstack-API für den CSV-Export (Zeitstempel in UTC)
+CSV_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S+0000"
+
+# Leerraum und Kommas zwischen den Elementen eines JSON-Arrays
+_JSON_SEPARATOR = re.compile(r"[\s,]*")
+
+# Panels des Dashboards für das aktuelle Symbol als (Schlüssel, Diagrammtyp); danach folgen Vergleichssymbole
+DASHBOARD_PANELS = [
+    ("close", "Linie"), ("volume", "Bar"), ("RSI(close,14)", "Linie"), ("MACD(close,12,26)", "Linie"),
+    ("VOLATILITY(close,20)", "Linie"), ("RETURN(close)", "Linie"),
+]
 
 
 class DataManager:
     """Verwaltet das Laden und Parsen von JSON-Daten aus einer API oder aus einer Datei."""
 
-    def __init__(self):
+    def __init__(self, client: MarketstackClient = None, cache: Optional[EodCache] = None,
+                 max_datasets: int = 8, max_dataset_bytes: int = 512 * 1024 * 1024, debug: Optional[bool] = None):
+        """
+        :param client: API-Client; standardmäßig ein MarketstackClient mit Standardeinstellungen.
+        :param cache: Optionaler persistenter Cache für API-Daten. Ohne Cache wird immer vollständig geladen.
+        :param max_datasets: Anzahl der zuletzt geladenen Datensätze, die im Arbeitsspeicher gehalten werden.
+        :param max_dataset_bytes: Maximaler Speicherbedarf dieser Datensätze samt Indikatoren in Bytes.
+        :param debug: Ob die Datensätze der API-Antworten zusätzlich in raw_data behalten werden; standardmäßig
+            gesetzt, wenn die Umgebungsvariable MARKETSTACK_DEBUG einen Wert ungleich "0" hat.
+        """
+        self.debug = debug if debug is not None else os.getenv("MARKETSTACK_DEBUG", "0") not in ("", "0")
+        # Nur im Debug-Modus: die Datensätze des letzten API-Abrufs wie von der API geliefert
         self.raw_data: Dict[str, Any] = {}
-        self.data: List[Dict[str, Any]] = []
+        self._raw_lock = threading.Lock()
+        self.store: ColumnStore = ColumnStore()
+        # Bei gebündelten Anfragen ein Spaltenspeicher pro Symbol
+        self.stores: Dict[str, ColumnStore] = {}
+        self.client = client if client is not None else MarketstackClient()
+        self.cache = cache
+        # Abgeleitete Spalten (gleitende Durchschnitte, RSI, MACD ...) werden bei Bedarf berechnet und gemerkt
+        self.indicators = IndicatorEngine()
+        # Zuletzt geladene Datensätze pro Symbol für den Wechsel ohne erneutes Laden (siehe activate)
+        self.datasets = DatasetCache(max_datasets, max_dataset_bytes,
+                                     sizeof=lambda symbol, store: store.memory_usage + self.indicators.nbytes(symbol),
+                                     on_evict=self.indicators.clear)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Wandelt die geladenen Daten in eine Liste von Dicts um. Die Liste wird bei jedem Aufruf vollständig aus dem
+        Spaltenspeicher neu erzeugt (Aufwand proportional zur Zeilenzahl).
+
+        :return: Ein Dict pro Zeile.
+        """
+        return self.store.to_records()
 
     def load_from_api(self, access_key: str, symbol: str, **params) -> bool:
         """
-        Lädt Daten von der Marketstack-API.
+        Lädt Daten von der Marketstack-API. Alle Ergebnisseiten werden automatisch abgerufen und nach Datum
+        aufsteigend sortiert. Ist ein Cache gesetzt, werden nur die Tage nach dem neuesten gecachten Datensatz
+        nachgeladen.
 
         :param access_key: API-Zugriffsschlüssel.
         :param symbol: Börsensymbol (z. B. "AAPL").
-        :param params: Zusätzliche optionale Parameter (z. B. sort, date_from, date_to, limit, offset).
+        :param params: Zusätzliche optionale Parameter (z. B. sort, date_from, date_to, limit als Seitengröße, offset).
         :return: True, wenn das Laden erfolgreich war.
         """
-        base_url = "http://api.marketstack.com/v1/eod"
-        query_params = {"access_key": access_key, "symbols": symbol}
-        query_params.update(params)
+        self.set_store(self.fetch_api(access_key, symbol, **params))
+        return True
+
+    def load_batch_from_api(self, access_key: str, symbols: List[str], **params) -> bool:
+        """
+        Lädt mehrere Symbole mit einer gebündelten Anfrage und legt pro Symbol einen eigenen Spaltenspeicher an.
+        Das erste Symbol wird zum aktuellen Datensatz.
+
+        :param access_key: API-Zugriffsschlüssel.
+        :param symbols: Liste von Börsensymbolen.
+        :param params: Zusätzliche optionale Parameter (siehe load_from_api).
+        :return: True, wenn das Laden erfolgreich war.
+        """
+        self.set_stores(self.fetch_api_batch(access_key, symbols, **params))
+        return True
+
+    def fetch_api(self, access_key: str, symbol: str, progress: Optional[Callable[[int, int], None]] = None,
+                  cancel_event: Optional[threading.Event] = None, **params) -> ColumnStore:
+        """
+        Lädt Daten von der Marketstack-API, ohne die aktuell geladenen Daten zu ersetzen. Kann in einem
+        Hintergrund-Thread ausgeführt werden.
+
+        :param access_key: API-Zugriffsschlüssel.
+        :param symbol: Börsensymbol (z. B. "AAPL").
+        :param progress: Optionaler Callback progress(erledigt, gesamt).
+        :param cancel_event: Optionales Event zum Abbrechen des Ladevorgangs.
+        :param params: Zusätzliche optionale Parameter (siehe load_from_api).
+        :return: Nach Datum sortierter ColumnStore.
+        """
+        return self._fetch_store(access_key, [symbol], progress=progress, cancel_event=cancel_event,
+                                 **params).sorted_by("date")
+
+    def fetch_api_batch(self, access_key: str, symbols: List[str],
+                        progress: Optional[Callable[[int, int], None]] = None,
+                        cancel_event: Optional[threading.Event] = None, **params) -> Dict[str, ColumnStore]:
+        """
+        Lädt mehrere Symbole über eine gebündelte Anfrage ("symbols" kommagetrennt), ohne die aktuell geladenen
+        Daten zu ersetzen. Kann in einem Hintergrund-Thread ausgeführt werden.
+
+        :param access_key: API-Zugriffsschlüssel.
+        :param symbols: Liste von Börsensymbolen.
+        :param progress: Optionaler Callback progress(erledigt, gesamt).
+        :param cancel_event: Optionales Event zum Abbrechen des Ladevorgangs.
+        :param params: Zusätzliche optionale Parameter (siehe load_from_api).
+        :return: Dict von Symbol zu nach Datum sortiertem ColumnStore, in der Reihenfolge von symbols.
+        """
+        store = self._fetch_store(access_key, symbols, progress=progress, cancel_event=cancel_event, **params)
+        # Einmal nach Datum sortieren; die stabile Aufteilung nach Symbol erhält diese Reihenfolge je Symbol
+        groups = store.sorted_by("date").split_by("symbol")
+        return {symbol: groups[symbol] for symbol in symbols if symbol in groups}
+
+    def fetch_latest(self, access_key: str, symbol: str, since: Any = None, interval: Optional[str] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     cancel_event: Optional[threading.Event] = None) -> ColumnStore:
+        """
+        Lädt nur die Kurse, die neuer als ein bekannter Zeitpunkt sind (Live-Modus). Abgefragt wird ab dem Tag von
+        since, sodass eine Anfrage unabhängig von der Länge der bereits geladenen Historie meist nur eine Seite
+        umfasst und auch Lücken nach längeren Pausen geschlossen werden. Kann in einem Hintergrund-Thread
+        ausgeführt werden.
+
+        :param access_key: API-Zugriffsschlüssel.
+        :param symbol: Börsensymbol.
+        :param since: Zeitpunkt des neuesten vorhandenen Kurses als datetime64 (z. B. der letzte Wert der
+            Datumsspalte); None lädt nur den neuesten Kurs über ".../latest".
+        :param interval: Intervall für den Intraday-Endpunkt (z. B. "1min" oder "1hour"); None für Tageskurse.
+        :param progress: Optionaler Callback progress(erledigt, gesamt).
+        :param cancel_event: Optionales Event zum Abbrechen des Ladevorgangs.
+        :return: Nach Datum sortierter ColumnStore mit den Kursen nach since (leer, wenn es keine neuen gibt).
+        :raises RateLimited: Wenn das Anfragelimit der API erreicht ist.
+        """
+        endpoint = "intraday" if interval else "eod"
+        params = {"interval": interval} if interval else {}
         try:
-            response = requests.get(base_url, params=query_params)
-            response.raise_for_status()
-            self.raw_data = response.json()
-            self.data = self.raw_data.get("data", [])
+            if since is None:
+                rows = self.client.get_json(f"{endpoint}/latest", access_key, cancel_event=cancel_event, symbols=symbol,
+                                            **params).get("data", [])
+            else:
+                day = str(np.datetime64(since, "D"))
+                rows = self.client.fetch_eod(access_key, symbol, progress=progress, cancel_event=cancel_event,
+                                             endpoint=endpoint, date_from=day, sort="ASC", **params)
+        except (LoadCancelled, RateLimited):
+            raise
+        except Exception as e:
+            raise ValueError(f"Fehler beim Aktualisieren der API-Daten: {e}")
+
+        store = ColumnStore.from_records(rows).sorted_by("date")
+        if since is not None and len(store):
+            dates = store.plottable("date")
+            start = int(np.searchsorted(dates, np.datetime64(since, "ns"), side="right"))
+            store = store.view(slice(start, len(store)))
+        # Vollständig gecachte Historien werden um die neuen Tageskurse ergänzt
+        if len(store) and not interval and self.cache is not None and self.cache.newest_date(symbol):
+            self.cache.put(symbol, store.to_records())
+        return store
+
+    def _fetch_store(self, access_key: str, symbols: List[str], **params) -> ColumnStore:
+        """
+        Lädt die Datensätze der Symbole als ColumnStore und vereinheitlicht die Fehlerbehandlung.
+        """
+        self.raw_data = {"data": []} if self.debug else {}
+        try:
+            store = self._fetch_eod(access_key, symbols, **params)
+        except (LoadCancelled, RateLimited):
+            raise
         except Exception as e:
             raise ValueError(f"Fehler beim Laden der API-Daten: {e}")
-        return True
+        metrics.increment("api.rows", len(store))
+        return store
+
+    def _ingest(self, rows: List[Dict[str, Any]]) -> ColumnStore:
+        """
+        Wandelt Datensätze (z. B. eine Ergebnisseite) sofort in typisierte Spalten um. Außer im Debug-Modus werden
+        die Datensätze danach nicht mehr referenziert und können freigegeben werden.
+        """
+        if self.debug:
+            with self._raw_lock:
+                self.raw_data.setdefault("data", []).extend(rows)
+        return ColumnStore.from_records(rows)
+
+    def _fetch_eod(self, access_key: str, symbols: List[str], **params) -> ColumnStore:
+        """
+        Lädt die Datensätze mehrerer Symbole, bei vorhandenem Cache inkrementell. Nicht gecachte Symbole werden
+        gemeinsam vollständig geladen, gecachte Symbole gemeinsam ab dem ältesten "neuesten Tag" ergänzt.
+
+        Jede Ergebnisseite wird direkt nach dem Empfang in Spalten umgewandelt (und bei vorhandenem Cache vorher dort
+        gespeichert), sodass nie alle Datensätze gleichzeitig als Dicts im Speicher liegen. Scheitert ein Abruf,
+        werden die bereits gespeicherten Seiten wieder aus dem Cache entfernt, damit keine lückenhafte Historie als
+        gecacht gilt.
+        """
+        # Explizite Zeitfenster und Offsets umgehen den Cache, er hält nur vollständige Historien
+        if self.cache is None or any(key in params for key in ("date_from", "date_to", "offset")):
+            return ColumnStore.concat(self.client.fetch_eod_pages(access_key, ",".join(symbols), self._ingest,
+                                                                  **params))
+
+        parts, missing, newest = [], [], {}
+        for symbol in symbols:
+            cached_rows = self.cache.get(symbol)
+            if cached_rows is None:
+                missing.append(symbol)
+            else:
+                parts.append(self._ingest(cached_rows))
+                newest[symbol] = self.cache.newest_date(symbol)
+
+        if missing:
+            try:
+                parts.extend(self.client.fetch_eod_pages(access_key, ",".join(missing), self._cache_page, **params))
+            except BaseException:
+                for symbol in missing:
+                    self.cache.discard(symbol)
+                raise
+
+        stale = {symbol: date for symbol, date in newest.items()
+                 if date and datetime.date.fromisoformat(date) < datetime.date.today()}
+        if stale:
+            date_from = datetime.date.fromisoformat(min(stale.values())) + datetime.timedelta(days=1)
+
+            def cache_new_rows(rows: List[Dict[str, Any]]) -> ColumnStore:
+                # Bei mehreren Symbolen kann die Anfrage Tage enthalten, die für einzelne Symbole schon gecacht sind
+                return self._cache_page([row for row in rows
+                                         if str(row.get("date", ""))[:10] > stale.get(row.get("symbol"), "")])
+
+            try:
+                parts.extend(self.client.fetch_eod_pages(access_key, ",".join(stale), cache_new_rows,
+                                                         date_from=date_from.isoformat(), **params))
+            except BaseException:
+                for symbol, date in stale.items():
+                    self.cache.discard(symbol, after=date)
+                raise
+        return ColumnStore.concat(parts)
+
+    def _cache_page(self, rows: List[Dict[str, Any]]) -> ColumnStore:
+        """Speichert die Datensätze einer Ergebnisseite je Symbol im Cache und wandelt sie in Spalten um."""
+        for symbol, symbol_rows in self._group_by_symbol(rows).items():
+            self.cache.put(symbol, symbol_rows)
+        return self._ingest(rows)
+
+    @staticmethod
+    def _group_by_symbol(rows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(row.get("symbol"), []).append(row)
+        return groups
 
     def load_from_file(self, file_path: str) -> bool:
         """
-        Lädt Daten aus einer JSON-Datei oder CSV-Datei.
+        Lädt Daten aus einer JSON-, CSV- oder Binärdatei (NPZ, Feather/Arrow, Parquet).
 
-        :param file_path: Pfad zur JSON-Datei oder CSV-Datei.
+        :param file_path: Pfad zur Datei.
         :return: True, wenn das Laden erfolgreich war.
         """
-        if file_path.endswith(".csv"):
-            self.data = pd.read_csv(file_path).to_dict(orient='records')
-        elif file_path.endswith(".json"):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+        self.set_store(self.read_file(file_path))
+        return True
+
+    @staticmethod
+    @metrics.timed("file.parse")
+    def read_file(file_path: str, progress: Optional[Callable[[int, int], None]] = None,
+                  cancel_event: Optional[threading.Event] = None,
+                  preview: Optional[Callable[[ColumnStore], None]] = None,
+                  chunk_rows: int = FILE_CHUNK_ROWS) -> ColumnStore:
+        """
+        Liest eine JSON-, CSV- oder Binärdatei, ohne die aktuell geladenen Daten zu ersetzen. Kann in einem
+        Hintergrund-Thread ausgeführt werden.
+
+        Binärdateien (NPZ, Feather/Arrow, Parquet) werden per Memory-Mapping und ohne Textparsing geöffnet. Eine
+        JSON- oder CSV-Datei wird in Teilstücken von höchstens chunk_rows Zeilen gelesen, die sofort in typisierte Spalten
+        umgewandelt werden. Der Speicherbedarf bleibt so auch bei sehr großen Exporten in der Größenordnung der
+        fertigen Spalten, statt ein Vielfaches der Dateigröße zu betragen. gzip-komprimierte Dateien (".json.gz",
+        ".csv.gz") werden beim Lesen entpackt.
+
+        :param file_path: Pfad zur Datei.
+        :param progress: Optionaler Callback progress(erledigt, gesamt) in Promille der gelesenen Datei.
+        :param cancel_event: Optionales Event zum Abbrechen des Ladevorgangs.
+        :param preview: Optionaler Callback, der nach dem ersten Teilstück mit dessen Daten (nach Datum sortiert)
+            aufgerufen wird, z. B. für eine Vorschau.
+        :param chunk_rows: Maximale Anzahl Zeilen pro Teilstück.
+        :return: Nach Datum sortierter ColumnStore.
+        """
+        if ColumnarFiles.is_binary_file(file_path):
+            store = ColumnarFiles.read_file(file_path)
+            if progress is not None:
+                progress(1000, 1000)
+            return store.sorted_by("date")
+        compressed = file_path.endswith(".gz")
+        name = file_path[:-3] if compressed else file_path
+        if name.endswith(".csv"):
+            chunks = DataManager._iter_csv_chunks
+        elif name.endswith(".json"):
+            chunks = DataManager._iter_json_chunks
+        else:
+            raise ValueError("Ungültiger Dateityp. Es werden nur JSON-, CSV-, NPZ-, Feather- und Parquet-Dateien "
+                             "unterstützt.")
+
+        size = max(os.path.getsize(file_path), 1)
+        stores = []
+        with open(file_path, 'rb') as raw, (gzip.GzipFile(fileobj=raw) if compressed else raw) as f:
+            for store in chunks(f, max(1, chunk_rows)):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled()
+                stores.append(store)
+                if preview is not None and len(stores) == 1:
+                    preview(store.sorted_by("date"))
+                if progress is not None:
+                    # Bei komprimierten Dateien zählt die Position in der gepackten Datei
+                    progress(min(raw.tell() * 1000 // size, 999), 1000)
+        if progress is not None:
+            progress(1000, 1000)
+        store = ColumnStore.concat(stores).sorted_by("date")
+        metrics.increment("file.rows", len(store))
+        return store
+
+    @staticmethod
+    def _iter_csv_chunks(f: BinaryIO, chunk_rows: int) -> Iterator[ColumnStore]:
+        """Liest eine CSV-Datei in Teilstücken von höchstens chunk_rows Zeilen."""
+        import pandas as pd
+        with pd.read_csv(f, chunksize=chunk_rows) as reader:
+            for frame in reader:
+                yield ColumnStore.from_frame(frame)
+
+    @staticmethod
+    def _iter_json_chunks(f: BinaryIO, chunk_rows: int) -> Iterator[ColumnStore]:
+        """
+        Liest ein JSON-Array von Datensätzen inkrementell: Der Puffer wird blockweise gefüllt und jeder vollständige
+        Datensatz mit raw_decode dekodiert, sodass nie die ganze Datei als Text im Speicher liegt.
+        """
+        text = io.TextIOWrapper(f, encoding='utf-8')
+        decoder = json.JSONDecoder()
+        buffer, index, eof, started = "", 0, False, False
+        records, count = [], 0
+        while True:
+            index = _JSON_SEPARATOR.match(buffer, index).end()
+            if index >= len(buffer):
+                if eof:
+                    raise ValueError("Unerwartetes Dateiende: Das JSON-Array ist nicht abgeschlossen.")
+                buffer, index = text.read(FILE_BLOCK_SIZE), 0
+                eof = not buffer
+                continue
+            if not started:
+                if buffer[index] != "[":
+                    raise ValueError("Die JSON-Datei muss ein Array von Datensätzen enthalten.")
+                started = True
+                index += 1
+                continue
+            if buffer[index] == "]":
+                break
+            try:
+                record, end = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                # Der Datensatz ist im Puffer noch unvollständig
+                block = "" if eof else text.read(FILE_BLOCK_SIZE)
+                if not block:
+                    raise
+                buffer, index = buffer[index:] + block, 0
+                continue
+            if not isinstance(record, dict):
+                raise ValueError(f"Ungültiges JSON-Format: Element {count + 1} ist kein Objekt, sondern "
+                                 f"{type(record).__name__}.")
+            records.append(record)
+            count += 1
+            index = end
+            if len(records) >= chunk_rows:
+                yield DataManager._json_chunk(records, count - len(records))
+                records = []
+        if records:
+            yield DataManager._json_chunk(records, count - len(records))
+        text.detach()
+
+    @staticmethod
+    def _json_chunk(records: List[Dict[str, Any]], offset: int) -> ColumnStore:
+        """
+        Wandelt die Datensätze eines Teilstücks in Spalten um. Scheitert das oder entsteht eine mehrdimensionale
+        Spalte, wird das erste Feld mit einem verschachtelten Wert gesucht und als Formatfehler gemeldet.
+
+        :param records: Datensätze als Dicts.
+        :param offset: Anzahl der Datensätze vor diesem Teilstück (für die Fehlermeldung).
+        :raises ValueError: Wenn ein Feld ein Objekt oder Array enthält.
+        """
+        try:
+            store = ColumnStore.from_records(records)
+        except (TypeError, ValueError) as e:
+            error = e
         else:
-            raise ValueError("Ungültiger Dateityp. Es werden nur JSON- und CSV-Dateien unterstützt.")
+            if all(store.column(key).ndim == 1 for key in store.keys()):
+                return store
+            error = None
+        for number, record in enumerate(records, offset + 1):
+            for key, value in record.items():
+                if isinstance(value, (dict, list)):
+                    raise ValueError(f"Ungültiges JSON-Format: Das Feld '{key}' in Element {number} enthält "
+                                     f"ein verschachteltes {'Objekt' if isinstance(value, dict) else 'Array'}.")
+        raise error or ValueError("Ungültiges JSON-Format: Die Datensätze lassen sich nicht in Spalten umwandeln.")
+
+    def save_to_file(self, file_path: str):
+        """
+        Speichert die aktuell geladenen Daten in einem Binärformat, das zur Dateiendung passt (.npz, .feather,
+        .arrow oder .parquet).
+
+        :param file_path: Zielpfad.
+        """
+        ColumnarFiles.write_file(self.store, file_path)
+
+    def save_json(self, file_path: str, indent: Optional[int] = 4,
+                  progress: Optional[Callable[[int, int], None]] = None,
+                  cancel_event: Optional[threading.Event] = None, store: Optional[ColumnStore] = None,
+                  chunk_rows: int = EXPORT_CHUNK_ROWS):
+        """
+        Speichert die aktuell geladenen Daten als JSON-Liste im Format der Marketstack-API. Die Datensätze werden in
+        Teilstücken umgewandelt und geschrieben (siehe _export). Kann in einem Hintergrund-Thread ausgeführt werden.
+
+        :param file_path: Zielpfad; endet er auf ".gz", wird gzip-komprimiert.
+        :param indent: Einrückung wie bei json.dump; None für eine kompakte Ausgabe ohne Umbrüche und Leerzeichen.
+        :param progress: Optionaler Callback progress(geschriebene Zeilen, Zeilen gesamt).
+        :param cancel_event: Optionales Event zum Abbrechen; die Zieldatei bleibt dann unverändert.
+        :param store: Zu speichernde Daten; standardmäßig der aktuelle Datensatz.
+        :param chunk_rows: Zeilen pro Teilstück.
+        """
+        separator, header, footer = (",", "[", "]") if indent is None else (",\n", "[\n", "\n]")
+
+        def write_part(file, part: ColumnStore, first: bool):
+            records = part.to_records()
+            if records:
+                # Ein Aufruf pro Teilstück; ohne die Klammern ist das Ergebnis genau der Ausschnitt aus json.dump
+                text = json.dumps(records, ensure_ascii=False, indent=indent,
+                                  separators=(",", ":") if indent is None else None)
+                file.write(("" if first else separator) + text[len(header):-len(footer)])
+
+        store = self.store if store is None else store
+        self._export(file_path, store, write_part, header if len(store) else "[", footer if len(store) else "]",
+                     progress, cancel_event, chunk_rows)
+
+    def save_csv(self, file_path: str, progress: Optional[Callable[[int, int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None, store: Optional[ColumnStore] = None,
+                 chunk_rows: int = EXPORT_CHUNK_ROWS):
+        """
+        Speichert die aktuell geladenen Daten als CSV-Datei mit einer Spalte pro Feld. Statt eines DataFrames über
+        alle Zeilen wird pro Teilstück einer erzeugt (siehe _export). Kann in einem Hintergrund-Thread ausgeführt
+        werden.
+
+        :param file_path: Zielpfad; endet er auf ".gz", wird gzip-komprimiert.
+        :param progress: Optionaler Callback progress(geschriebene Zeilen, Zeilen gesamt).
+        :param cancel_event: Optionales Event zum Abbrechen; die Zieldatei bleibt dann unverändert.
+        :param store: Zu speichernde Daten; standardmäßig der aktuelle Datensatz.
+        :param chunk_rows: Zeilen pro Teilstück.
+        """
+        def write_part(file, part: ColumnStore, first: bool):
+            # Datumswerte wie in den API-Daten ("2024-01-02T00:00:00+0000"); ohne date_format kürzt Pandas Werte um
+            # Mitternacht auf "2024-01-02"
+            part.to_frame().to_csv(file, header=first, index=False, date_format=CSV_DATE_FORMAT)
+
+        self._export(file_path, self.store if store is None else store, write_part, "", "", progress, cancel_event,
+                     chunk_rows)
+
+    @staticmethod
+    @metrics.timed("file.export")
+    def _export(file_path: str, store: ColumnStore, write_part: Callable[[Any, ColumnStore, bool], None],
+                header: str, footer: str, progress: Optional[Callable[[int, int], None]],
+                cancel_event: Optional[threading.Event], chunk_rows: int):
+        """
+        Schreibt einen Datensatz in Teilstücken von chunk_rows Zeilen (Sichten ohne Kopie), sodass zusätzlich zu den
+        Spalten nur ein Teilstück in Textform im Speicher liegt. Geschrieben wird in eine temporäre Datei, die erst
+        nach Erfolg die Zieldatei ersetzt; bei einem Fehler oder Abbruch wird sie gelöscht.
+
+        :param write_part: Funktion write_part(Datei, Teilstück, erstes Teilstück), die ein Teilstück schreibt.
+        :param header: Text vor dem ersten Teilstück.
+        :param footer: Text nach dem letzten Teilstück.
+        :raises LoadCancelled: Wenn cancel_event gesetzt wurde.
+        """
+        total = len(store)
+        chunk_rows = max(1, chunk_rows)
+        temp_path = file_path + ".part"
+        # Stufe 6 statt 9: kaum größere Dateien, aber ein Vielfaches schneller
+        compression = {"compresslevel": 6} if file_path.endswith(".gz") else {}
+        try:
+            with (gzip.open if compression else open)(temp_path, 'wt', encoding='utf-8', newline='',
+                                                      **compression) as file:
+                file.write(header)
+                # Auch ohne Zeilen wird ein (leeres) Teilstück geschrieben, z. B. die Kopfzeile einer CSV-Datei
+                for start in range(0, max(total, 1), chunk_rows):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise LoadCancelled()
+                    end = min(start + chunk_rows, total)
+                    write_part(file, store.view(slice(start, end)), start == 0)
+                    if progress is not None:
+                        progress(end, total)
+                file.write(footer)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        metrics.increment("file.export_rows", total)
+
+    def get_window(self, key: str, start: Any = None, end: Any = None, symbol: Optional[str] = None) -> np.ndarray:
+        """
+        Gibt die plottbaren Daten einer Spalte (oder eines Indikators) für einen Datumsbereich zurück. Der Bereich
+        wird per binärer Suche im sortierten Datumsindex bestimmt; das Ergebnis ist eine Sicht ohne Kopie.
+
+        Indikatoren werden dabei über die gesamte Historie berechnet, damit z. B. ein SMA(close,200) auch am Anfang
+        eines kurzen Zeitraums gültige Werte hat.
+
+        :param key: Spalten- oder Indikator-Schlüssel.
+        :param start: Erster Tag (inklusive), z. B. "2024-01-01" oder ein date; None für keinen Anfang.
+        :param end: Letzter Tag (inklusive); None für kein Ende.
+        :param symbol: Anderes geladenes Symbol (siehe dataset); None für den aktuellen Datensatz.
+        :return: Array der Werte im Bereich (leer, wenn der Key nicht existiert).
+        :raises ValueError: Wenn die Spalte nicht plottbar ist.
+        """
+        return self.get_plot_data(key, symbol)[self.dataset(symbol).index_range(start, end)]
+
+    def append_rows(self, store: ColumnStore) -> int:
+        """
+        Hängt neue Kurse (z. B. aus fetch_latest) an Ort und Stelle an den aktuellen Datensatz an. Der Aufwand hängt
+        nur von der Anzahl der neuen Zeilen ab; gemerkte Indikatoren werden beim nächsten Zugriff fortgeschrieben.
+
+        :param store: Neue Zeilen, nach Datum sortiert und neuer als die vorhandenen.
+        :return: Anzahl der angehängten Zeilen.
+        """
+        self.store.append(store)
+        # Der Datensatz ist gewachsen; die Limits der gehaltenen Datensätze werden erneut geprüft
+        self.datasets.trim()
+        return len(store)
+
+    def set_store(self, store: ColumnStore):
+        """
+        Ersetzt die aktuell geladenen Daten. Der Datensatz wird zusätzlich unter seinem Symbol im Arbeitsspeicher
+        gehalten (siehe activate).
+
+        :param store: Neuer Spaltenspeicher.
+        """
+        self.store = store
+        self.stores = {}
+        self.datasets.put(self._symbol_of(store), store)
+
+    def set_stores(self, stores: Dict[str, ColumnStore], current: Optional[str] = None):
+        """
+        Ersetzt die aktuell geladenen Daten durch mehrere Symbole.
+
+        :param stores: Dict von Symbol zu Spaltenspeicher.
+        :param current: Symbol, das zum aktuellen Datensatz wird; standardmäßig das erste.
+        """
+        self.stores = dict(stores)
+        if current not in self.stores:
+            current = next(iter(self.stores), None)
+        self.store = self.stores[current] if current is not None else ColumnStore()
+        for symbol, store in self.stores.items():
+            if symbol != current:
+                self.datasets.put(symbol, store)
+        if current is not None:
+            self.datasets.put(current, self.store)
+
+    def activate(self, symbol: str) -> bool:
+        """
+        Macht einen bereits geladenen Datensatz ohne Netzwerk- oder Dateizugriff zum aktuellen. Umgewandelte Spalten
+        und Indikatoren bleiben dabei erhalten. Stammt das Symbol aus der aktuellen gebündelten Anfrage, bleiben
+        deren übrige Symbole geladen.
+
+        :param symbol: Börsensymbol.
+        :return: True, wenn der Datensatz im Arbeitsspeicher lag und nun aktuell ist.
+        """
+        if symbol in self.stores:
+            self.store = self.stores[symbol]
+            self.datasets.put(symbol, self.store)
+            return True
+        store = self.datasets.get(symbol)
+        if store is None:
+            return False
+        self.store = store
+        self.stores = {}
         return True
 
+    def dataset(self, symbol: Optional[str] = None) -> ColumnStore:
+        """
+        Gibt einen geladenen Datensatz zurück, ohne ihn zum aktuellen zu machen.
+
+        :param symbol: Börsensymbol; None für den aktuellen Datensatz.
+        :return: ColumnStore; leer, wenn das Symbol nicht im Arbeitsspeicher liegt.
+        """
+        if symbol is None or symbol == self.get_symbol():
+            return self.store
+        store = self.stores.get(symbol)
+        if store is None:
+            store = self.datasets.peek(symbol)
+        return store if store is not None else ColumnStore()
+
+    def loaded_symbols(self) -> List[str]:
+        """
+        Gibt die Symbole aller Datensätze im Arbeitsspeicher zurück: das aktuelle zuerst, danach die übrigen der
+        gebündelten Anfrage und zuletzt die zuletzt verwendeten.
+
+        :return: Liste von Börsensymbolen ohne Duplikate.
+        """
+        symbols = [self.get_symbol()] + list(self.stores) + self.datasets.keys()[::-1]
+        return [symbol for symbol in dict.fromkeys(symbols) if symbol]
+
+    def dashboard_panels(self, count: int, start: Any = None, end: Any = None) -> List[Dict[str, Any]]:
+        """
+        Stellt die Daten für ein Dashboard zusammen: zuerst Kurs, Volumen und Indikatoren des aktuellen Symbols
+        (DASHBOARD_PANELS, soweit vorhanden), danach der Schlusskurs weiterer geladener Symbole zum Vergleich.
+        Alle Reihen sind Sichten ohne Kopie; Panels eines Symbols teilen sich dasselbe Datums-Array.
+
+        :param count: Maximale Anzahl Panels; weitere Indikatoren werden nicht berechnet.
+        :param start: Erster Tag (inklusive); None für keinen Anfang.
+        :param end: Letzter Tag (inklusive); None für kein Ende.
+        :return: Liste von Dicts mit key, symbol, title, typ, x und y.
+        """
+        panels = []
+        for symbol in self.loaded_symbols():
+            current = symbol == self.get_symbol()
+            try:
+                dates = self.get_window("date", start, end, symbol)
+            except ValueError:
+                continue
+            if not len(dates):
+                continue
+            available = self.dataset(symbol).keys() + self.indicators.available(self.dataset(symbol))
+            for key, diagram_typ in DASHBOARD_PANELS if current else DASHBOARD_PANELS[:1]:
+                if len(panels) >= count:
+                    return panels
+                if key not in available:
+                    continue
+                try:
+                    values = self.get_window(key, start, end, symbol)
+                except ValueError:
+                    continue
+                if len(values) == len(dates):
+                    panels.append(dict(key=key, symbol=symbol, title=f"{symbol}  {key}", typ=diagram_typ,
+                                       x=dates, y=values))
+        return panels
+
+    def symbol_series(self, key: str = "close", start: Any = None, end: Any = None,
+                      symbols: Optional[List[str]] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Gibt eine Spalte mehrerer geladener Symbole für einen Datumsbereich zurück (Sichten ohne Kopie).
+
+        :param key: Spalten- oder Indikator-Schlüssel.
+        :param start: Erster Tag (inklusive); None für keinen Anfang.
+        :param end: Letzter Tag (inklusive); None für kein Ende.
+        :param symbols: Symbole; standardmäßig alle geladenen (siehe loaded_symbols).
+        :return: Dict von Symbol zu (Datumswerte, Werte); Symbole ohne diese Spalte fehlen.
+        :raises ValueError: Wenn die Spalte nicht plottbar ist.
+        """
+        series = {}
+        for symbol in self.loaded_symbols() if symbols is None else symbols:
+            dates = self.get_window("date", start, end, symbol)
+            values = self.get_window(key, start, end, symbol)
+            if len(values) and len(values) == len(dates):
+                series[symbol] = (dates, values)
+        return series
+
+    def correlation(self, key: str = "close", start: Any = None, end: Any = None,
+                    min_periods: int = 20) -> Tuple[List[str], np.ndarray]:
+        """
+        Berechnet die paarweise Korrelation der Renditen aller geladenen Symbole (siehe Analytics).
+
+        :param key: Kursspalte, aus der die Renditen berechnet werden.
+        :param start: Erster Tag (inklusive); None für keinen Anfang.
+        :param end: Letzter Tag (inklusive); None für kein Ende.
+        :param min_periods: Mindestanzahl gemeinsamer Tage je Paar; darunter ist die Korrelation NaN.
+        :return: Tupel (Symbole, Korrelationsmatrix).
+        :raises ValueError: Wenn die Spalte nicht plottbar ist.
+        """
+        _, symbols, matrix = Analytics.align(Analytics.returns(self.symbol_series(key, start, end)))
+        return symbols, Analytics.correlation_matrix(matrix, min_periods)
+
+    def rolling_beta(self, index_symbol: str, window: int = 60, key: str = "close", start: Any = None,
+                     end: Any = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Berechnet das rollierende Beta des aktuellen Symbols gegenüber einem anderen geladenen Symbol (Index).
+
+        :param index_symbol: Symbol des Index, z. B. ein ETF auf den Gesamtmarkt.
+        :param window: Fensterlänge in Handelstagen.
+        :param key: Kursspalte, aus der die Renditen berechnet werden.
+        :param start: Erster Tag (inklusive); None für keinen Anfang.
+        :param end: Letzter Tag (inklusive); None für kein Ende.
+        :return: Tupel (Datumswerte, Beta) über die gemeinsamen Tage beider Symbole.
+        :raises ValueError: Wenn eines der Symbole nicht geladen ist oder die Spalte nicht plottbar ist.
+        """
+        symbol = self.get_symbol()
+        series = self.symbol_series(key, start, end, [symbol, index_symbol])
+        if len(series) < 2:
+            raise ValueError(f"Für das Beta müssen {symbol} und {index_symbol} mit der Spalte '{key}' geladen sein.")
+        dates, _, matrix = Analytics.align(Analytics.returns(series))
+        return dates, Analytics.rolling_beta(matrix[:, 0], matrix[:, 1], window, min_periods=max(2, window // 2))
+
+    def has_data(self) -> bool:
+        """
+        Prüft, ob Daten geladen sind.
+
+        :return: True, wenn mindestens ein Datensatz vorhanden ist.
+        """
+        return len(self.store) > 0
+
+    def get_symbol(self) -> str:
+        """
+        Gibt das Symbol des ersten Datensatzes zurück.
+
+        :return: Symbol oder ein leerer String, wenn keines vorhanden ist.
+        """
+        return self._symbol_of(self.store)
+
+    @staticmethod
+    def _symbol_of(store: ColumnStore) -> str:
+        symbols = store.column("symbol")
+        return str(symbols[0]) if len(symbols) else ""
+
     def get_available_keys(self) -> List[str]:
         """
-        Gibt eine Liste der Keys aus dem ersten Datensatz zurück.
+        Gibt eine Liste der Keys aus dem Schema des Spaltenspeichers zurück, gefolgt von den verfügbaren Indikatoren
+        (z. B. "SMA(close,20)").
 
         :return: Liste von Strings (Keys)
         """
-        return list(self.data[0].keys()) if self.data and isinstance(self.data, list) else []
+        return self.store.keys() + self.indicators.available(self.store)
 
-    def get_column_data(self, key: str) -> List[Any]:
+    def get_column_data(self, key: str) -> np.ndarray:
         """
-        Extrahiert die Daten einer bestimmten Spalte (Key) aus den Datensätzen.
+        Gibt die Daten einer bestimmten Spalte (Key) als NumPy-Array ohne Kopie zurück.
 
         :param key: Der Schlüssel, dessen Daten extrahiert werden sollen.
-        :return: Liste der Werte für den angegebenen Key.
+        :return: Array der Werte für den angegebenen Key (leer, wenn der Key nicht existiert).
+        """
+        return self.store.column(key)
+
+    def get_plot_data(self, key: str, symbol: Optional[str] = None) -> np.ndarray:
+        """
+        Gibt die Daten einer Spalte in plottbarer Form (datetime64[ns] oder float64) zurück. Jede Spalte wird nur
+        einmal umgewandelt. Indikator-Schlüssel werden beim ersten Zugriff berechnet und pro Symbol gemerkt.
+
+        :param key: Der Schlüssel, dessen Daten umgewandelt werden sollen.
+        :param symbol: Anderes geladenes Symbol (siehe dataset); None für den aktuellen Datensatz.
+        :return: Array der Werte (leer, wenn der Key nicht existiert).
+        :raises ValueError: Wenn die Spalte weder Zahlen noch Datumswerte enthält.
         """
-        return [item.get(key) for item in self.data]
+        store = self.dataset(symbol)
+        if key not in store and self.indicators.is_indicator(key):
+            return self.indicators.compute(store, key, self._symbol_of(store))
+        return store.plottable(key)
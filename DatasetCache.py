@@ -0,0 +1,142 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Callable, Optional
+
+from ColumnStore import ColumnStore
+from Metrics import metrics
+
+
+class DatasetCache:
+    """
+    Hält die zuletzt geladenen Datensätze (ColumnStore samt umgewandelter Spalten) im Arbeitsspeicher, damit beim
+    Wechsel zu einem kürzlich angezeigten Symbol ohne Netzwerk- oder Dateizugriff neu gezeichnet werden kann.
+
+    Begrenzt wird nach Anzahl der Einträge und nach Bytes; verdrängt wird der am längsten nicht verwendete Eintrag.
+    Da umgewandelte Spalten und Indikatoren erst bei Bedarf entstehen und Live-Daten an Ort und Stelle angehängt
+    werden, wird die Größe der Einträge bei jeder Prüfung neu ermittelt. Der zuletzt verwendete Eintrag wird nie
+    verdrängt, auch wenn er allein größer als das Limit ist.
+    """
+
+    def __init__(self, max_entries: int = 8, max_bytes: int = 512 * 1024 * 1024,
+                 sizeof: Optional[Callable[[str, ColumnStore], int]] = None,
+                 on_evict: Optional[Callable[[str], None]] = None):
+        """
+        :param max_entries: Maximale Anzahl gehaltener Datensätze.
+        :param max_bytes: Maximaler Speicherbedarf aller Datensätze in Bytes.
+        :param sizeof: Optionale Funktion sizeof(Schlüssel, Datensatz), die den Speicherbedarf eines Eintrags
+            bestimmt; standardmäßig ColumnStore.memory_usage.
+        :param on_evict: Optionaler Callback on_evict(Schlüssel) für verdrängte Einträge (z. B. um zugehörige
+            Indikatoren zu verwerfen).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._sizeof = sizeof if sizeof is not None else (lambda key, store: store.memory_usage)
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, ColumnStore]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[ColumnStore]:
+        """
+        Gibt einen Datensatz zurück, markiert ihn als zuletzt verwendet und zählt Treffer bzw. Fehlschläge.
+
+        :param key: Schlüssel, in der Regel das Börsensymbol.
+        :return: ColumnStore oder None, wenn der Datensatz nicht (mehr) gehalten wird.
+        """
+        with self._lock:
+            store = self._entries.get(key)
+            if store is None:
+                self.misses += 1
+                metrics.increment("datasets.misses")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            metrics.increment("datasets.hits")
+            return store
+
+    def peek(self, key: str) -> Optional[ColumnStore]:
+        """
+        Gibt einen Datensatz zurück, ohne ihn als verwendet zu markieren oder Treffer zu zählen (z. B. für
+        Vergleichsansichten, die die Verdrängungsreihenfolge nicht beeinflussen sollen).
+
+        :param key: Schlüssel, in der Regel das Börsensymbol.
+        :return: ColumnStore oder None.
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, store: ColumnStore):
+        """
+        Legt einen Datensatz ab (ersetzt einen vorhandenen mit gleichem Schlüssel) und verdrängt bei Bedarf die am
+        längsten nicht verwendeten Einträge.
+
+        :param key: Schlüssel, in der Regel das Börsensymbol.
+        :param store: Datensatz.
+        """
+        if not key or not len(store):
+            return
+        with self._lock:
+            self._entries[key] = store
+            self._entries.move_to_end(key)
+        self.trim()
+
+    def trim(self) -> List[str]:
+        """
+        Verdrängt Einträge, bis beide Limits eingehalten sind.
+
+        :return: Schlüssel der verdrängten Einträge.
+        """
+        evicted = []
+        with self._lock:
+            sizes = {key: self._sizeof(key, store) for key, store in self._entries.items()}
+            total = sum(sizes.values())
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or total > self.max_bytes):
+                key, _ = self._entries.popitem(last=False)
+                total -= sizes[key]
+                evicted.append(key)
+        if evicted:
+            metrics.increment("datasets.evictions", len(evicted))
+        if self._on_evict is not None:
+            for key in evicted:
+                self._on_evict(key)
+        return evicted
+
+    def discard(self, key: str):
+        """Entfernt einen Datensatz, falls vorhanden."""
+        with self._lock:
+            removed = self._entries.pop(key, None) is not None
+        if removed and self._on_evict is not None:
+            self._on_evict(key)
+
+    def clear(self):
+        """Entfernt alle Datensätze."""
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+        if self._on_evict is not None:
+            for key in keys:
+                self._on_evict(key)
+
+    def keys(self) -> List[str]:
+        """Schlüssel aller Einträge, vom am längsten nicht verwendeten zum zuletzt verwendeten."""
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Aktueller Speicherbedarf aller Einträge in Bytes."""
+        with self._lock:
+            return sum(self._sizeof(key, store) for key, store in self._entries.items())
+
+    def stats(self) -> Dict[str, int]:
+        """Anzahl der Einträge, Speicherbedarf sowie Treffer und Fehlschläge."""
+        return {"entries": len(self), "bytes": self.nbytes, "hits": self.hits, "misses": self.misses}
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
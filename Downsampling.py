@@ -0,0 +1,107 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def is_sorted(values: np.ndarray) -> bool:
+    """
+    Prüft, ob ein Array aufsteigend sortiert ist.
+
+    :param values: Numerisches Array.
+    :return: True, wenn jeder Wert größer oder gleich seinem Vorgänger ist.
+    """
+    return len(values) < 2 or bool(np.all(values[1:] >= values[:-1]))
+
+
+def minmax_downsample(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduziert eine Linie auf Minimum und Maximum je Bucket. Ausreißer bleiben dadurch sichtbar, die Anzahl der
+    Punkte ist höchstens 2 * n_buckets + 2.
+
+    :param x: Aufsteigend sortierte x-Werte.
+    :param y: y-Werte (NaN erlaubt).
+    :param n_buckets: Anzahl der Buckets, typischerweise die Breite der Achse in Pixeln.
+    :return: Tupel (x, y) mit den ausgewählten Punkten in ursprünglicher Reihenfolge.
+    """
+    n = len(x)
+    if n_buckets < 1 or n <= 2 * n_buckets:
+        return x, y
+
+    bucket_size = int(np.ceil(n / n_buckets))
+    n_full = (n // bucket_size) * bucket_size
+    buckets = y[:n_full].reshape(-1, bucket_size)
+    offsets = np.arange(0, n_full, bucket_size)
+
+    # NaN-Werte dürfen weder Minimum noch Maximum werden
+    nan_mask = np.isnan(buckets)
+    indices = [offsets + np.where(nan_mask, np.inf, buckets).argmin(axis=1),
+               offsets + np.where(nan_mask, -np.inf, buckets).argmax(axis=1),
+               np.array([0, n - 1])]
+    if n_full < n:
+        tail = y[n_full:]
+        tail_nan = np.isnan(tail)
+        indices.append(n_full + np.array([np.where(tail_nan, np.inf, tail).argmin(),
+                                          np.where(tail_nan, -np.inf, tail).argmax()]))
+
+    selected = np.unique(np.concatenate(indices))
+    return x[selected], y[selected]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets: wählt n_out Punkte, die die Form der Kurve möglichst gut erhalten.
+
+    :param x: Aufsteigend sortierte x-Werte.
+    :param y: y-Werte.
+    :param n_out: Gewünschte Anzahl Punkte (mindestens 3).
+    :return: Tupel (x, y) mit den ausgewählten Punkten.
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return x, y
+
+    # Erster und letzter Punkt bleiben erhalten, die übrigen werden auf n_out - 2 Buckets verteilt
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs((x[previous] - avg_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (avg_y - y[previous]))
+        previous = start + int(np.nan_to_num(area, nan=-1.0).argmax())
+        selected[i + 1] = previous
+
+    return x[selected], y[selected]
+
+
+def ohlc_downsample(x: np.ndarray, open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    volume: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, ...]:
+    """
+    Fasst aufeinanderfolgende Kerzen zu höchstens n_buckets Kerzen zusammen: Eröffnung der ersten, Hoch und Tief
+    über alle, Schluss der letzten Kerze und Summe des Volumens je Bucket.
+
+    :param x: Aufsteigend sortierte x-Werte.
+    :param open_: Eröffnungskurse.
+    :param high: Hochs.
+    :param low: Tiefs.
+    :param close: Schlusskurse.
+    :param volume: Volumen (darf leer sein, wenn kein Volumen gezeichnet wird).
+    :param n_buckets: Maximale Anzahl Kerzen.
+    :return: Tupel (x, open, high, low, close, volume) mit den zusammengefassten Werten.
+    """
+    n = len(x)
+    if n_buckets < 1 or n <= n_buckets:
+        return x, open_, high, low, close, volume
+
+    bucket_size = int(np.ceil(n / n_buckets))
+    starts = np.arange(0, n, bucket_size)
+    ends = np.append(starts[1:], n) - 1
+    # fmax/fmin ignorieren NaN, solange der Bucket mindestens einen Wert enthält
+    return (x[starts], open_[starts], np.fmax.reduceat(high, starts), np.fmin.reduceat(low, starts), close[ends],
+            np.add.reduceat(np.nan_to_num(volume), starts) if len(volume) else volume)
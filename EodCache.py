@@ -0,0 +1,148 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Dict, List, Any, Optional
+
+
+class EodCache:
+    """
+    Persistenter SQLite-Cache für Tagesdaten (EOD), indiziert nach Symbol und Datum.
+
+    Pro Symbol wird vermerkt, wann die Historie vollständig geladen und wann sie zuletzt verwendet wurde. Nach Ablauf
+    der TTL wird ein Symbol verworfen und neu geladen (z. B. wegen nachträglich angepasster adj_*-Werte nach Splits).
+    Überschreitet der Cache die maximale Größe, werden die am längsten nicht verwendeten Symbole entfernt.
+    """
+
+    def __init__(self, path: str = "./Cache/eod_cache.sqlite", ttl: float = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024):
+        """
+        :param path: Pfad zur SQLite-Datei.
+        :param ttl: Lebensdauer eines vollständig geladenen Symbols in Sekunden.
+        :param max_bytes: Maximale Größe der gespeicherten Datensätze in Bytes.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS bars ("
+                             "symbol TEXT NOT NULL, date TEXT NOT NULL, payload TEXT NOT NULL, "
+                             "PRIMARY KEY (symbol, date)) WITHOUT ROWID")
+                conn.execute("CREATE TABLE IF NOT EXISTS symbols ("
+                             "symbol TEXT PRIMARY KEY, created_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                             "size_bytes INTEGER NOT NULL DEFAULT 0)")
+            self._initialized = True
+        return conn
+
+    def get(self, symbol: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Gibt alle gecachten Datensätze eines Symbols nach Datum sortiert zurück und zählt Treffer bzw. Fehlschläge.
+
+        :param symbol: Börsensymbol.
+        :return: Liste von Datensätzen oder None, wenn das Symbol nicht (mehr) im Cache liegt.
+        """
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT created_at FROM symbols WHERE symbol = ?", (symbol,)).fetchone()
+            if row is not None and now - row[0] > self.ttl:
+                self._delete_symbol(conn, symbol)
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE symbols SET accessed_at = ? WHERE symbol = ?", (now, symbol))
+            payloads = conn.execute("SELECT payload FROM bars WHERE symbol = ? ORDER BY date",
+                                    (symbol,)).fetchall()
+            self.hits += 1
+        # Ein einziger Parser-Aufruf für alle Zeilen ist deutlich schneller als json.loads pro Zeile
+        return json.loads("[" + ",".join(payload for payload, in payloads) + "]")
+
+    def newest_date(self, symbol: str) -> Optional[str]:
+        """
+        Gibt das Datum (YYYY-MM-DD) des neuesten gecachten Datensatzes zurück.
+
+        :param symbol: Börsensymbol.
+        :return: Datum oder None, wenn keine Daten vorliegen.
+        """
+        with self._lock, closing(self._connect()) as conn:
+            row = conn.execute("SELECT MAX(date) FROM bars WHERE symbol = ?", (symbol,)).fetchone()
+        return row[0] if row and row[0] else None
+
+    def put(self, symbol: str, rows: List[Dict[str, Any]], replace: bool = False):
+        """
+        Speichert Datensätze eines Symbols. Bereits vorhandene Tage werden überschrieben.
+
+        :param symbol: Börsensymbol.
+        :param rows: Datensätze im Format der Marketstack-API.
+        :param replace: Wenn True, wird die bisherige Historie des Symbols vorher verworfen (vollständiges Laden).
+        """
+        now = time.time()
+        entries = [(symbol, str(row.get("date", ""))[:10], json.dumps(row, separators=(",", ":"))) for row in rows]
+        with self._lock, closing(self._connect()) as conn, conn:
+            if replace:
+                self._delete_symbol(conn, symbol)
+            conn.execute("INSERT OR IGNORE INTO symbols (symbol, created_at, accessed_at) VALUES (?, ?, ?)",
+                         (symbol, now, now))
+            conn.executemany("INSERT OR REPLACE INTO bars (symbol, date, payload) VALUES (?, ?, ?)", entries)
+            conn.execute("UPDATE symbols SET accessed_at = ?, size_bytes = "
+                         "(SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM bars WHERE symbol = ?) WHERE symbol = ?",
+                         (now, symbol, symbol))
+            self._evict(conn)
+
+    def discard(self, symbol: str, after: Optional[str] = None):
+        """
+        Verwirft die Historie eines Symbols oder nur die Tage nach einem Datum (z. B. nach einem abgebrochenen Abruf,
+        dessen Seiten bereits gespeichert wurden).
+
+        :param symbol: Börsensymbol.
+        :param after: Datum (YYYY-MM-DD); nur spätere Tage werden entfernt. None verwirft das Symbol vollständig.
+        """
+        with self._lock, closing(self._connect()) as conn, conn:
+            if after is None:
+                self._delete_symbol(conn, symbol)
+                return
+            conn.execute("DELETE FROM bars WHERE symbol = ? AND date > ?", (symbol, after))
+            conn.execute("UPDATE symbols SET size_bytes = "
+                         "(SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM bars WHERE symbol = ?) WHERE symbol = ?",
+                         (symbol, symbol))
+
+    def clear(self):
+        """Leert den Cache vollständig und setzt die Zähler zurück."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM bars")
+            conn.execute("DELETE FROM symbols")
+            self.hits = self.misses = 0
+
+    @staticmethod
+    def _delete_symbol(conn: sqlite3.Connection, symbol: str):
+        conn.execute("DELETE FROM bars WHERE symbol = ?", (symbol,))
+        conn.execute("DELETE FROM symbols WHERE symbol = ?", (symbol,))
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Entfernt abgelaufene Symbole und danach die am längsten unbenutzten, bis die Maximalgröße passt."""
+        for symbol, in conn.execute("SELECT symbol FROM symbols WHERE created_at < ?",
+                                    (time.time() - self.ttl,)).fetchall():
+            self._delete_symbol(conn, symbol)
+
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM symbols").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for symbol, size in conn.execute("SELECT symbol, size_bytes FROM symbols ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._delete_symbol(conn, symbol)
+            total -= size
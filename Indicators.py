@@ -0,0 +1,409 @@
+import re
+from typing import Dict, List, Any, Tuple, Optional
+
+import numpy as np
+
+from ColumnStore import ColumnStore, grow_buffer
+from Metrics import metrics
+
+# Schlüssel eines Indikators: NAME(quelle, parameter, ...), z. B. "SMA(close,20)"
+_INDICATOR_PATTERN = re.compile(r"^([A-Z_]+)\(\s*(\w+)\s*((?:,\s*[\d.]+\s*)*)\)$")
+
+# Handelstage pro Jahr für die annualisierte Volatilität
+TRADING_DAYS = 252
+
+# Indikatoren, die in der Oberfläche zur Auswahl stehen
+DEFAULT_INDICATORS = [
+    "SMA(close,20)", "SMA(close,50)", "SMA(close,200)", "EMA(close,20)", "EMA(close,50)",
+    "BB_UPPER(close,20,2)", "BB_LOWER(close,20,2)", "RSI(close,14)",
+    "MACD(close,12,26)", "MACD_SIGNAL(close,12,26,9)", "MACD_HIST(close,12,26,9)",
+    "RETURN(close)", "LOG_RETURN(close)", "VOLATILITY(close,20)",
+]
+
+
+def _ema(values: np.ndarray, alpha: float, seed: Optional[float] = None) -> np.ndarray:
+    """
+    Exponentiell gleitender Durchschnitt y[t] = alpha * x[t] + (1 - alpha) * y[t - 1].
+
+    :param values: Eingangswerte.
+    :param alpha: Glättungsfaktor.
+    :param seed: Letzter Wert einer bereits berechneten Reihe; die Rekursion wird dann von dort fortgesetzt.
+    :return: Array gleicher Länge wie values.
+    """
+    import pandas as pd
+    if seed is None:
+        return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    # Mit adjust=False ist der erste Wert der Startwert, danach gilt exakt die Rekursion
+    return pd.Series(np.concatenate(([seed], values))).ewm(alpha=alpha, adjust=False).mean().to_numpy()[1:]
+
+
+def _masked(result: np.ndarray, warmup: int) -> np.ndarray:
+    """Setzt die ersten warmup Werte auf NaN; schreibgeschützte Ergebnisse von Pandas werden dafür kopiert."""
+    if not result.flags.writeable:
+        result = result.copy()
+    result[:warmup] = np.nan
+    return result
+
+
+class Indicator:
+    """
+    Basisklasse eines technischen Indikators auf einer Quellspalte.
+
+    compute berechnet die gesamte Historie, extend schreibt eine bereits berechnete Reihe für neu angehängte Werte
+    fort. Fensterbasierte Indikatoren benötigen dafür nur die letzten lookback Werte; rekursive Indikatoren (EMA,
+    RSI, MACD) setzen die Rekursion mit dem gespeicherten Zustand fort. Die neuen Werte werden in einen Puffer mit
+    Reservekapazität geschrieben (Zustand "buffer"), sodass das Fortschreiben nicht die gesamte Historie kopiert.
+    """
+
+    def __init__(self, *params: float):
+        self.params = params
+
+    @property
+    def lookback(self) -> int:
+        """Anzahl Werte, von denen ein einzelner Ergebniswert abhängt."""
+        return 1
+
+    @property
+    def warmup(self) -> int:
+        """Anzahl führender Werte, die mangels Historie NaN bleiben."""
+        return self.lookback - 1
+
+    def _compute(self, values: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def compute(self, values: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Berechnet den Indikator über die gesamte Historie.
+
+        :param values: Quellspalte als float64-Array.
+        :return: Tupel (Ergebnis, Zustand für extend).
+        """
+        return _masked(self._compute(values), self.warmup), {}
+
+    def extend(self, values: np.ndarray, previous: np.ndarray, state: Dict[str, Any]) \
+            -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Berechnet nur die Werte für die neu angehängten Einträge.
+
+        :param values: Vollständige Quellspalte; die ersten len(previous) Werte sind unverändert.
+        :param previous: Bisheriges Ergebnis.
+        :param state: Zustand aus compute bzw. dem letzten extend.
+        :return: Tupel (Ergebnis für die gesamte Historie, neuer Zustand).
+        """
+        n_old = len(previous)
+        start = max(n_old - self.lookback + 1, 0)
+        tail = self._compute(values[start:])[n_old - start:]
+        result, buffer = self._append(previous, tail, state)
+        return result, dict(state, buffer=buffer)
+
+    def _append(self, previous: np.ndarray, tail: np.ndarray, state: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hängt neue Werte über den Puffer aus state an das bisherige Ergebnis an.
+
+        :param previous: Bisheriges Ergebnis; nach einem extend der Anfang des Puffers.
+        :param tail: Werte für die neu angehängten Einträge.
+        :param state: Zustand mit dem bisherigen Puffer (Schlüssel "buffer"), falls vorhanden.
+        :return: Tupel (schreibgeschützte Sicht auf den gefüllten Anfang des Puffers, Puffer).
+        """
+        if len(previous) < self.warmup:
+            tail = _masked(tail, self.warmup - len(previous))
+        buffer = grow_buffer(state.get("buffer"), previous, tail)
+        result = buffer[:len(previous) + len(tail)]
+        result.flags.writeable = False
+        return result, buffer
+
+
+class SMA(Indicator):
+    """Einfacher gleitender Durchschnitt über window Werte."""
+
+    @property
+    def lookback(self) -> int:
+        return int(self.params[0])
+
+    def _compute(self, values: np.ndarray) -> np.ndarray:
+        import pandas as pd
+        return pd.Series(values).rolling(self.lookback).mean().to_numpy()
+
+
+class BollingerBand(Indicator):
+    """Bollinger-Band: gleitender Durchschnitt plus bzw. minus k Standardabweichungen (Parameter window, k)."""
+
+    def __init__(self, *params: float, sign: int = 1):
+        super().__init__(*params)
+        self.sign = sign
+
+    @property
+    def lookback(self) -> int:
+        return int(self.params[0])
+
+    def _compute(self, values: np.ndarray) -> np.ndarray:
+        import pandas as pd
+        rolling = pd.Series(values).rolling(self.lookback)
+        k = self.params[1] if len(self.params) > 1 else 2.0
+        return (rolling.mean() + self.sign * k * rolling.std(ddof=0)).to_numpy()
+
+
+class Return(Indicator):
+    """Einfache Rendite gegenüber dem Vorwert."""
+
+    @property
+    def lookback(self) -> int:
+        return 2
+
+    def _compute(self, values: np.ndarray) -> np.ndarray:
+        result = np.full(len(values), np.nan)
+        result[1:] = values[1:] / values[:-1] - 1
+        return result
+
+
+class LogReturn(Return):
+    """Logarithmische Rendite gegenüber dem Vorwert."""
+
+    def _compute(self, values: np.ndarray) -> np.ndarray:
+        result = np.full(len(values), np.nan)
+        result[1:] = np.log(values[1:] / values[:-1])
+        return result
+
+
+class Volatility(Indicator):
+    """Annualisierte gleitende Volatilität: Standardabweichung der Log-Renditen über window Tage."""
+
+    @property
+    def lookback(self) -> int:
+        return int(self.params[0]) + 1
+
+    def _compute(self, values: np.ndarray) -> np.ndarray:
+        import pandas as pd
+        log_returns = LogReturn()._compute(values)
+        return (pd.Series(log_returns).rolling(self.lookback - 1).std() * np.sqrt(TRADING_DAYS)).to_numpy()
+
+
+class EMA(Indicator):
+    """Exponentiell gleitender Durchschnitt mit Spanne span (alpha = 2 / (span + 1))."""
+
+    @property
+    def warmup(self) -> int:
+        return int(self.params[0]) - 1
+
+    def compute(self, values: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        raw = _ema(values, 2 / (self.params[0] + 1))
+        return _masked(raw.copy(), self.warmup), {"ema": raw[-1] if len(raw) else None}
+
+    def extend(self, values: np.ndarray, previous: np.ndarray, state: Dict[str, Any]) \
+            -> Tuple[np.ndarray, Dict[str, Any]]:
+        tail = _ema(values[len(previous):], 2 / (self.params[0] + 1), state["ema"])
+        result, buffer = self._append(previous, tail, state)
+        return result, {"ema": tail[-1], "buffer": buffer}
+
+
+class RSI(Indicator):
+    """Relative Strength Index nach Wilder über period Werte."""
+
+    @property
+    def warmup(self) -> int:
+        return int(self.params[0])
+
+    def _rsi(self, values: np.ndarray, last: Optional[float], gain: Optional[float], loss: Optional[float]):
+        delta = np.diff(values, prepend=np.nan if last is None else last)
+        alpha = 1 / self.params[0]
+        avg_gain = _ema(np.clip(delta, 0, None), alpha, gain)
+        avg_loss = _ema(np.clip(-delta, 0, None), alpha, loss)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        state = {"last": values[-1], "gain": avg_gain[-1], "loss": avg_loss[-1]} if len(values) else {}
+        return rsi, state
+
+    def compute(self, values: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        if not len(values):
+            return np.empty(0), {}
+        rsi, state = self._rsi(values, None, None, None)
+        return _masked(rsi, self.warmup), state
+
+    def extend(self, values: np.ndarray, previous: np.ndarray, state: Dict[str, Any]) \
+            -> Tuple[np.ndarray, Dict[str, Any]]:
+        tail, new_state = self._rsi(values[len(previous):], state["last"], state["gain"], state["loss"])
+        result, buffer = self._append(previous, tail, state)
+        return result, dict(new_state, buffer=buffer)
+
+
+class MACD(Indicator):
+    """
+    Moving Average Convergence Divergence (Parameter fast, slow, signal). part wählt die Linie: "macd" (EMA fast
+    minus EMA slow), "signal" (EMA der MACD-Linie) oder "hist" (MACD minus Signal).
+    """
+
+    def __init__(self, *params: float, part: str = "macd"):
+        super().__init__(*params)
+        self.part = part
+
+    @property
+    def warmup(self) -> int:
+        warmup = int(self.params[1]) - 1
+        return warmup + int(self.params[2]) - 1 if self.part != "macd" else warmup
+
+    def _macd(self, values: np.ndarray, state: Dict[str, Any]):
+        fast = _ema(values, 2 / (self.params[0] + 1), state.get("fast"))
+        slow = _ema(values, 2 / (self.params[1] + 1), state.get("slow"))
+        macd = fast - slow
+        new_state = {"fast": fast[-1], "slow": slow[-1]} if len(values) else dict(state)
+        if self.part == "macd":
+            return macd, new_state
+        signal = _ema(macd, 2 / (self.params[2] + 1), state.get("signal"))
+        if len(values):
+            new_state["signal"] = signal[-1]
+        return (signal if self.part == "signal" else macd - signal), new_state
+
+    def compute(self, values: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        result, state = self._macd(values, {})
+        return _masked(result, self.warmup), state
+
+    def extend(self, values: np.ndarray, previous: np.ndarray, state: Dict[str, Any]) \
+            -> Tuple[np.ndarray, Dict[str, Any]]:
+        tail, new_state = self._macd(values[len(previous):], state)
+        result, buffer = self._append(previous, tail, state)
+        return result, dict(new_state, buffer=buffer)
+
+
+# Zuordnung von Indikatorname zu (Fabrik, Standardparameter); die Parameter folgen im Schlüssel auf die Quellspalte
+INDICATORS = {
+    "SMA": (SMA, (20,)),
+    "EMA": (EMA, (20,)),
+    "BB_UPPER": (lambda *params: BollingerBand(*params, sign=1), (20, 2)),
+    "BB_LOWER": (lambda *params: BollingerBand(*params, sign=-1), (20, 2)),
+    "RSI": (RSI, (14,)),
+    "MACD": (lambda *params: MACD(*params, part="macd"), (12, 26, 9)),
+    "MACD_SIGNAL": (lambda *params: MACD(*params, part="signal"), (12, 26, 9)),
+    "MACD_HIST": (lambda *params: MACD(*params, part="hist"), (12, 26, 9)),
+    "RETURN": (Return, ()),
+    "LOG_RETURN": (LogReturn, ()),
+    "VOLATILITY": (Volatility, (20,)),
+}
+
+
+def parse_key(key: str) -> Optional[Tuple[str, str, Tuple[float, ...]]]:
+    """
+    Zerlegt einen Indikator-Schlüssel wie "BB_UPPER(close,20,2)".
+
+    :param key: Schlüssel.
+    :return: Tupel (Name, Quellspalte, Parameter) oder None, wenn der Schlüssel kein bekannter Indikator ist.
+        Fehlende Parameter werden mit den Standardwerten ergänzt.
+    """
+    match = _INDICATOR_PATTERN.match(key.replace(" ", ""))
+    if match is None or match.group(1) not in INDICATORS:
+        return None
+    defaults = INDICATORS[match.group(1)][1]
+    try:
+        params = tuple(float(value) for value in match.group(3).split(",") if value)
+    except ValueError:
+        return None
+    if len(params) > len(defaults) or any(value <= 0 for value in params):
+        return None
+    return match.group(1), match.group(2), params + defaults[len(params):]
+
+
+class IndicatorEngine:
+    """
+    Berechnet abgeleitete Spalten (Indikatoren) bei der ersten Anfrage und merkt sie sich je Symbol und Schlüssel
+    (der Schlüssel enthält die Parameter).
+
+    Wird ein Datensatz später um neue Tage verlängert (gleiche Historie, zusätzliche Einträge am Ende), werden nur
+    die neuen Werte berechnet. Ob die Historie gleich geblieben ist, wird am ersten und letzten bekannten Eintrag
+    (Datum und Quellwert) erkannt; andernfalls wird vollständig neu berechnet.
+    """
+
+    def __init__(self):
+        # (Symbol, Schlüssel) -> (Ergebnis, Zustand, Kennung der zugrunde liegenden Historie)
+        self._memo: Dict[Tuple[str, str], Tuple[np.ndarray, Dict[str, Any], Tuple]] = {}
+
+    @staticmethod
+    def is_indicator(key: str) -> bool:
+        """
+        Prüft, ob ein Schlüssel einen bekannten Indikator beschreibt.
+
+        :param key: Schlüssel, z. B. "RSI(close,14)".
+        :return: True, wenn der Schlüssel berechnet werden kann.
+        """
+        return parse_key(key) is not None
+
+    @staticmethod
+    def available(store: ColumnStore) -> List[str]:
+        """
+        Gibt die Standard-Indikatoren zurück, deren Quellspalte im Speicher vorhanden ist.
+
+        :param store: Spaltenspeicher.
+        :return: Liste von Schlüsseln.
+        """
+        return [key for key in DEFAULT_INDICATORS if parse_key(key)[1] in store]
+
+    def compute(self, store: ColumnStore, key: str, symbol: str = "") -> np.ndarray:
+        """
+        Gibt die Werte eines Indikators als schreibgeschütztes float64-Array zurück.
+
+        :param store: Nach Datum sortierter Spaltenspeicher.
+        :param key: Indikator-Schlüssel, z. B. "SMA(close,20)".
+        :param symbol: Symbol des Speichers; Ergebnisse werden pro Symbol gemerkt.
+        :return: Array mit einem Wert pro Zeile; leer, wenn die Quellspalte fehlt.
+        :raises ValueError: Wenn der Schlüssel kein bekannter Indikator ist oder die Quellspalte nicht numerisch ist.
+        """
+        parsed = parse_key(key)
+        if parsed is None:
+            raise ValueError(f"Unbekannter Indikator: {key}")
+        name, source, params = parsed
+        if source not in store:
+            return np.empty(0, dtype=np.float64)
+        values = store.plottable(source)
+        if values.dtype.kind != "f":
+            raise ValueError(f"Die Quellspalte '{source}' ist nicht numerisch.")
+        dates = store.column("date")
+
+        memo_key = (symbol, key)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            result, state, fingerprint = cached
+            n_old = len(result)
+            if 0 < n_old <= len(values) and self._fingerprint(values, dates, n_old) == fingerprint:
+                if n_old == len(values):
+                    return result
+                with metrics.timer("indicators.extend"):
+                    result, state = INDICATORS[name][0](*params).extend(values, result, state)
+                return self._remember(memo_key, result, state, values, dates)
+
+        with metrics.timer("indicators.compute"):
+            result, state = INDICATORS[name][0](*params).compute(values)
+        return self._remember(memo_key, result, state, values, dates)
+
+    @staticmethod
+    def _fingerprint(values: np.ndarray, dates: np.ndarray, n: int) -> Tuple:
+        """Kennung der ersten n Einträge aus erstem und letztem Datum und Quellwert (NaN wird zu None)."""
+        edges = [0, n - 1]
+        samples = [None if np.isnan(values[i]) else float(values[i]) for i in edges]
+        if len(dates):
+            samples += [dates[i] for i in edges]
+        return tuple(samples)
+
+    def _remember(self, memo_key: Tuple[str, str], result: np.ndarray, state: Dict[str, Any], values: np.ndarray,
+                  dates: np.ndarray) -> np.ndarray:
+        result.flags.writeable = False
+        fingerprint = self._fingerprint(values, dates, len(values)) if len(values) else ()
+        self._memo[memo_key] = (result, state, fingerprint)
+        return result
+
+    def clear(self, symbol: Optional[str] = None):
+        """
+        Verwirft gemerkte Ergebnisse.
+
+        :param symbol: Nur die Ergebnisse dieses Symbols; standardmäßig alle.
+        """
+        if symbol is None:
+            self._memo.clear()
+        else:
+            self._memo = {key: value for key, value in self._memo.items() if key[0] != symbol}
+
+    def nbytes(self, symbol: Optional[str] = None) -> int:
+        """
+        Speicherbedarf der gemerkten Ergebnisse in Bytes, einschließlich der Reservekapazität fortgeschriebener Puffer.
+
+        :param symbol: Nur die Ergebnisse dieses Symbols; standardmäßig alle.
+        """
+        return sum(state.get("buffer", result).nbytes for (memo_symbol, _), (result, state, _)
+                   in list(self._memo.items()) if symbol is None or memo_symbol == symbol)
@@ -19,21 +19,25 @@ Installation via pip:
 """
 
 import datetime
-import json
 import os
 import sys
 import warnings
 
-import pandas as pd
 import qdarkstyle
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QThreadPool, QDate, QTimer
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QFileDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                                QLabel, QComboBox, QSplitter, QLineEdit, QGroupBox, QCheckBox, QMenu, QMenuBar, QToolBar,
-                               QFrame, QColorDialog, QStatusBar, QSizePolicy, QSpacerItem)
+                               QFrame, QColorDialog, QStatusBar, QSizePolicy, QSpacerItem, QProgressBar, QDateEdit,
+                               QSpinBox, QStackedWidget, QInputDialog)
 
+import ColumnarFiles
+from ColumnStore import ColumnStore
 from DataManager import DataManager
-from PlotCanvas import PlotCanvas
+from EodCache import EodCache
+from Metrics import metrics
+from PerformanceDialog import PerformanceDialog
+from Workers import Worker
 
 warnings.filterwarnings("ignore", message="Selected binding 'pyqt5' could not be found")
 
@@ -43,11 +47,38 @@ class MainWindow(QMainWindow):
     Hauptfenster der Anwendung.
     """
 
+    # Voreingestellte Zeiträume in Monaten vor dem letzten geladenen Tag (None = gesamte Historie)
+    RANGE_PRESETS = {"Alles": None, "5 Jahre": 60, "1 Jahr": 12, "6 Monate": 6, "Quartal": 3, "Monat": 1}
+    CUSTOM_RANGE = "Benutzerdefiniert"
+    # Live-Modus: Standardintervall und längste Wartezeit nach wiederholten Fehlern (jeweils in Sekunden)
+    LIVE_INTERVAL = 60
+    LIVE_MAX_BACKOFF = 15 * 60
+    # Raster des Dashboards als (Zeilen, Spalten)
+    DASHBOARD_GRIDS = {"2×2": (2, 2), "2×3": (2, 3), "3×4": (3, 4)}
+    # Fensterlänge des rollierenden Betas in Handelstagen
+    BETA_WINDOW = 60
+
     def __init__(self):
         super().__init__()
         self.status_timeout = 5000
         self.setWindowTitle("Modern Data Plotter")
-        self.data_manager = DataManager()
+        self.data_manager = DataManager(cache=EodCache())
+        self.thread_pool = QThreadPool.globalInstance()
+        self.load_worker = None
+        self.load_success_message = ""
+        self.load_id = 0
+        self.active_workers = {}
+        # Laufender Export im Hintergrund (höchstens einer)
+        self.export_worker = None
+        # Angezeigter Zeitraum (erster Tag, letzter Tag), jeweils inklusive; None = offen
+        self.date_range = (None, None)
+        self.custom_plot_active = False
+        # Live-Modus: Timer für die nächste Abfrage und aktuelle Wartezeit (verdoppelt sich nach Fehlern)
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.timeout.connect(self.poll_live)
+        self.live_delay = self.LIVE_INTERVAL
+        self.performance_dialog = None
         self.common_symbols = [
             "AAPL", "MSFT", "AMZN", "GOOGL", "FB", "TSLA", "BRK.B", "JNJ", "V", "WMT",
             "JPM", "NVDA", "PG", "MA", "HD", "UNH", "DIS", "BAC", "VZ", "ADBE",
@@ -74,6 +105,8 @@ class MainWindow(QMainWindow):
         self.combo_symbols = QComboBox()
         self.combo_symbols.addItems(self.common_symbols)
         self.combo_symbols.setFixedWidth(80)
+        # Bereits geladene Symbole werden beim Wechsel sofort aus dem Arbeitsspeicher angezeigt
+        self.combo_symbols.currentTextChanged.connect(self.switch_symbol)
         tool_bar_layout.addWidget(self.combo_symbols)
 
         # Textfeld für ein eigenes Symbol
@@ -88,11 +121,49 @@ class MainWindow(QMainWindow):
         self.btn_load_api.clicked.connect(self.load_data_api)
         tool_bar_layout.addWidget(self.btn_load_api)
 
+        self.btn_load_basket = QPushButton("Alle Symbole laden")
+        self.btn_load_basket.setIcon(QIcon.fromTheme("folder-download"))
+        self.btn_load_basket.setToolTip("Lädt alle Symbole der Liste mit einer gebündelten Anfrage")
+        self.btn_load_basket.clicked.connect(self.load_data_api_basket)
+        tool_bar_layout.addWidget(self.btn_load_basket)
+
         self.btn_load_file = QPushButton("Daten aus Datei laden")
         self.btn_load_file.setIcon(QIcon.fromTheme("document-open"))
         self.btn_load_file.clicked.connect(self.load_data_file)
         tool_bar_layout.addWidget(self.btn_load_file)
 
+        self.btn_cancel_load = QPushButton("Abbrechen")
+        self.btn_cancel_load.setIcon(QIcon.fromTheme("process-stop"))
+        self.btn_cancel_load.setEnabled(False)
+        self.btn_cancel_load.clicked.connect(self.cancel_load)
+        tool_bar_layout.addWidget(self.btn_cancel_load)
+
+        # Live-Modus: regelmäßige Abfrage neuer Kurse für das geladene Symbol
+        self.check_live = QCheckBox("Live")
+        self.check_live.setToolTip("Fragt die API regelmäßig nach neuen Kursen ab und hängt sie an die Daten an")
+        self.check_live.toggled.connect(self.toggle_live)
+        tool_bar_layout.addWidget(self.check_live)
+
+        self.spin_live_interval = QSpinBox()
+        self.spin_live_interval.setRange(10, 3600)
+        self.spin_live_interval.setValue(self.LIVE_INTERVAL)
+        self.spin_live_interval.setSuffix(" s")
+        self.spin_live_interval.setToolTip("Abfrageintervall im Live-Modus")
+        tool_bar_layout.addWidget(self.spin_live_interval)
+
+        # Dashboard: Kurs, Volumen, Indikatoren und Vergleichssymbole in einem Raster mit gemeinsamer x-Achse
+        self.check_dashboard = QCheckBox("Dashboard")
+        self.check_dashboard.setToolTip("Zeigt Kurs, Volumen, Indikatoren und weitere geladene Symbole in einem "
+                                        "Raster mit gemeinsamer Zeitachse")
+        self.check_dashboard.toggled.connect(self.toggle_dashboard)
+        tool_bar_layout.addWidget(self.check_dashboard)
+
+        self.combo_dashboard = QComboBox()
+        self.combo_dashboard.addItems(list(self.DASHBOARD_GRIDS))
+        self.combo_dashboard.setToolTip("Raster des Dashboards (Zeilen × Spalten)")
+        self.combo_dashboard.currentTextChanged.connect(lambda grid: self.update_dashboard())
+        tool_bar_layout.addWidget(self.combo_dashboard)
+
         main_layout.addLayout(tool_bar_layout)
 
         # GroupBox für Plot-Einstellungen
@@ -123,6 +194,29 @@ class MainWindow(QMainWindow):
 
         settings_layout.addLayout(ax_selection_layout)
 
+        # Zeitraum für beide Plots: Voreinstellung relativ zum letzten Tag oder frei wählbare Grenzen
+        range_layout = QHBoxLayout()
+        range_layout.addWidget(QLabel("Zeitraum:"))
+        self.combo_range = QComboBox()
+        self.combo_range.addItems(list(self.RANGE_PRESETS) + [self.CUSTOM_RANGE])
+        self.combo_range.currentTextChanged.connect(self.on_range_preset_changed)
+        range_layout.addWidget(self.combo_range)
+
+        range_layout.addWidget(QLabel("Von:"))
+        self.date_from = QDateEdit(calendarPopup=True)
+        self.date_from.setDisplayFormat("dd.MM.yyyy")
+        self.date_from.dateChanged.connect(self.on_range_dates_changed)
+        range_layout.addWidget(self.date_from)
+
+        range_layout.addWidget(QLabel("Bis:"))
+        self.date_to = QDateEdit(calendarPopup=True)
+        self.date_to.setDisplayFormat("dd.MM.yyyy")
+        self.date_to.dateChanged.connect(self.on_range_dates_changed)
+        range_layout.addWidget(self.date_to)
+
+        range_layout.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        settings_layout.addLayout(range_layout)
+
         ax_titel_layout = QHBoxLayout()
 
         self.lineedit_xlabel = QLineEdit()
@@ -140,7 +234,7 @@ class MainWindow(QMainWindow):
 
         # Diagrammtyp
         self.combo_diagram_typ = QComboBox()
-        self.combo_diagram_typ.addItems(["Linie", "Scatter", "Bar"])
+        self.combo_diagram_typ.addItems(["Linie", "Scatter", "Bar", "Kerzen", "Heatmap"])
         diagramm_settings_layout.addWidget(QLabel("Diagrammtyp:"))
         diagramm_settings_layout.addWidget(self.combo_diagram_typ)
 
@@ -150,6 +244,10 @@ class MainWindow(QMainWindow):
             if self.selected_color.isValid():
                 color_indicator_frame.setStyleSheet(
                     f"background-color: {self.selected_color.name()}; border: 1px solid #000;")
+                # Ein bereits erstellter Custom Plot wird direkt aktualisiert; eine reine Farbänderung kostet nur
+                # ein Blitting. Ohne Custom Plot wird die Farbe erst beim nächsten Plotten verwendet.
+                if self.custom_plot_active and self.data_manager.has_data() and not self.check_dashboard.isChecked():
+                    self.update_custom_plot()
 
         diagramm_settings_layout.addWidget(QLabel("Farbe auswählen:"))
         self.color_button = QPushButton()
@@ -201,25 +299,78 @@ class MainWindow(QMainWindow):
         # Splitter für zwei Plot-Bereiche: Standard und Custom
         splitter = QSplitter(Qt.Horizontal)
 
-        # Standard Plot (Date vs Close)
-        self.standard_plot = PlotCanvas(self, width=5, height=4)
-        std_plot_container = QWidget()
-        std_layout = QVBoxLayout(std_plot_container)
-        std_layout.addWidget(QLabel("Standard Plot (Date vs. Close)"))
-        std_layout.addWidget(self.standard_plot)
-        splitter.addWidget(std_plot_container)
-
-        # Custom Plot
-        self.custom_plot = PlotCanvas(self, width=5, height=4)
-        custom_plot_container = QWidget()
-        custom_layout = QVBoxLayout(custom_plot_container)
-        custom_layout.addWidget(QLabel("Benutzerdefinierter Plot"))
-        custom_layout.addWidget(self.custom_plot)
-        splitter.addWidget(custom_plot_container)
-
-        main_layout.addWidget(splitter)
+        # Die Plot-Canvases werden erst bei der ersten Verwendung erzeugt (siehe plot_canvas), damit Matplotlib nicht
+        # schon beim Start importiert wird; bis dahin steht ein Platzhalter an ihrer Stelle
+        self.plot_slots = {}
+        self.canvases = {}
+        splitter.addWidget(self.create_plot_container("standard_plot", "Standard Plot (Date vs. Close)"))
+        splitter.addWidget(self.create_plot_container("custom_plot", "Benutzerdefinierter Plot"))
+
+        # Im Dashboard-Modus ersetzt ein einzelner Canvas mit allen Panels die beiden Plots
+        self.plot_stack = QStackedWidget()
+        self.plot_stack.addWidget(splitter)
+        self.plot_stack.addWidget(self.create_plot_container("dashboard", "Dashboard"))
+        main_layout.addWidget(self.plot_stack)
         self.resize(1300, 700)
 
+    def create_plot_container(self, name: str, title: str) -> QWidget:
+        """
+        Erstellt den Bereich eines Plots mit Überschrift und einem Platzhalter für den Canvas.
+
+        :param name: Name des Plots ("standard_plot", "custom_plot" oder "dashboard").
+        :param title: Überschrift über dem Plot.
+        :return: Container-Widget für den Splitter bzw. das Dashboard.
+        """
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.addWidget(QLabel(title))
+        placeholder = QLabel("Noch keine Daten geladen")
+        placeholder.setAlignment(Qt.AlignCenter)
+        placeholder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        layout.addWidget(placeholder)
+        self.plot_slots[name] = (container, layout, placeholder)
+        return container
+
+    def plot_canvas(self, name: str):
+        """
+        Gibt den Canvas eines Plots zurück. Beim ersten Aufruf werden Matplotlib und der PlotCanvas (bzw. der
+        DashboardCanvas) importiert, der Canvas samt Navigationsleiste erzeugt und anstelle des Platzhalters
+        eingesetzt.
+
+        :param name: Name des Plots ("standard_plot", "custom_plot" oder "dashboard").
+        :return: PlotCanvas oder DashboardCanvas.
+        """
+        canvas = self.canvases.get(name)
+        if canvas is None:
+            from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
+
+            container, layout, placeholder = self.plot_slots[name]
+            if name == "dashboard":
+                from DashboardCanvas import DashboardCanvas
+                canvas = self.canvases[name] = DashboardCanvas(self, width=10, height=6)
+            else:
+                from PlotCanvas import PlotCanvas
+                canvas = self.canvases[name] = PlotCanvas(self, width=5, height=4)
+            layout.replaceWidget(placeholder, canvas)
+            placeholder.deleteLater()
+            layout.addWidget(NavigationToolbar2QT(canvas, container))
+        return canvas
+
+    @property
+    def standard_plot(self):
+        """Standard Plot (Date vs. Close), wird beim ersten Zugriff erzeugt."""
+        return self.plot_canvas("standard_plot")
+
+    @property
+    def custom_plot(self):
+        """Benutzerdefinierter Plot, wird beim ersten Zugriff erzeugt."""
+        return self.plot_canvas("custom_plot")
+
+    @property
+    def dashboard_plot(self):
+        """Dashboard mit allen Panels, wird beim ersten Zugriff erzeugt."""
+        return self.plot_canvas("dashboard")
+
     def create_menu(self):
         """Erstellt das Menü und die zugehörigen Aktionen."""
         menu_bar = QMenuBar()
@@ -245,11 +396,49 @@ class MainWindow(QMainWindow):
         save_csv_act.setShortcut("Ctrl+C")
         file_menu.addAction(save_csv_act)
 
+        save_binary_act = QAction(QIcon("icons/csv-svgrepo-com.svg"), "Daten binär speichern (Parquet/Feather/NPZ)",
+                                  self)
+        save_binary_act.triggered.connect(self.save_data_binary)
+        save_binary_act.setShortcut("Ctrl+B")
+        file_menu.addAction(save_binary_act)
+
         file_menu.addSeparator()
         exit_act = QAction(QIcon.fromTheme("application-exit"), "Beenden", self)
         exit_act.triggered.connect(self.close)
         file_menu.addAction(exit_act)
 
+        # Analyse Menü: Auswertungen über mehrere geladene Symbole
+        analysis_menu = QMenu("Analyse", self)
+        menu_bar.addMenu(analysis_menu)
+
+        correlation_act = QAction("Korrelationsmatrix der geladenen Symbole", self)
+        correlation_act.triggered.connect(self.show_correlation)
+        analysis_menu.addAction(correlation_act)
+
+        beta_act = QAction("Rollierendes Beta gegenüber ...", self)
+        beta_act.triggered.connect(self.show_rolling_beta)
+        analysis_menu.addAction(beta_act)
+
+        # Extras Menü: Laufzeitmessungen und Profilaufzeichnung
+        extras_menu = QMenu("Extras", self)
+        menu_bar.addMenu(extras_menu)
+
+        performance_act = QAction(QIcon.fromTheme("utilities-system-monitor"), "Performance ...", self)
+        performance_act.triggered.connect(self.show_performance)
+        performance_act.setShortcut("Ctrl+P")
+        extras_menu.addAction(performance_act)
+
+        extras_menu.addSeparator()
+        self.profile_cpu_act = QAction("CPU-Profil des nächsten Vorgangs aufzeichnen (cProfile)", self,
+                                       checkable=True)
+        self.profile_cpu_act.toggled.connect(self.update_profile_capture)
+        extras_menu.addAction(self.profile_cpu_act)
+
+        self.profile_memory_act = QAction("Speicherprofil des nächsten Vorgangs aufzeichnen (tracemalloc)", self,
+                                          checkable=True)
+        self.profile_memory_act.toggled.connect(self.update_profile_capture)
+        extras_menu.addAction(self.profile_memory_act)
+
         # Toolbar und Statusleiste
         tool_bar = QToolBar("Hauptwerkzeuge")
         tool_bar.setIconSize(QSize(30, 30))
@@ -262,6 +451,26 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Bereit", self.status_timeout)
         self.setStatusBar(self.status_bar)
 
+        # Permanente Anzeige der Cache-Statistik
+        self.cache_label = QLabel()
+        self.cache_label.setStyleSheet("color: cyan;")
+        self.status_bar.addPermanentWidget(self.cache_label)
+        self.update_cache_label()
+
+        # Permanente Anzeige der letzten Lade- und Zeichendauer; wird jede Sekunde aus den Metriken aktualisiert
+        self.perf_label = QLabel()
+        self.perf_label.setStyleSheet("color: #a0a0a0;")
+        self.status_bar.addPermanentWidget(self.perf_label)
+        self.perf_timer = QTimer(self)
+        self.perf_timer.timeout.connect(self.update_perf_label)
+        self.perf_timer.start(1000)
+
+        # Fortschrittsanzeige für Ladevorgänge im Hintergrund
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(150)
+        self.progress_bar.hide()
+        self.status_bar.addPermanentWidget(self.progress_bar)
+
         self.addToolBar(Qt.BottomToolBarArea, tool_bar)
 
         tool_bar.addAction(save_plot_act)
@@ -282,6 +491,55 @@ class MainWindow(QMainWindow):
             self.status_bar.setStyleSheet(f"color: {status}; font-weight: bold;")
         self.status_bar.showMessage(message, timeout)
 
+    def update_cache_label(self):
+        """
+        Zeigt die Treffer und Fehlschläge des API-Caches sowie die im Arbeitsspeicher gehaltenen Datensätze in der
+        Statusleiste an.
+        """
+        parts = []
+        cache = self.data_manager.cache
+        if cache is not None:
+            parts.append(f"Cache: {cache.hits} Treffer / {cache.misses} Fehlschläge")
+        datasets = self.data_manager.datasets
+        if len(datasets):
+            parts.append(f"Speicher: {len(datasets)} Datensätze, {datasets.nbytes / 2 ** 20:.1f} MB")
+        self.cache_label.setText("  |  ".join(parts))
+
+    def update_perf_label(self):
+        """Zeigt die letzte Lade- und Zeichendauer an und meldet fertig geschriebene Profile."""
+        histograms = metrics.snapshot()["histograms"]
+        parts = []
+        for label, names in (("Laden", ("api.fetch", "file.parse")), ("Plot", ("plot.build",)),
+                             ("Zeichnen", ("plot.draw",))):
+            values = [histograms[name]["last_ms"] for name in names if name in histograms]
+            if values:
+                parts.append(f"{label} {max(values):.0f} ms")
+        self.perf_label.setText(" | ".join(parts))
+
+        captures = metrics.take_captures()
+        if captures:
+            for action in (self.profile_cpu_act, self.profile_memory_act):
+                action.blockSignals(True)
+                action.setChecked(False)
+                action.blockSignals(False)
+            self.update_status("success", f"Profil gespeichert: {', '.join(captures)}", 15000)
+
+    def update_profile_capture(self):
+        """Fordert gemäß den Menüeinträgen ein Profil für den nächsten Vorgang an oder verwirft die Anforderung."""
+        cpu, memory = self.profile_cpu_act.isChecked(), self.profile_memory_act.isChecked()
+        if cpu or memory:
+            metrics.capture_next("./Profiles", cpu=cpu, memory=memory)
+            self.update_status("info", "Der nächste Vorgang (Laden, Plotten ...) wird profiliert.")
+        else:
+            metrics.cancel_capture()
+
+    def show_performance(self):
+        """Öffnet den Performance-Dialog mit den gesammelten Laufzeiten und Zählern."""
+        if self.performance_dialog is None:
+            self.performance_dialog = PerformanceDialog(metrics, self)
+        self.performance_dialog.show()
+        self.performance_dialog.raise_()
+
     def load_data_api(self):
         """Lädt Daten aus der API und aktualisiert die UI-Komponenten."""
         access_key = os.getenv("API_KEY")  # Ersetze diesen Platzhalter mit deinem API-Schlüssel.
@@ -291,31 +549,313 @@ class MainWindow(QMainWindow):
         if not symbol:
             symbol = self.combo_symbols.currentText()
 
-        # Optionale API-Parameter
-        params = {"sort": "DESC", "limit": 100, "offset": 0}
-        if self.data_manager.load_from_api(access_key, symbol, **params):
-            self.populate_combos()
-            self.plot_standard()
-            self.update_status("success", f"{symbol} wurde erfolgreich geladen.")
-        else:
-            self.update_status("error", "Fehler beim Laden der API-Daten.")
+        # Optionale API-Parameter; "limit" ist die Seitengröße, es werden alle Seiten geladen
+        params = {"sort": "DESC", "limit": 1000}
+        self.start_load(self.data_manager.fetch_api, f"{symbol} wird geladen ...", f"{symbol} wurde erfolgreich geladen.",
+                        access_key, symbol, **params)
+
+    def switch_symbol(self, symbol: str):
+        """
+        Zeigt ein kürzlich geladenes Symbol ohne erneutes Laden an. Liegt es nicht mehr im Arbeitsspeicher, muss es
+        wie bisher über "Daten von API laden" geladen werden.
+
+        :param symbol: Gewähltes Symbol.
+        """
+        if self.load_worker is not None or symbol == self.data_manager.get_symbol():
+            return
+        if not self.data_manager.activate(symbol):
+            self.update_cache_label()
+            return
+        self.populate_combos()
+        self.update_range_controls()
+        self.plot_standard()
+        self.update_cache_label()
+        self.update_status("success", f"{symbol} wurde aus dem Arbeitsspeicher angezeigt.")
+
+    def load_data_api_basket(self):
+        """Lädt alle Symbole der Dropdown-Liste mit einer gebündelten API-Anfrage."""
+        access_key = os.getenv("API_KEY")
+        params = {"sort": "DESC", "limit": 1000}
+        self.start_load(self.data_manager.fetch_api_batch, f"{len(self.common_symbols)} Symbole werden geladen ...",
+                        f"{len(self.common_symbols)} Symbole wurden erfolgreich geladen.",
+                        access_key, self.common_symbols, **params)
 
     def load_data_file(self):
         """Öffnet einen Dateidialog, um eine JSON-Datei auszuwählen, und lädt die Daten."""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Datei auswählen", "", "JSON Files (*.json);;CSV Files (*.csv)"
+            self, "Datei auswählen", "",
+            "Alle unterstützten Dateien (*.json *.csv *.json.gz *.csv.gz *.npz *.feather *.arrow *.parquet);;"
+            "JSON Files (*.json *.json.gz);;CSV Files (*.csv *.csv.gz);;NumPy Files (*.npz);;"
+            "Feather Files (*.feather *.arrow);;Parquet Files (*.parquet)"
         )
 
         if file_path:
+            self.start_load(self.data_manager.read_file, f"{os.path.basename(file_path)} wird geladen ...",
+                            "Daten wurden erfolgreich geladen.", file_path, preview=True)
+
+    def start_load(self, fn, message: str, success_message: str, *args, **kwargs):
+        """
+        Startet einen Ladevorgang im Hintergrund. Ein bereits laufender Ladevorgang wird abgebrochen.
+
+        :param fn: Ladefunktion, die einen ColumnStore oder ein Dict von Symbol zu ColumnStore zurückgibt
+            (z. B. DataManager.fetch_api oder DataManager.fetch_api_batch).
+        :param message: Statusmeldung während des Ladens.
+        :param success_message: Statusmeldung nach erfolgreichem Laden.
+        :param args: Positionsargumente für die Ladefunktion.
+        :param kwargs: Keyword-Argumente für die Ladefunktion. Mit preview=True erhält sie einen Callback für eine
+            Vorschau, die vor dem Ende des Ladens im Standardplot angezeigt wird.
+        """
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+
+        # Jeder Ladevorgang erhält eine eigene ID, damit Ergebnisse abgebrochener Vorgänge ignoriert werden
+        self.load_id += 1
+        load_id = self.load_id
+        worker = Worker(fn, *args, **kwargs)
+        worker.signals.progress.connect(lambda done, total: self.on_load_progress(load_id, done, total))
+        worker.signals.preview.connect(lambda store: self.on_load_preview(load_id, store))
+        worker.signals.finished.connect(lambda store: self.on_load_finished(load_id, store))
+        worker.signals.error.connect(lambda error: self.on_load_error(load_id, error))
+        # Der Worker muss referenziert bleiben, bis er tatsächlich beendet ist
+        worker.signals.done.connect(lambda: self.active_workers.pop(load_id, None))
+        self.active_workers[load_id] = worker
+        self.load_worker = worker
+        self.load_success_message = success_message
+
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.btn_cancel_load.setEnabled(True)
+        self.update_status("info", message, 0)
+        self.thread_pool.start(worker)
+
+    def cancel_load(self):
+        """
+        Bricht den laufenden Ladevorgang ab (ohne Ladevorgang einen laufenden Export). Die Oberfläche wird sofort
+        wieder freigegeben.
+        """
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.load_worker = None
+            self.finish_load()
+            self.update_status("warning", "Ladevorgang wurde abgebrochen.")
+        elif self.export_worker is not None:
+            self.export_worker.cancel()
+            self.update_status("info", "Export wird abgebrochen ...", 0)
+
+    def start_export(self, fn, message: str, success_message: str, *args, **kwargs):
+        """
+        Startet einen Export im Hintergrund. Fortschrittsanzeige und Abbrechen-Button werden mit dem Laden geteilt;
+        läuft gleichzeitig ein Ladevorgang, zeigen sie dessen Fortschritt.
+
+        :param fn: Exportfunktion mit den Keyword-Argumenten progress und cancel_event (z. B.
+            DataManager.save_json oder PlotFigure.save_snapshot).
+        :param message: Statusmeldung während des Exports.
+        :param success_message: Statusmeldung nach erfolgreichem Export.
+        :param args: Positionsargumente für die Exportfunktion.
+        :param kwargs: Keyword-Argumente für die Exportfunktion.
+        """
+        if self.export_worker is not None:
+            self.update_status("warning", "Es läuft bereits ein Export.")
+            return
+        worker = Worker(fn, *args, **kwargs)
+        worker.signals.progress.connect(self.on_export_progress)
+        worker.signals.finished.connect(lambda result: self.finish_export("success", success_message))
+        worker.signals.error.connect(
+            lambda error: self.finish_export("error", f"Fehler beim Speichern: {error}"))
+        worker.signals.cancelled.connect(lambda: self.finish_export("warning", "Export wurde abgebrochen."))
+        worker.signals.done.connect(lambda: self.active_workers.pop("export", None))
+        self.active_workers["export"] = worker
+        self.export_worker = worker
+
+        if self.load_worker is None:
+            self.progress_bar.setRange(0, 0)
+            self.progress_bar.show()
+            self.btn_cancel_load.setEnabled(True)
+        self.update_status("info", message, 0)
+        self.thread_pool.start(worker)
+
+    def on_export_progress(self, done: int, total: int):
+        if self.load_worker is None and self.export_worker is not None:
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(done)
+
+    def finish_export(self, status: str, message: str):
+        """Gibt nach dem Export die Bedienelemente frei, sofern kein Ladevorgang läuft, und meldet das Ergebnis."""
+        self.export_worker = None
+        if self.load_worker is None:
+            self.progress_bar.hide()
+            self.btn_cancel_load.setEnabled(False)
+        self.update_status(status, message)
+
+    def closeEvent(self, event):
+        """Bricht beim Schließen alle laufenden Ladevorgänge ab und wartet auf deren Ende."""
+        self.live_timer.stop()
+        for worker in self.active_workers.values():
+            worker.cancel()
+        self.thread_pool.waitForDone()
+        super().closeEvent(event)
+
+    def is_current_load(self, load_id: int) -> bool:
+        """Prüft, ob ein Signal vom aktuellen (nicht abgebrochenen) Ladevorgang stammt."""
+        return self.load_worker is not None and load_id == self.load_id
+
+    def finish_load(self):
+        """Setzt Fortschrittsanzeige und Abbrechen-Button zurück, sofern sie nicht von einem Export genutzt werden."""
+        if self.export_worker is None:
+            self.progress_bar.hide()
+            self.btn_cancel_load.setEnabled(False)
+        self.update_cache_label()
+
+    def on_load_progress(self, load_id: int, done: int, total: int):
+        if self.is_current_load(load_id):
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(done)
+
+    def on_load_preview(self, load_id: int, store: ColumnStore):
+        """Zeigt die ersten geladenen Zeilen im Standardplot an, während der Rest noch gelesen wird."""
+        if not self.is_current_load(load_id) or self.check_dashboard.isChecked():
+            return
+        try:
+            x_data = store.plottable("date")
+            close_values = store.plottable("close")
+        except ValueError:
+            return
+        if not len(x_data) or not len(close_values):
+            return
+        symbols = store.column("symbol")
+        symbol = str(symbols[0]) if len(symbols) else ""
+        self.standard_plot.plot(
+            x_data, close_values,
+            title=f"{symbol}  Date vs. Close (Vorschau: {len(store)} Zeilen)",
+            x_label="Date", y_label="Close",
+            diagram_typ="Linie", color="lime" if self.is_growing(close_values) else "crimson", legend=False,
+            colorbar=False)
+
+    def on_load_finished(self, load_id: int, result):
+        if not self.is_current_load(load_id):
+            return
+        self.load_worker = None
+        self.finish_load()
+        if isinstance(result, dict):
+            self.data_manager.set_stores(result, current=self.combo_symbols.currentText())
+        else:
+            self.data_manager.set_store(result)
+        self.update_cache_label()
+        self.populate_combos()
+        self.update_range_controls()
+        self.plot_standard()
+        store = self.data_manager.store
+        self.update_status("success", f"{self.load_success_message} ({len(store)} Zeilen, "
+                                      f"{store.bytes_per_row:.0f} Bytes/Zeile)")
+
+    def on_load_error(self, load_id: int, message: str):
+        if not self.is_current_load(load_id):
+            return
+        self.load_worker = None
+        self.finish_load()
+        self.update_status("error", message)
+
+    def toggle_live(self, checked: bool):
+        """Startet oder beendet den Live-Modus."""
+        if not checked:
+            self.live_timer.stop()
+            self.update_status("info", "Live-Modus wurde beendet.")
+            return
+        if not self.data_manager.has_data():
+            self.update_status("warning", "Für den Live-Modus müssen zuerst Daten geladen werden.")
+            self.check_live.setChecked(False)
+            return
+        self.live_delay = self.spin_live_interval.value()
+        self.update_status("info", f"Live-Modus: Abfrage alle {self.live_delay} s.")
+        self.poll_live()
+
+    def schedule_live(self):
+        """Plant die nächste Abfrage im Live-Modus nach der aktuellen Wartezeit."""
+        if self.check_live.isChecked():
+            self.live_timer.start(int(self.live_delay * 1000))
+
+    def poll_live(self):
+        """Fragt im Hintergrund die Kurse ab, die neuer als der letzte geladene Kurs sind."""
+        if "live" in self.active_workers or not self.check_live.isChecked():
+            return
+        try:
+            dates = self.data_manager.get_plot_data("date")
+        except ValueError:
+            dates = []
+        if not len(dates):
+            self.check_live.setChecked(False)
+            return
+
+        # Die neuen Zeilen werden nur an den Datensatz angehängt, für den sie abgefragt wurden
+        store = self.data_manager.store
+        worker = Worker(self.data_manager.fetch_latest, os.getenv("API_KEY"), self.data_manager.get_symbol(),
+                        since=dates[-1])
+        worker.signals.finished.connect(lambda new_rows: self.on_live_finished(store, new_rows))
+        worker.signals.error.connect(self.on_live_error)
+        worker.signals.done.connect(lambda: self.active_workers.pop("live", None))
+        self.active_workers["live"] = worker
+        self.thread_pool.start(worker)
+
+    def on_live_finished(self, store: ColumnStore, new_rows: ColumnStore):
+        if not self.check_live.isChecked() or self.data_manager.store is not store:
+            return
+        self.live_delay = self.spin_live_interval.value()
+        if len(new_rows):
+            n_new = self.data_manager.append_rows(new_rows)
+            self.update_range_controls()
+            self.refresh_live_plots(n_new)
+            self.update_status("success", f"Live: {n_new} neue Kurse, letzter Stand "
+                                          f"{str(new_rows.plottable('date')[-1])[:16].replace('T', ' ')}.")
+        self.schedule_live()
+
+    def on_live_error(self, message: str):
+        if not self.check_live.isChecked():
+            return
+        # Nach Fehlern (z. B. erreichtes Anfragelimit) wird die Wartezeit bis zur Obergrenze verdoppelt
+        self.live_delay = min(self.live_delay * 2, self.LIVE_MAX_BACKOFF)
+        self.update_status("warning", f"Live: {message} Nächster Versuch in {self.live_delay} s.", 0)
+        self.schedule_live()
+
+    def live_window_count(self, n_new: int) -> int:
+        """Anzahl der neuen Zeilen am Ende des Datensatzes, die im angezeigten Zeitraum liegen."""
+        window = self.data_manager.store.index_range(*self.date_range)
+        first_new = len(self.data_manager.store) - n_new
+        return max(0, window.stop - max(first_new, window.start))
+
+    def refresh_live_plots(self, n_new: int):
+        """
+        Übernimmt neue Kurse in die Plots. Linienplots werden dabei nur um die neuen Punkte ergänzt; alle anderen
+        Plots werden neu gezeichnet.
+
+        :param n_new: Anzahl der angehängten Zeilen.
+        """
+        if self.check_dashboard.isChecked():
+            self.update_dashboard()
+            return
+        n_visible = self.live_window_count(n_new)
+        if len(self.data_manager.stores) > 1:
+            self.plot_standard()
+        else:
             try:
-                if self.data_manager.load_from_file(file_path):
-                    self.update_status("info", "Daten wurden erfolgreich geladen.")
-                    self.populate_combos()
-                    self.plot_standard()
-                else:
-                    self.update_status("error", "Fehler beim Laden der Datei.")
-            except Exception as e:
-                self.update_status("error", f"Fehler beim Laden der Datei: {e}")
+                x_data = self.data_manager.get_window("date", *self.date_range)
+                close_values = self.data_manager.get_window("close", *self.date_range)
+            except ValueError:
+                x_data = close_values = []
+            if not (len(close_values) and self.standard_plot.extend_plot(
+                    x_data, close_values, n_visible, color="lime" if self.is_growing(close_values) else "crimson")):
+                self.plot_standard()
+
+        if not self.custom_plot_active:
+            return
+        if self.combo_diagram_typ.currentText() == "Linie":
+            try:
+                x_data = self.data_manager.get_window(self.combo_x.currentText(), *self.date_range)
+                y_data = self.data_manager.get_window(self.combo_y.currentText(), *self.date_range)
+            except ValueError:
+                x_data = y_data = []
+            if len(x_data) and len(x_data) == len(y_data) and self.custom_plot.extend_plot(x_data, y_data, n_visible):
+                return
+        self.update_custom_plot()
 
     def populate_combos(self):
         """Füllt die Combo-Boxen mit den verfügbaren Keys aus den Daten."""
@@ -326,86 +866,184 @@ class MainWindow(QMainWindow):
             self.combo_x.addItem(key)
             self.combo_y.addItem(key)
 
+    def update_range_controls(self):
+        """Begrenzt die Datumsfelder auf die geladenen Daten und wendet den gewählten Zeitraum darauf an."""
+        try:
+            dates = self.data_manager.get_plot_data("date")
+        except ValueError:
+            dates = []
+        if not len(dates):
+            self.date_range = (None, None)
+            return
+
+        first, last = (QDate.fromString(str(date)[:10], "yyyy-MM-dd") for date in (dates[0], dates[-1]))
+        for edit in (self.date_from, self.date_to):
+            edit.blockSignals(True)
+            edit.setDateRange(first, last)
+            edit.blockSignals(False)
+        preset = self.combo_range.currentText()
+        if preset == self.CUSTOM_RANGE:
+            self.date_range = (self.date_from.date().toPython(), self.date_to.date().toPython())
+        else:
+            self.apply_range_preset(preset)
+
+    def apply_range_preset(self, preset: str):
+        """Setzt Zeitraum und Datumsfelder gemäß einer Voreinstellung, ohne neu zu plotten."""
+        months = self.RANGE_PRESETS.get(preset)
+        last = self.date_to.maximumDate()
+        first = self.date_from.minimumDate() if months is None else max(last.addMonths(-months),
+                                                                         self.date_from.minimumDate())
+        for edit, date in ((self.date_from, first), (self.date_to, last)):
+            edit.blockSignals(True)
+            edit.setDate(date)
+            edit.blockSignals(False)
+        self.date_range = (None, None) if months is None else (first.toPython(), None)
+
+    def on_range_preset_changed(self, preset: str):
+        if preset == self.CUSTOM_RANGE:
+            return
+        self.apply_range_preset(preset)
+        self.refresh_plots()
+
+    def on_range_dates_changed(self):
+        # Eine manuelle Änderung der Grenzen wechselt auf den benutzerdefinierten Zeitraum
+        self.combo_range.blockSignals(True)
+        self.combo_range.setCurrentText(self.CUSTOM_RANGE)
+        self.combo_range.blockSignals(False)
+        self.date_range = (self.date_from.date().toPython(), self.date_to.date().toPython())
+        self.refresh_plots()
+
+    def refresh_plots(self):
+        """Zeichnet den Standardplot und einen bereits erstellten Custom Plot für den aktuellen Zeitraum neu."""
+        if not self.data_manager.has_data():
+            return
+        self.plot_standard()
+        if self.custom_plot_active and not self.check_dashboard.isChecked():
+            self.update_custom_plot()
+
     def plot_standard(self):
-        """Erstellt den Standardplot: 'date' vs. 'close'."""
-        dates, close_values = [], []
-        if self.data_manager.data and isinstance(self.data_manager.data, list):
-            dates = self.data_manager.get_column_data("date")
-            close_values = self.data_manager.get_column_data("close") if self.data_manager.data else []
-        if not dates or not close_values:
+        """Erstellt den Standardplot: 'date' vs. 'close'. Im Dashboard-Modus wird das Dashboard aktualisiert."""
+        if self.check_dashboard.isChecked():
+            self.update_dashboard()
+            return
+        if len(self.data_manager.stores) > 1:
+            self.plot_standard_basket()
+            return
+
+        try:
+            x_data = self.data_manager.get_window("date", *self.date_range)
+            close_values = self.data_manager.get_window("close", *self.date_range)
+        except ValueError as e:
+            self.update_status("error", f"Fehler beim Konvertieren der Standard-Daten: {e}")
+            return
+        if not len(x_data) or not len(close_values):
             self.update_status(
                 "error",
                 "Die Standard-Daten (date und close) sind nicht verfügbar. Daher kann kein Plot erstellt werden."
             )
             return
-        try:
-            x_data = [datetime.datetime.fromisoformat(d) if isinstance(d, str) else d for d in dates]
-        except Exception as e:
-            self.update_status("error", f"Fehler beim Konvertieren der Datumswerte: {e}")
-            return
 
         # Standardplot: ohne weitere Anpassungen
         self.standard_plot.plot(
             x_data, close_values,
-            title=f"{self.data_manager.data[0]['symbol']}  Date vs. Close",
+            title=f"{self.data_manager.get_symbol()}  Date vs. Close",
             x_label="Date", y_label="Close",
             diagram_typ="Linie", color="lime" if self.is_growing(close_values) else "crimson", legend=False,
             colorbar=False)
 
         self.update_status("success", "Standard Plot wurde erfolgreich aktualisiert.")
 
+    def plot_standard_basket(self):
+        """Überlagert den Verlauf aller geladenen Symbole, jeweils indexiert auf 100 am ersten Tag."""
+        series = {}
+        for symbol, store in self.data_manager.stores.items():
+            # Jedes Symbol wird per binärer Suche auf den Zeitraum zugeschnitten und am ersten Tag auf 100 indexiert
+            window = store.index_range(*self.date_range)
+            close_values = store.plottable("close")[window]
+            if len(close_values) and close_values[0]:
+                series[symbol] = (store.plottable("date")[window], close_values / close_values[0] * 100)
+        if not series:
+            self.update_status("error", "Für die geladenen Symbole sind keine Close-Werte verfügbar.")
+            return
+
+        self.standard_plot.plot_multi(
+            series,
+            title=f"{len(series)} Symbole  Date vs. Close (indexiert)",
+            x_label="Date", y_label="Close (Start = 100)",
+            legend=True)
+
+        self.update_status("success", "Standard Plot wurde erfolgreich aktualisiert.")
+
+    def toggle_dashboard(self, checked: bool):
+        """Wechselt zwischen dem Dashboard und den beiden Einzelplots und zeichnet die neue Ansicht."""
+        self.plot_stack.setCurrentIndex(1 if checked else 0)
+        self.refresh_plots()
+
+    def update_dashboard(self):
+        """
+        Zeichnet das Dashboard im gewählten Raster: Kurs, Volumen und Indikatoren des aktuellen Symbols, danach der
+        Schlusskurs weiterer geladener Symbole. Alle Panels nutzen denselben Zeitraum und werden gemeinsam gezeichnet;
+        unveränderte Panels werden übersprungen.
+        """
+        if not self.check_dashboard.isChecked() or not self.data_manager.has_data():
+            return
+        rows, cols = self.DASHBOARD_GRIDS[self.combo_dashboard.currentText()]
+        panels = self.data_manager.dashboard_panels(rows * cols, *self.date_range)
+        if not panels:
+            self.update_status("error", "Für das Dashboard sind keine plottbaren Daten verfügbar.")
+            return
+        for panel in panels:
+            if panel["key"] == "close" and len(panel["y"]):
+                panel["color"] = "lime" if self.is_growing(panel["y"]) else "crimson"
+        self.dashboard_plot.show_panels(panels, rows, cols)
+
+        self.update_status("success", f"Dashboard mit {len(panels)} Panels wurde aktualisiert.")
+
     @staticmethod
     def is_growing(y: []) -> bool:
         """
         Überprüft, ob die Daten wachsen.
 
-        :param y: Liste der y-Achsendaten.
+        :param y: Liste der y-Achsendaten (chronologisch aufsteigend sortiert).
         """
-        return True if y[-1] < y[0] else False
+        return True if y[-1] > y[0] else False
 
     def update_custom_plot(self):
         """
         Aktualisiert den benutzerdefinierten Plot basierend auf den vom Benutzer gewählten Achsen und Einstellungen.
         """
+        if self.combo_diagram_typ.currentText() == "Kerzen":
+            self.plot_candles()
+            return
+        if self.combo_diagram_typ.currentText() == "Heatmap":
+            self.plot_correlation()
+            return
+
         key_x = self.combo_x.currentText()
         key_y = self.combo_y.currentText()
         if not key_x or not key_y:
             self.update_status("warning", "Bitte wählen Sie beide Achsen aus.")
             return
 
-        x_raw = self.data_manager.get_column_data(key_x)
-        y_raw = self.data_manager.get_column_data(key_y)
+        # Die Spalten werden vektorisiert umgewandelt, pro Spalte zwischengespeichert und ohne Kopie auf den
+        # gewählten Zeitraum zugeschnitten
+        try:
+            x_data = self.data_manager.get_window(key_x, *self.date_range)
+        except ValueError:
+            self.update_status("warning", f"Die Daten für {key_x} sind nicht plottbar.")
+            return
+        try:
+            y_data = self.data_manager.get_window(key_y, *self.date_range)
+        except ValueError:
+            self.update_status("warning", f"Die Daten für {key_y} sind nicht plottbar.")
+            return
 
-        if not x_raw or not y_raw:
+        if not len(x_data) or not len(y_data):
             self.update_status("warning", "Die ausgewählten Schlüssel sind nicht in den Daten vorhanden.")
             return
 
-        # Versuche, die Daten zu konvertieren
-        x_data = []
-        for x in x_raw:
-            if isinstance(x, str):
-                try:
-                    x_data.append(datetime.datetime.fromisoformat(x))
-                    continue
-                except Exception:
-                    self.update_status("warning", f"Die Daten für {key_x} sind nicht plottbar.")
-                    pass
-            try:
-                x_data.append(float(x))
-            except Exception:
-                self.update_status("warning", f"Die Daten für {key_x} sind nicht plottbar.")
-                return
-
-        y_data = []
-        for y in y_raw:
-            try:
-                y_data.append(float(y))
-            except Exception:
-                self.update_status("warning", f"Die Daten für {key_y} sind nicht plottbar.")
-                return
-
         # Lese weitere Plot-Einstellungen aus der UI
-        title = self.lineedit_title.text().strip() if self.lineedit_title.text().strip() else f"{self.data_manager.data[0]['symbol']} {key_x} vs. {key_y}"
+        title = self.lineedit_title.text().strip() if self.lineedit_title.text().strip() else f"{self.data_manager.get_symbol()} {key_x} vs. {key_y}"
 
         # Aktualisiere den Custom Plot
         self.custom_plot.plot(
@@ -420,25 +1058,108 @@ class MainWindow(QMainWindow):
             legend_text=self.legend_text.text().strip() if self.check_legend.isChecked() else None,
             colorbar=self.check_colorbar.isChecked()
         )
+        self.custom_plot_active = True
 
         self.update_status("success", f"Benutzerdefinierter Plot {title} wurde erfolgreich aktualisiert.")
 
+    def plot_candles(self):
+        """Zeichnet den Custom Plot als Kerzendiagramm aus open, high, low und close mit Volumen-Subplot."""
+        try:
+            dates = self.data_manager.get_window("date", *self.date_range)
+            ohlc = [self.data_manager.get_window(key, *self.date_range) for key in ("open", "high", "low", "close")]
+            volume = self.data_manager.get_window("volume", *self.date_range)
+        except ValueError as e:
+            self.update_status("warning", f"Die Kursdaten sind nicht plottbar: {e}")
+            return
+        if not len(dates) or not all(len(values) for values in ohlc):
+            self.update_status("warning", "Für ein Kerzendiagramm werden die Spalten open, high, low und close benötigt.")
+            return
+
+        title = self.lineedit_title.text().strip() or f"{self.data_manager.get_symbol()} OHLC"
+        self.custom_plot.plot_candles(
+            dates, *ohlc, volume=volume if len(volume) else None,
+            title=title,
+            x_label=self.lineedit_xlabel.text().strip() or "Date",
+            y_label=self.lineedit_ylabel.text().strip() or "Price")
+        self.custom_plot_active = True
+
+        self.update_status("success", f"Kerzendiagramm {title} wurde erfolgreich aktualisiert.")
+
+    def plot_correlation(self):
+        """
+        Zeichnet den Custom Plot als Heatmap der Korrelationen zwischen den Renditen aller geladenen Symbole. Die
+        Renditen werden aus der gewählten y-Spalte (standardmäßig close) im angezeigten Zeitraum berechnet.
+        """
+        key = self.combo_y.currentText() or "close"
+        try:
+            symbols, matrix = self.data_manager.correlation(key, *self.date_range)
+        except ValueError as e:
+            self.update_status("warning", f"Die Daten für {key} sind nicht plottbar: {e}")
+            return
+        if len(symbols) < 2:
+            self.update_status("warning", "Für eine Korrelationsmatrix müssen mindestens zwei Symbole geladen sein "
+                                          "(z. B. über \"Alle Symbole laden\").")
+            return
+
+        title = self.lineedit_title.text().strip() or f"Korrelation der Renditen ({key}), {len(symbols)} Symbole"
+        self.custom_plot.plot_heatmap(matrix, symbols, title=title, colorbar_label="Korrelation")
+        self.custom_plot_active = True
+
+        self.update_status("success", f"Korrelationsmatrix für {len(symbols)} Symbole wurde erstellt.")
+
+    def show_correlation(self):
+        """Zeigt die Korrelationsmatrix der geladenen Symbole im Custom Plot an."""
+        self.combo_diagram_typ.setCurrentText("Heatmap")
+        self.update_custom_plot()
+
+    def show_rolling_beta(self):
+        """
+        Fragt nach einem Vergleichssymbol (z. B. einem Index-ETF) und zeichnet das rollierende Beta des aktuellen
+        Symbols im Custom Plot. Die Darstellung ist eine einmalige Auswertung und folgt keinen späteren Änderungen.
+        """
+        symbol = self.data_manager.get_symbol()
+        others = [other for other in self.data_manager.loaded_symbols() if other != symbol]
+        if not others:
+            self.update_status("warning", "Für das Beta muss ein weiteres Symbol geladen sein.")
+            return
+        index_symbol, ok = QInputDialog.getItem(self, "Rollierendes Beta", f"Beta von {symbol} gegenüber:", others,
+                                                0, False)
+        if not ok:
+            return
+        try:
+            dates, beta = self.data_manager.rolling_beta(index_symbol, self.BETA_WINDOW, "close", *self.date_range)
+        except ValueError as e:
+            self.update_status("warning", str(e))
+            return
+        if not len(dates):
+            self.update_status("warning", f"{symbol} und {index_symbol} haben keine gemeinsamen Handelstage.")
+            return
+
+        self.custom_plot.plot(
+            dates, beta,
+            title=f"{symbol}  Beta gegenüber {index_symbol} ({self.BETA_WINDOW} Tage)",
+            x_label="Date", y_label="Beta", diagram_typ="Linie", color="deepskyblue")
+        # Ein späteres Neuzeichnen (z. B. nach Änderung des Zeitraums) soll das Beta nicht überschreiben
+        self.custom_plot_active = False
+
+        self.update_status("success", f"Rollierendes Beta von {symbol} gegenüber {index_symbol} wurde erstellt.")
+
     def save_plot_image(self):
-        """Speichert den aktuell angezeigten Custom Plot als Bild."""
+        """Speichert den aktuell angezeigten Custom Plot (im Dashboard-Modus das Dashboard) als Bild."""
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Plot speichern",
-            f"./Exports/{datetime.datetime.now().date()}_{self.data_manager.data[0]['symbol'] if self.data_manager.data else ''}_plot" if not self.lineedit_title.text().strip() else self.lineedit_title.text().strip(),
+            f"./Exports/{datetime.datetime.now().date()}_{self.data_manager.get_symbol()}_plot" if not self.lineedit_title.text().strip() else self.lineedit_title.text().strip(),
             "PNG Files (*.png);;JPEG Files (*.jpg)")
         if file_path:
-            try:
-                self.custom_plot.fig.savefig(file_path)
-                self.update_status("success", "Plot wurde erfolgreich gespeichert.")
-            except Exception as e:
-                self.update_status("error", f"Fehler beim Speichern des Plots: {e}")
+            from PlotFigure import save_snapshot
+            plot = self.dashboard_plot if self.check_dashboard.isChecked() else self.custom_plot
+            # Kopiert wird im GUI-Thread, gezeichnet im Hintergrund; der Plot bleibt währenddessen bedienbar
+            self.start_export(save_snapshot, "Plot wird gespeichert ...", "Plot wurde erfolgreich gespeichert.",
+                              plot.snapshot(), file_path)
 
     def save_data_json(self):
         """Speichert die geladenen Daten als JSON-Datei."""
-        if not self.data_manager.data:
+        if not self.data_manager.has_data():
             self.update_status("warning", "Keine Daten zum Speichern vorhanden.")
             return
 
@@ -446,21 +1167,20 @@ class MainWindow(QMainWindow):
         if not os.path.exists("./Exports/"):
             os.makedirs("./Exports/")
 
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self, "Daten als JSON speichern",
-            f"./Exports/{self.data_manager.data[0]['symbol']}_{self}_data.json" if not self.lineedit_title.text().strip() else self.lineedit_title.text().strip(),
-            "JSON Files (*.json)")
+            f"./Exports/{self.data_manager.get_symbol()}_{self}_data.json" if not self.lineedit_title.text().strip() else self.lineedit_title.text().strip(),
+            "JSON kompakt (*.json);;JSON eingerückt (*.json);;JSON gzip-komprimiert (*.json.gz)")
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    json.dump(self.data_manager.data, file, ensure_ascii=False, indent=4)
-                self.update_status("success", "Daten wurden erfolgreich gespeichert.")
-            except Exception as e:
-                self.update_status("error", f"Fehler beim Speichern der Daten: {e}")
+            if "gzip" in selected_filter and not file_path.endswith(".gz"):
+                file_path += ".gz"
+            self.start_export(self.data_manager.save_json, "Daten werden als JSON gespeichert ...",
+                              "Daten wurden erfolgreich gespeichert.", file_path,
+                              indent=4 if "eingerückt" in selected_filter else None, store=self.data_manager.store)
 
     def save_data_csv(self):
         """Speichert die geladenen Daten als CSV-Datei."""
-        if not self.data_manager.data:
+        if not self.data_manager.has_data():
             self.update_status("warning", "Keine Daten zum Speichern vorhanden.")
             return
 
@@ -468,14 +1188,36 @@ class MainWindow(QMainWindow):
         if not os.path.exists("./Exports/"):
             os.makedirs("./Exports/")
 
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self, "Daten als CSV speichern",
-            f"./Exports/{self.data_manager.data[0]['symbol']}_{self}_data.csv" if not self.lineedit_title.text().strip() else self.lineedit_title.text().strip(),
-            "CSV Files (*.csv)")
+            f"./Exports/{self.data_manager.get_symbol()}_{self}_data.csv" if not self.lineedit_title.text().strip() else self.lineedit_title.text().strip(),
+            "CSV Files (*.csv);;CSV gzip-komprimiert (*.csv.gz)")
+        if file_path:
+            if "gzip" in selected_filter and not file_path.endswith(".gz"):
+                file_path += ".gz"
+            self.start_export(self.data_manager.save_csv, "Daten werden als CSV gespeichert ...",
+                              "Daten wurden erfolgreich gespeichert.", file_path, store=self.data_manager.store)
+
+    def save_data_binary(self):
+        """Speichert die geladenen Daten spaltenweise als Parquet-, Feather- oder NPZ-Datei."""
+        if not self.data_manager.has_data():
+            self.update_status("warning", "Keine Daten zum Speichern vorhanden.")
+            return
+
+        # Wenn der Export Ordner nicht existiert, wird er erstellt
+        if not os.path.exists("./Exports/"):
+            os.makedirs("./Exports/")
+
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Daten binär speichern",
+            f"./Exports/{self.data_manager.get_symbol()}_data.parquet" if not self.lineedit_title.text().strip() else self.lineedit_title.text().strip(),
+            "Parquet Files (*.parquet);;Feather Files (*.feather);;NumPy Files (*.npz)")
         if file_path:
+            # Ohne passende Endung wird die Endung des gewählten Filters ergänzt
+            if not ColumnarFiles.is_binary_file(file_path):
+                file_path += selected_filter[selected_filter.index("*") + 1:-1] if "*" in selected_filter else ".parquet"
             try:
-                df = pd.DataFrame(self.data_manager.data)
-                df.to_csv(file_path, index=False)
+                self.data_manager.save_to_file(file_path)
                 self.update_status("success", "Daten wurden erfolgreich gespeichert.")
             except Exception as e:
                 self.update_status("error", f"Fehler beim Speichern der Daten: {e}")
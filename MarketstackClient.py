@@ -0,0 +1,443 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Callable, Optional, Hashable, Deque, Tuple
+
+from Metrics import metrics
+
+
+class LoadCancelled(Exception):
+    """Wird ausgelöst, wenn ein laufender Ladevorgang abgebrochen wurde."""
+
+
+class RateLimited(Exception):
+    """Wird ausgelöst, wenn die API eine Anfrage wegen Überschreitung des Anfragelimits ablehnt (HTTP 429)."""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        """
+        :param retry_after: Von der API empfohlene Wartezeit in Sekunden (Header "Retry-After"), falls angegeben.
+        """
+        super().__init__("Das Anfragelimit der API ist erreicht.")
+        self.retry_after = retry_after
+
+
+class TransientError(Exception):
+    """Vorübergehender Fehler (HTTP 5xx, Verbindungsabbruch oder Timeout); die Anfrage kann wiederholt werden."""
+
+
+class TokenBucket:
+    """
+    Ratenbegrenzung nach dem Token-Bucket-Verfahren: Der Bucket fasst burst Tokens, jede Anfrage verbraucht eines.
+    Ein Token kehrt erst burst / rate Sekunden nach dem Ende seiner Anfrage (release) zurück. Damit liegen in jedem
+    Zeitfenster dieser Länge höchstens burst Anfragen, und zwar auch aus Sicht des Servers: Eine Anfrage, die
+    unterwegs aufgehalten wurde, verschiebt die Rückgabe ihres Tokens, statt dass die nächsten Anfragen dicht
+    hinter ihr eintreffen. Alle Methoden sind threadsicher.
+    """
+
+    def __init__(self, rate: Optional[float], burst: Optional[int] = None):
+        """
+        :param rate: Erlaubte Anfragen pro Sekunde; None oder 0 für unbegrenzt.
+        :param burst: Größe des Buckets (Anfragen am Stück); standardmäßig so viele wie pro Sekunde erlaubt.
+        """
+        self.rate = rate or 0.0
+        self.capacity = burst if burst is not None else max(1, int(self.rate))
+        self.period = self.capacity / self.rate if self.rate else 0.0
+        self._tokens = self.capacity
+        # Zeitpunkte, zu denen verbrauchte Tokens zurückkehren (aufsteigend, da period konstant ist)
+        self._returns: Deque[float] = deque()
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+
+    def _take(self) -> Optional[float]:
+        """
+        Nimmt ein Token, falls möglich (nur mit gehaltener Condition aufrufen).
+
+        :return: 0, wenn ein Token genommen wurde, sonst die Wartezeit in Sekunden bis zum nächsten Token oder None,
+            wenn alle Tokens noch von laufenden Anfragen belegt sind.
+        """
+        now = time.monotonic()
+        while self._returns and self._returns[0] <= now:
+            self._returns.popleft()
+            self._tokens += 1
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._tokens > 0:
+            self._tokens -= 1
+            return 0.0
+        return self._returns[0] - now if self._returns else None
+
+    def try_acquire(self) -> bool:
+        """
+        Nimmt ein Token, ohne zu warten.
+
+        :return: True, wenn ein Token verfügbar war.
+        """
+        if not self.rate:
+            return True
+        with self._condition:
+            return self._take() == 0
+
+    def acquire(self, cancel_event: Optional[threading.Event] = None):
+        """
+        Wartet, bis ein Token verfügbar ist, und nimmt es. Nach der Anfrage muss release aufgerufen werden.
+
+        :param cancel_event: Optionales Event; ist es gesetzt, wird das Warten mit LoadCancelled abgebrochen.
+        """
+        if not self.rate:
+            return
+        with self._condition:
+            while True:
+                wait = self._take()
+                if wait == 0:
+                    return
+                if cancel_event is not None:
+                    if cancel_event.is_set():
+                        raise LoadCancelled()
+                    # Das Event kann die Condition nicht wecken; deshalb wird regelmäßig nachgesehen
+                    wait = min(wait if wait is not None else 0.1, 0.1)
+                self._condition.wait(wait)
+
+    def release(self):
+        """Meldet das Ende einer Anfrage; ihr Token kehrt nach burst / rate Sekunden in den Bucket zurück."""
+        if not self.rate:
+            return
+        with self._condition:
+            self._returns.append(time.monotonic() + self.period)
+            self._condition.notify()
+
+    def pause(self, seconds: float):
+        """
+        Sperrt alle Anfragen für die angegebene Zeit (z. B. nachdem die API mit 429 geantwortet hat).
+
+        :param seconds: Dauer der Sperre in Sekunden.
+        """
+        with self._condition:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class _SharedCancel:
+    """
+    Abbruch eines zusammengefassten Aufrufs. Er gilt erst, wenn alle beteiligten Aufrufer abgebrochen haben, damit
+    ein abgebrochener Ladevorgang einen gleichen, weiterhin gewünschten nicht mitreißt. Bietet is_set und wait wie
+    threading.Event.
+    """
+
+    def __init__(self):
+        self.events: List[Optional[threading.Event]] = []
+
+    def is_set(self) -> bool:
+        events = list(self.events)
+        return bool(events) and all(event is not None and event.is_set() for event in events)
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while not self.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, 0.05))
+        return True
+
+
+class RequestScheduler:
+    """
+    Steuert alle Anfragen an die API: Ein gemeinsamer Token-Bucket hält das Anfragelimit des Tarifs ein, Anfragen,
+    die mit 429 oder einem vorübergehenden Fehler scheitern, werden mit exponentiell wachsender Wartezeit wiederholt,
+    und identische Anfragen, die gleichzeitig laufen würden (z. B. nach einem Doppelklick), werden zu einer
+    zusammengefasst.
+    """
+
+    def __init__(self, rate: Optional[float] = 5.0, burst: Optional[int] = None, max_retries: int = 4,
+                 backoff: float = 1.0, max_backoff: float = 60.0):
+        """
+        :param rate: Erlaubte Anfragen pro Sekunde; None für unbegrenzt.
+        :param burst: Anfragen, die am Stück starten dürfen (siehe TokenBucket).
+        :param max_retries: Anzahl der Wiederholungen nach 429 oder vorübergehenden Fehlern.
+        :param backoff: Wartezeit vor der ersten Wiederholung in Sekunden; sie verdoppelt sich mit jedem Versuch.
+        :param max_backoff: Längste Wartezeit zwischen zwei Versuchen in Sekunden.
+        """
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Tuple[Future, _SharedCancel]] = {}
+
+    def call(self, key: Hashable, fn: Callable[[], Any], cancel_event: Optional[threading.Event] = None) -> Any:
+        """
+        Führt eine Anfrage unter Einhaltung des Limits aus. Läuft bereits eine Anfrage mit demselben Schlüssel, wird
+        stattdessen auf deren Ergebnis gewartet. Wird der Aufrufer, der die Anfrage ausführt, abgebrochen, führt ein
+        wartender Aufrufer sie selbst aus.
+
+        :param key: Schlüssel der Anfrage (Endpunkt und Parameter); gleiche Schlüssel werden zusammengefasst.
+        :param fn: Funktion, die die Anfrage einmal ausführt.
+        :param cancel_event: Optionales Event zum Abbrechen des Wartens.
+        :return: Ergebnis von fn.
+        :raises LoadCancelled: Wenn cancel_event gesetzt wurde.
+        :raises RateLimited: Wenn das Limit auch nach allen Wiederholungen überschritten ist.
+        :raises TransientError: Wenn der Fehler auch nach allen Wiederholungen besteht.
+        """
+        return self.coalesce(key, lambda cancel: self._run(fn, cancel), cancel_event)
+
+    def coalesce(self, key: Hashable, fn: Callable[[Any], Any], cancel_event: Optional[threading.Event] = None) -> Any:
+        """
+        Fasst gleichzeitige Aufrufe mit demselben Schlüssel zusammen, ohne das Limit anzuwenden (z. B. für einen
+        ganzen Abruf aus mehreren Seiten, deren Anfragen einzeln über call laufen). Der erste Aufrufer führt fn aus,
+        alle weiteren warten auf dessen Ergebnis.
+
+        :param key: Schlüssel des Aufrufs.
+        :param fn: Auszuführende Funktion fn(cancel_event); das übergebene Event ist erst gesetzt, wenn alle
+            beteiligten Aufrufer abgebrochen haben.
+        :param cancel_event: Optionales Event zum Abbrechen des Wartens.
+        :return: Ergebnis von fn.
+        :raises LoadCancelled: Wenn cancel_event gesetzt wurde.
+        """
+        while True:
+            with self._lock:
+                entry = self._in_flight.get(key)
+                leader = entry is None
+                if leader:
+                    entry = self._in_flight[key] = (Future(), _SharedCancel())
+                future, shared_cancel = entry
+                shared_cancel.events.append(cancel_event)
+            if leader:
+                try:
+                    result = fn(shared_cancel)
+                except BaseException as e:
+                    self._release(key)
+                    future.set_exception(e)
+                    raise
+                self._release(key)
+                future.set_result(result)
+                return result
+
+            metrics.increment("api.coalesced")
+            try:
+                return self._wait(future, cancel_event)
+            except LoadCancelled:
+                # Alle bisher Beteiligten haben abgebrochen; wer noch wartet, startet den Aufruf neu
+                if cancel_event is not None and cancel_event.is_set():
+                    raise
+
+    def _release(self, key: Hashable):
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    @staticmethod
+    def _wait(future: Future, cancel_event: Optional[threading.Event]) -> Any:
+        """Wartet auf das Ergebnis einer laufenden Anfrage; bei gesetztem cancel_event mit LoadCancelled."""
+        while cancel_event is not None:
+            try:
+                return future.result(timeout=0.1)
+            except FutureTimeoutError:
+                if cancel_event.is_set():
+                    raise LoadCancelled()
+        return future.result()
+
+    def _run(self, fn: Callable[[], Any], cancel_event: Optional[threading.Event]) -> Any:
+        """Führt fn aus und wiederholt es nach 429 oder vorübergehenden Fehlern mit exponentiellem Backoff."""
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire(cancel_event)
+            try:
+                return fn()
+            except (RateLimited, TransientError) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+                if isinstance(e, RateLimited):
+                    # Das Limit gilt für alle Anfragen; deshalb pausieren alle, mindestens so lange wie verlangt
+                    delay = max(delay, e.retry_after or 0.0)
+                    self.bucket.pause(delay)
+                metrics.increment("api.retries")
+            finally:
+                self.bucket.release()
+            if cancel_event is None:
+                time.sleep(delay)
+            elif cancel_event.wait(delay):
+                raise LoadCancelled()
+
+
+class MarketstackClient:
+    """
+    HTTP-Client für die Marketstack-API mit Verbindungspool und parallelem Abruf aller Ergebnisseiten. Alle Anfragen
+    laufen über einen RequestScheduler (Anfragelimit, Wiederholungen, Zusammenfassen gleicher Anfragen).
+    """
+
+    DEFAULT_BASE_URL = "http://api.marketstack.com/v1"
+    MAX_PAGE_SIZE = 1000
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, max_concurrency: int = 4, page_size: int = MAX_PAGE_SIZE,
+                 timeout: float = 30, scheduler: Optional[RequestScheduler] = None):
+        """
+        :param base_url: Basis-URL der API (für Tests z. B. ein lokaler Stub-Server wie MockServer.py).
+        :param max_concurrency: Maximale Anzahl gleichzeitig laufender Seitenabrufe.
+        :param page_size: Anzahl Datensätze pro Seite (Parameter "limit"), höchstens 1000.
+        :param timeout: Timeout pro Anfrage in Sekunden.
+        :param scheduler: Steuerung der Anfragen; standardmäßig ein RequestScheduler mit 5 Anfragen pro Sekunde.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        self.timeout = timeout
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """
+        HTTP-Session mit Verbindungspool. Sie wird (samt requests-Import) erst bei der ersten Anfrage erzeugt, damit
+        der Programmstart nicht auf das Laden von requests wartet.
+        """
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                # Ein Session-Objekt hält die TCP-Verbindungen offen; der Pool ist so groß wie die Parallelität
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def get_json(self, endpoint: str, access_key: str, cancel_event: Optional[threading.Event] = None,
+                 **params) -> Dict[str, Any]:
+        """
+        Führt eine einzelne GET-Anfrage über den Scheduler aus und gibt die dekodierte Antwort zurück. Gleichzeitige
+        Anfragen mit demselben Endpunkt und denselben Parametern werden zusammengefasst; die Antwort ist dann für alle
+        Aufrufer dasselbe Objekt und darf nicht verändert werden.
+
+        :param endpoint: Endpunkt relativ zur Basis-URL (z. B. "eod").
+        :param access_key: API-Zugriffsschlüssel.
+        :param cancel_event: Optionales Event zum Abbrechen des Wartens auf das Anfragelimit.
+        :param params: Query-Parameter.
+        :return: Dekodierte JSON-Antwort.
+        :raises RateLimited: Wenn das Anfragelimit auch nach allen Wiederholungen erreicht ist.
+        :raises TransientError: Wenn ein Server- oder Verbindungsfehler auch nach allen Wiederholungen besteht.
+        """
+        query_params = {"access_key": access_key}
+        query_params.update(params)
+        key = (endpoint, tuple(sorted((name, str(value)) for name, value in query_params.items())))
+        return self.scheduler.call(key, lambda: self._request(endpoint, query_params), cancel_event)
+
+    def _request(self, endpoint: str, query_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Führt die GET-Anfrage einmal aus und ordnet Fehler RateLimited bzw. TransientError zu."""
+        import requests
+
+        metrics.increment("api.requests")
+        with metrics.timer("api.request"):
+            try:
+                response = self.session.get(f"{self.base_url}/{endpoint}", params=query_params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                metrics.increment("api.errors")
+                raise TransientError(f"Verbindung zur API fehlgeschlagen: {e}")
+            if response.status_code == 429:
+                metrics.increment("api.rate_limited")
+                retry_after = response.headers.get("Retry-After", "")
+                raise RateLimited(float(retry_after) if retry_after.replace(".", "", 1).isdigit() else None)
+            if response.status_code >= 500:
+                metrics.increment("api.errors")
+                raise TransientError(f"Die API antwortet mit HTTP {response.status_code}.")
+            response.raise_for_status()
+            return response.json()
+
+    def fetch_eod(self, access_key: str, symbols: str, progress: Optional[Callable[[int, int], None]] = None,
+                  cancel_event: Optional[threading.Event] = None, endpoint: str = "eod",
+                  **params) -> List[Dict[str, Any]]:
+        """
+        Lädt alle Seiten des /eod-Endpunkts (oder eines anderen Endpunkts mit derselben Paginierung, z. B.
+        "intraday"), bis "pagination.total" erreicht ist.
+
+        Die erste Seite liefert die Gesamtanzahl; alle weiteren Seiten werden parallel abgerufen und in der
+        Reihenfolge ihres Offsets zusammengefügt. Ein gleicher Abruf, der bereits läuft (z. B. nach einem
+        Doppelklick), wird nicht erneut gestartet; beide Aufrufer erhalten dieselben Datensätze, die deshalb nicht
+        verändert werden dürfen.
+
+        :param access_key: API-Zugriffsschlüssel.
+        :param symbols: Ein oder mehrere kommagetrennte Börsensymbole.
+        :param progress: Optionaler Callback progress(geladene_seiten, seiten_gesamt).
+        :param cancel_event: Optionales Event; ist es gesetzt, wird vor jeder weiteren Seite mit LoadCancelled
+            abgebrochen.
+        :param endpoint: Endpunkt relativ zur Basis-URL.
+        :param params: Weitere Parameter (z. B. sort, date_from, date_to). "limit" gibt die Seitengröße an,
+            "offset" den Startpunkt.
+        :return: Liste aller Datensätze.
+        """
+        pages = self.fetch_eod_pages(access_key, symbols, None, progress=progress, cancel_event=cancel_event,
+                                     endpoint=endpoint, **params)
+        return pages[0] if len(pages) == 1 else [row for page in pages for row in page]
+
+    @metrics.timed("api.fetch")
+    def fetch_eod_pages(self, access_key: str, symbols: str, convert: Optional[Callable[[List[Dict[str, Any]]], Any]],
+                        progress: Optional[Callable[[int, int], None]] = None,
+                        cancel_event: Optional[threading.Event] = None, endpoint: str = "eod",
+                        **params) -> List[Any]:
+        """
+        Lädt alle Seiten wie fetch_eod, wandelt aber jede Seite sofort nach dem Empfang mit convert um (z. B. in
+        typisierte Spalten). Die dekodierten Datensätze einer Seite können danach freigegeben werden, statt bis zum
+        Ende des Abrufs für alle Seiten gleichzeitig im Speicher zu liegen.
+
+        :param access_key: API-Zugriffsschlüssel.
+        :param symbols: Ein oder mehrere kommagetrennte Börsensymbole.
+        :param convert: Funktion convert(datensätze) für jede Seite; None behält die Liste der Datensätze. Gleiche
+            Abrufe werden nur mit derselben Funktion zusammengefasst.
+        :param progress: Optionaler Callback progress(geladene_seiten, seiten_gesamt).
+        :param cancel_event: Optionales Event zum Abbrechen (siehe fetch_eod).
+        :param endpoint: Endpunkt relativ zur Basis-URL.
+        :param params: Weitere Parameter wie bei fetch_eod.
+        :return: Liste der umgewandelten Seiten in der Reihenfolge ihres Offsets.
+        """
+        key = ("fetch", endpoint, access_key, symbols, convert,
+               tuple(sorted((name, str(value)) for name, value in params.items())))
+        return self.scheduler.coalesce(key, lambda cancel: self._fetch_pages(access_key, symbols, progress, cancel,
+                                                                            endpoint, convert, **params), cancel_event)
+
+    def _fetch_pages(self, access_key: str, symbols: str, progress: Optional[Callable[[int, int], None]],
+                     cancel_event: Optional[threading.Event], endpoint: str,
+                     convert: Optional[Callable[[List[Dict[str, Any]]], Any]], **params) -> List[Any]:
+        """Lädt alle Seiten eines Abrufs und wandelt jede sofort um (siehe fetch_eod_pages)."""
+        convert = convert if convert is not None else list
+        limit = max(1, min(int(params.pop("limit", self.page_size)), self.MAX_PAGE_SIZE))
+        offset = int(params.pop("offset", 0))
+
+        first_page = self.get_json(endpoint, access_key, cancel_event=cancel_event, symbols=symbols, limit=limit,
+                                   offset=offset, **params)
+        pages = [convert(first_page.get("data", []))]
+        pagination = first_page.get("pagination") or {}
+        total = int(pagination.get("total", 0) or 0)
+        # Die API kann die Seitengröße kappen; maßgeblich ist der tatsächlich verwendete Wert
+        limit = int(pagination.get("limit", limit) or limit)
+
+        offsets = range(offset + limit, total, limit)
+        if progress is not None:
+            progress(1, len(offsets) + 1)
+        if not offsets:
+            return pages
+
+        def fetch_page(page_offset: int) -> Any:
+            if cancel_event is not None and cancel_event.is_set():
+                raise LoadCancelled()
+            page = self.get_json(endpoint, access_key, cancel_event=cancel_event, symbols=symbols, limit=limit,
+                                 offset=page_offset, **params)
+            return convert(page.get("data", []))
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            for done, page in enumerate(executor.map(fetch_page, offsets), start=2):
+                pages.append(page)
+                if progress is not None:
+                    progress(done, len(offsets) + 1)
+        finally:
+            # Bei Abbruch oder Fehler werden noch nicht gestartete Seiten verworfen
+            executor.shutdown(wait=True, cancel_futures=True)
+        return pages
+
+    def close(self):
+        """Schließt alle offenen Verbindungen."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
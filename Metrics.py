@@ -0,0 +1,227 @@
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Any, Callable, Optional, Iterator
+
+import numpy as np
+
+# Anzahl der letzten Messwerte pro Histogramm, aus denen Perzentile berechnet werden
+HISTOGRAM_SAMPLES = 1024
+# Anzahl der Zeilen im Speicherprofil (größte Allokationen nach Quelltextzeile)
+MEMORY_TOP_LINES = 30
+
+
+class Histogram:
+    """Verteilung von Laufzeiten: Anzahl, Summe, Extremwerte und die letzten Messwerte für Perzentile."""
+
+    def __init__(self, max_samples: int = HISTOGRAM_SAMPLES):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.last = 0.0
+        self.samples = deque(maxlen=max_samples)
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.last = seconds
+        self.samples.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Fasst die Verteilung zusammen.
+
+        :return: Dict mit count sowie total_s, mean_ms, min_ms, max_ms, last_ms, p50_ms und p95_ms.
+        """
+        p50, p95 = np.percentile(self.samples, [50, 95]) if self.samples else (0.0, 0.0)
+        return {"count": self.count, "total_s": self.total, "mean_ms": self.total / max(self.count, 1) * 1000,
+                "min_ms": (self.min if self.count else 0.0) * 1000, "max_ms": self.max * 1000,
+                "last_ms": self.last * 1000, "p50_ms": float(p50) * 1000, "p95_ms": float(p95) * 1000}
+
+
+class MetricsRegistry:
+    """
+    Leichtgewichtige Sammelstelle für Laufzeiten (Histogramme) und Zähler der einzelnen Verarbeitungsstufen
+    (API-Abruf, Datei-Parsing, Spaltenextraktion, Umwandlung, Zeichnen). Alle Methoden sind threadsicher, weil
+    Ladevorgänge in Hintergrund-Threads laufen.
+
+    Zusätzlich kann ein Profil für den nächsten Vorgang angefordert werden (capture_next): Der nächste äußerste
+    Timer in einem beliebigen Thread wird dann mit cProfile und/oder tracemalloc aufgezeichnet.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        # Verschachtelungstiefe der Timer pro Thread; nur äußerste Timer starten eine Profilaufzeichnung
+        self._local = threading.local()
+        self._capture_request: Optional[Dict[str, Any]] = None
+        self._captures: List[str] = []
+
+    def increment(self, name: str, value: int = 1):
+        """
+        Erhöht einen Zähler.
+
+        :param name: Name des Zählers, z. B. "api.requests".
+        :param value: Betrag der Erhöhung.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        """
+        Erfasst eine Laufzeit im Histogramm einer Stufe.
+
+        :param name: Name der Stufe, z. B. "file.parse".
+        :param seconds: Laufzeit in Sekunden.
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Misst die Laufzeit des umschlossenen Blocks und erfasst sie unter name (auch bei Ausnahmen).
+
+        :param name: Name der Stufe.
+        """
+        depth = getattr(self._local, "depth", 0)
+        capture = self._take_capture_request() if depth == 0 else None
+        profiler = self._start_capture(capture)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+            self._local.depth = depth
+            if capture is not None:
+                self._finish_capture(capture, profiler, name)
+
+    def timed(self, name: str) -> Callable:
+        """
+        Decorator, der jeden Aufruf der Funktion mit timer(name) misst.
+
+        :param name: Name der Stufe.
+        """
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Gibt den aktuellen Stand aller Messwerte zurück.
+
+        :return: Dict mit "histograms" (Name -> Zusammenfassung) und "counters" (Name -> Wert), nach Namen sortiert.
+        """
+        with self._lock:
+            return {"histograms": {name: self._histograms[name].summary() for name in sorted(self._histograms)},
+                    "counters": dict(sorted(self._counters.items()))}
+
+    def reset(self):
+        """Verwirft alle Messwerte."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def save_json(self, file_path: str):
+        """
+        Speichert den aktuellen Stand als JSON-Datei (z. B. zum Anhängen an eine Fehlermeldung).
+
+        :param file_path: Zielpfad.
+        """
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(self.snapshot(), created=time.strftime("%Y-%m-%dT%H:%M:%S")), f, indent=4)
+
+    def capture_next(self, directory: str = "./Profiles", cpu: bool = True, memory: bool = False):
+        """
+        Fordert ein Profil für den nächsten Vorgang an. Eine bereits ausstehende Anforderung wird ersetzt.
+
+        :param directory: Zielordner für die Profildateien.
+        :param cpu: Ob ein cProfile-Profil (.prof, lesbar z. B. mit pstats oder snakeviz) geschrieben wird.
+        :param memory: Ob ein tracemalloc-Speicherprofil (_memory.txt) mit den größten Allokationen geschrieben wird.
+        """
+        with self._lock:
+            self._capture_request = {"directory": directory, "cpu": cpu, "memory": memory} if cpu or memory else None
+
+    def cancel_capture(self):
+        """Verwirft eine ausstehende Profil-Anforderung."""
+        with self._lock:
+            self._capture_request = None
+
+    @property
+    def capture_pending(self) -> bool:
+        """True, solange eine Profil-Anforderung auf den nächsten Vorgang wartet."""
+        with self._lock:
+            return self._capture_request is not None
+
+    def take_captures(self) -> List[str]:
+        """
+        Gibt die Pfade der seit dem letzten Aufruf geschriebenen Profildateien zurück.
+
+        :return: Liste von Pfaden.
+        """
+        with self._lock:
+            captures, self._captures = self._captures, []
+        return captures
+
+    def _take_capture_request(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            request, self._capture_request = self._capture_request, None
+        return request
+
+    @staticmethod
+    def _start_capture(capture: Optional[Dict[str, Any]]) -> Optional[cProfile.Profile]:
+        if capture is None:
+            return None
+        if capture["memory"] and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            capture["tracemalloc_started"] = True
+        if not capture["cpu"]:
+            return None
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _finish_capture(self, capture: Dict[str, Any], profiler: Optional[cProfile.Profile], name: str):
+        """Beendet die Aufzeichnung und schreibt die Profildateien."""
+        if profiler is not None:
+            profiler.disable()
+        os.makedirs(capture["directory"], exist_ok=True)
+        base = os.path.join(capture["directory"], f"{time.strftime('%Y%m%d-%H%M%S')}_{name}")
+        paths = []
+        if profiler is not None:
+            profiler.dump_stats(base + ".prof")
+            paths.append(base + ".prof")
+        if capture["memory"]:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if capture.get("tracemalloc_started"):
+                tracemalloc.stop()
+            with open(base + "_memory.txt", 'w', encoding='utf-8') as f:
+                f.write(f"Stufe: {name}\nAktuell: {current / 2 ** 20:.1f} MB, Spitze: {peak / 2 ** 20:.1f} MB\n\n")
+                for stat in snapshot.statistics("lineno")[:MEMORY_TOP_LINES]:
+                    f.write(f"{stat}\n")
+            paths.append(base + "_memory.txt")
+        with self._lock:
+            self._captures.extend(paths)
+
+
+# Gemeinsame Registry der Anwendung
+metrics = MetricsRegistry()
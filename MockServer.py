@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lokaler Nachbau der Marketstack-API für Tests ohne Netzwerk und ohne Anfragekontingent. Der Server liefert
+synthetische Tageskurse über die Endpunkte /eod, /eod/latest, /intraday und /intraday/latest mit derselben
+Paginierung (limit, offset, pagination.total) wie die echte API; sort (Standard DESC), date_from und date_to werden
+ausgewertet. Ein Token-Bucket setzt ein Anfragelimit durch (Antwort 429 mit "Retry-After"); optional wird ein Anteil
+der Anfragen mit 503 beantwortet oder jede Antwort verzögert. Der Server zählt, wie viele Anfragen höchstens
+gleichzeitig liefen.
+
+Mit --check wird der Server im Hintergrund gestartet und ein Massenabruf über den MarketstackClient ausgeführt,
+einschließlich doppelt gestarteter Ladevorgänge. Die Prüfung schlägt fehl (Rückgabewert 1), wenn Daten fehlen, der
+Server eine Anfrage wegen des Limits ablehnen musste oder gleiche Anfragen nicht zusammengefasst wurden.
+
+Beispiele:
+    python MockServer.py --port 8765 --rate 5
+    python MockServer.py --check --rate 5 --pages 20 --fail-rate 0.1
+    python MockServer.py --check --rate 5 --client-rate 20
+"""
+
+import argparse
+import datetime
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any
+from urllib.parse import urlparse, parse_qs
+
+from ColumnStore import ColumnStore
+from MarketstackClient import MarketstackClient, RequestScheduler, TokenBucket
+from Metrics import metrics
+
+# Erster Tag der synthetischen Historie
+FIRST_DAY = datetime.date(2000, 1, 3)
+
+
+class MockState:
+    """Gemeinsamer Zustand des Servers: Anfragelimit, Fehlerquote und Zähler."""
+
+    def __init__(self, days: int, rate: float, burst: int = None, fail_rate: float = 0.0, seed: int = 0,
+                 delay: float = 0.0):
+        """
+        :param days: Anzahl Handelstage pro Symbol.
+        :param rate: Erlaubte Anfragen pro Sekunde; 0 für unbegrenzt.
+        :param burst: Anfragen, die am Stück erlaubt sind (siehe TokenBucket).
+        :param fail_rate: Anteil der Anfragen, die mit 503 beantwortet werden.
+        :param seed: Zufalls-Seed für die Fehler.
+        :param delay: Antwortzeit jeder Anfrage in Sekunden (simulierte Netzwerklatenz).
+        """
+        self.days = days
+        self.bucket = TokenBucket(rate, burst)
+        self.fail_rate = fail_rate
+        self.delay = delay
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {"requests": 0, "served": 0, "rate_limited": 0, "failed": 0}
+        self.seen: Dict[str, int] = {}
+        # Aktuell und höchstens gleichzeitig bearbeitete Anfragen
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def count(self, name: str):
+        with self.lock:
+            self.counts[name] += 1
+
+    def day_index(self, date: str, default: int) -> int:
+        """Wandelt ein Datum (YYYY-MM-DD) in den Index des Handelstags um; ohne Datum gilt default."""
+        if not date:
+            return default
+        return (datetime.date.fromisoformat(date[:10]) - FIRST_DAY).days
+
+    def rows(self, symbols: List[str], offset: int, limit: int, latest: bool, descending: bool = False,
+             first: int = 0, last: int = None) -> Dict[str, Any]:
+        """
+        Erzeugt eine Ergebnisseite; die Kurse jedes Symbols sind deterministisch (Seed aus dem Symbol).
+
+        :param descending: Neueste Tage zuerst (wie sort=DESC der API).
+        :param first: Index des ersten Tags (date_from).
+        :param last: Index des letzten Tags (date_to); standardmäßig der letzte Tag der Historie.
+        """
+        first = max(first, 0)
+        last = min(self.days - 1 if last is None else last, self.days - 1)
+        total = len(symbols) * (1 if latest else max(last - first + 1, 0))
+        data = []
+        for index in range(offset, min(offset + limit, total)):
+            symbol = symbols[index % len(symbols)]
+            position = index // len(symbols)
+            day = self.days - 1 if latest else (last - position if descending else first + position)
+            base = 50 + sum(map(ord, symbol)) % 100 + day * 0.05
+            data.append({"open": round(base, 2), "high": round(base * 1.01, 2), "low": round(base * 0.99, 2),
+                         "close": round(base * (1.002 if day % 2 else 0.998), 2), "volume": 1_000_000 + day,
+                         "symbol": symbol, "exchange": "XNAS",
+                         "date": f"{FIRST_DAY + datetime.timedelta(days=day)}T00:00:00+0000"})
+        return {"pagination": {"limit": limit, "offset": offset, "count": len(data), "total": total}, "data": data}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Beantwortet GET-Anfragen im Format der Marketstack-API."""
+
+    state: MockState = None
+
+    def do_GET(self):
+        state = self.state
+        with state.lock:
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            self.handle_get()
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def handle_get(self):
+        state = self.state
+        state.count("requests")
+        if state.delay:
+            time.sleep(state.delay)
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        with state.lock:
+            state.seen[url.query] = state.seen.get(url.query, 0) + 1
+        endpoint = url.path.strip("/").split("/")
+        if endpoint[0] not in ("eod", "intraday") or not query.get("access_key"):
+            return self.send_json(404 if endpoint[0] not in ("eod", "intraday") else 401, {"error": "invalid"})
+        # Die Anfrage zählt mit ihrem Eintreffen; ihr Token kehrt nach einem Zeitfenster zurück
+        if state.bucket.try_acquire():
+            state.bucket.release()
+        else:
+            state.count("rate_limited")
+            return self.send_json(429, {"error": {"code": "rate_limit_reached"}}, {"Retry-After": "1"})
+        with state.lock:
+            failed = state.random.random() < state.fail_rate
+        if failed:
+            state.count("failed")
+            return self.send_json(503, {"error": {"code": "service_unavailable"}})
+
+        symbols = [symbol for symbol in query.get("symbols", "").split(",") if symbol]
+        limit = max(1, min(int(query.get("limit", 100)), 1000))
+        page = state.rows(symbols or ["AAPL"], int(query.get("offset", 0)), limit,
+                          latest=endpoint[-1] == "latest", descending=query.get("sort", "DESC").upper() != "ASC",
+                          first=state.day_index(query.get("date_from"), 0),
+                          last=state.day_index(query.get("date_to"), state.days - 1))
+        state.count("served")
+        self.send_json(200, page)
+
+    def send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keine Zeile pro Anfrage auf stderr
+        pass
+
+
+def start_server(state: MockState, port: int = 0) -> ThreadingHTTPServer:
+    """
+    Startet den Server in einem Hintergrund-Thread.
+
+    :param state: Zustand des Servers.
+    :param port: Port; 0 wählt einen freien Port.
+    :return: Laufender Server (Adresse in server.server_address, beenden mit shutdown()).
+    """
+    handler = type("Handler", (MockHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_check(args: argparse.Namespace) -> int:
+    """
+    Lädt über den MarketstackClient einen Massenabruf (pages Seiten) gegen den Mock-Server und startet denselben
+    Abruf dabei zweimal gleichzeitig.
+
+    :return: 0 bei Erfolg, sonst 1.
+    """
+    symbols = ["AAPL", "MSFT", "AMZN", "GOOGL"]
+    page_size = 250
+    state = MockState(days=args.pages * page_size // len(symbols), rate=args.rate, fail_rate=args.fail_rate,
+                      delay=args.delay)
+    server = start_server(state)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    client = MarketstackClient(base_url, max_concurrency=args.concurrency, page_size=page_size,
+                               scheduler=RequestScheduler(rate=args.client_rate or args.rate, backoff=0.2))
+    metrics.reset()
+
+    results: List[Any] = [None, None]
+
+    def load(index: int):
+        results[index] = client.fetch_eod("mock-key", ",".join(symbols))
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=load, args=(index,)) for index in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    client.close()
+
+    counters = metrics.snapshot()["counters"]
+    expected_rows = state.days * len(symbols)
+    # Mindestdauer: die ersten burst Anfragen sofort, danach burst Anfragen je Zeitfenster
+    minimum = (args.pages - 1) // state.bucket.capacity * state.bucket.period
+    duplicates = sum(count - 1 for count in state.seen.values() if count > 1)
+    print(f"Seiten: {args.pages}, Zeilen: {[len(rows or []) for rows in results]} (erwartet {expected_rows})")
+    print(f"Server: {state.counts}, höchstens {state.max_in_flight} gleichzeitig")
+    print(f"Client: {counters}")
+    if results[0]:
+        store = ColumnStore.from_records(results[0])
+        print(f"Spaltenformat: {store.bytes_per_row:.0f} Bytes/Zeile")
+    print(f"Dauer: {elapsed:.2f} s (Minimum bei {args.rate:g} Anfragen/s: {minimum:.2f} s)")
+
+    failed = False
+    if any(rows is None or len(rows) != expected_rows for rows in results):
+        print("Es fehlen Daten.", file=sys.stderr)
+        failed = True
+    if state.counts["rate_limited"] and not args.client_rate:
+        print("Das Anfragelimit wurde überschritten.", file=sys.stderr)
+        failed = True
+    if state.max_in_flight > args.concurrency:
+        print(f"Es liefen {state.max_in_flight} Anfragen gleichzeitig (erlaubt {args.concurrency}).", file=sys.stderr)
+        failed = True
+    if duplicates > state.counts["failed"] + state.counts["rate_limited"]:
+        print(f"{duplicates} Anfragen wurden mehrfach gesendet.", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Lokaler Nachbau der Marketstack-API mit Anfragelimit.")
+    parser.add_argument("--port", type=int, default=8765, help="Port des Servers (Standard: 8765).")
+    parser.add_argument("--days", type=int, default=5000, help="Handelstage pro Symbol.")
+    parser.add_argument("--rate", type=float, default=5, help="Erlaubte Anfragen pro Sekunde (0 = unbegrenzt).")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Anteil der Anfragen, die mit 503 scheitern.")
+    parser.add_argument("--delay", type=float, default=0.0, help="Antwortzeit jeder Anfrage in Sekunden.")
+    parser.add_argument("--check", action="store_true",
+                        help="Server im Hintergrund starten und einen Massenabruf über den Client prüfen.")
+    parser.add_argument("--pages", type=int, default=20, help="Anzahl Seiten für --check.")
+    parser.add_argument("--client-rate", type=float,
+                        help="Abweichendes Limit des Clients für --check (z. B. höher als --rate, um die "
+                             "Wiederholungen nach 429 zu prüfen).")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallele Seitenabrufe des Clients für --check.")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    if args.check:
+        return run_check(args)
+    server = start_server(MockState(args.days, args.rate, fail_rate=args.fail_rate, delay=args.delay), args.port)
+    print(f"Mock-Server läuft auf http://127.0.0.1:{server.server_address[1]} (Beenden mit Strg+C)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import os
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget,
+                               QTableWidgetItem, QHeaderView, QFileDialog, QSpacerItem, QSizePolicy)
+
+from Metrics import MetricsRegistry
+
+
+class PerformanceDialog(QDialog):
+    """
+    Zeigt die gesammelten Laufzeiten (pro Stufe) und Zähler der MetricsRegistry an. Solange der Dialog offen ist,
+    wird die Anzeige jede Sekunde aktualisiert; der Stand kann als JSON exportiert werden.
+    """
+
+    HISTOGRAM_COLUMNS = [("Stufe", None), ("Anzahl", "count"), ("Letzte (ms)", "last_ms"), ("Mittel (ms)", "mean_ms"),
+                         ("p50 (ms)", "p50_ms"), ("p95 (ms)", "p95_ms"), ("Max (ms)", "max_ms"),
+                         ("Gesamt (s)", "total_s")]
+
+    def __init__(self, registry: MetricsRegistry, parent=None):
+        """
+        :param registry: Anzuzeigende Metriken.
+        :param parent: Übergeordnetes Widget.
+        """
+        super().__init__(parent)
+        self.registry = registry
+        self.setWindowTitle("Performance")
+        self.resize(760, 480)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Laufzeiten pro Stufe"))
+        self.table_histograms = QTableWidget(0, len(self.HISTOGRAM_COLUMNS))
+        self.table_histograms.setHorizontalHeaderLabels([title for title, _ in self.HISTOGRAM_COLUMNS])
+        self.table_histograms.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table_histograms.verticalHeader().setVisible(False)
+        layout.addWidget(self.table_histograms)
+
+        layout.addWidget(QLabel("Zähler"))
+        self.table_counters = QTableWidget(0, 2)
+        self.table_counters.setHorizontalHeaderLabels(["Name", "Wert"])
+        self.table_counters.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table_counters.verticalHeader().setVisible(False)
+        self.table_counters.setMaximumHeight(150)
+        layout.addWidget(self.table_counters)
+
+        button_layout = QHBoxLayout()
+        btn_reset = QPushButton("Zurücksetzen")
+        btn_reset.clicked.connect(self.reset)
+        button_layout.addWidget(btn_reset)
+        btn_export = QPushButton("Als JSON exportieren")
+        btn_export.clicked.connect(self.export_json)
+        button_layout.addWidget(btn_export)
+        button_layout.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        btn_close = QPushButton("Schließen")
+        btn_close.clicked.connect(self.close)
+        button_layout.addWidget(btn_close)
+        layout.addLayout(button_layout)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """Überträgt den aktuellen Stand der Registry in die Tabellen."""
+        snapshot = self.registry.snapshot()
+        histograms = snapshot["histograms"]
+        self.table_histograms.setRowCount(len(histograms))
+        for row, (name, summary) in enumerate(histograms.items()):
+            for column, (_, field) in enumerate(self.HISTOGRAM_COLUMNS):
+                if field is None:
+                    text = name
+                elif field == "count":
+                    text = str(summary[field])
+                else:
+                    text = f"{summary[field]:.3f}" if field == "total_s" else f"{summary[field]:.1f}"
+                self.table_histograms.setItem(row, column, QTableWidgetItem(text))
+
+        counters = snapshot["counters"]
+        self.table_counters.setRowCount(len(counters))
+        for row, (name, value) in enumerate(counters.items()):
+            self.table_counters.setItem(row, 0, QTableWidgetItem(name))
+            self.table_counters.setItem(row, 1, QTableWidgetItem(str(value)))
+
+    def reset(self):
+        self.registry.reset()
+        self.refresh()
+
+    def export_json(self):
+        """Speichert den aktuellen Stand als JSON-Datei."""
+        if not os.path.exists("./Exports/"):
+            os.makedirs("./Exports/")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Performance-Daten speichern", "./Exports/performance.json",
+                                                   "JSON Files (*.json)")
+        if file_path:
+            self.registry.save_json(file_path)
@@ -0,0 +1,662 @@
+import pickle
+import threading
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+import numpy as np
+
+import matplotlib.dates as mdates
+from matplotlib import colormaps, colors as mcolors
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from ColumnStore import grow_buffer
+from Downsampling import is_sorted, lttb, minmax_downsample, ohlc_downsample
+from MarketstackClient import LoadCancelled
+from Metrics import metrics
+
+
+class PlotFigure:
+    """
+    Backend-unabhängige Plot-Logik und Gestaltung im dunklen Theme der Anwendung.
+
+    Wird als Mixin vor einer Matplotlib-FigureCanvas-Klasse verwendet: mit FigureCanvasQTAgg in der GUI (PlotCanvas)
+    und mit FigureCanvasAgg ohne Qt für das Rendern im Hintergrund (BatchRender). Dadurch sehen Diagramme in beiden
+    Fällen gleich aus.
+    """
+
+    def __init__(self, width: float = 5, height: float = 4, dpi: int = 100, lod: bool = True):
+        """
+        :param width: Breite der Figure in Zoll.
+        :param height: Höhe der Figure in Zoll.
+        :param dpi: Auflösung der Figure.
+        :param lod: Ob lange Linien- und Scatter-Plots automatisch auf etwa die Pixelbreite der Achse reduziert
+            werden (Level of Detail). Beim Zoomen und Verschieben wird der sichtbare Ausschnitt neu berechnet.
+        """
+        self.lod = lod
+        # Vollständige Daten des aktuellen LOD-Plots: (Artist, Diagrammtyp, x-Werte, y-Werte)
+        self._lod_state = None
+        # Puffer mit Reservekapazität, in die extend_plot die Linien- bzw. LOD-Daten fortschreibt
+        self._lod_buffers = None
+        # Fortgeschriebene Liniendaten als Sichten auf diese Puffer und die x-Daten, zu denen sie gehören
+        self._line_data = None
+        # Kerzendiagramm: Artists (Dochte, Körper, Volumen) und vollständige OHLCV-Daten
+        self._candle_state = None
+        # Retained Mode: aktueller Daten-Artist, die Parameter des letzten plot()-Aufrufs und der Hintergrund
+        self._artist = None
+        self._plot_state = None
+        self._background = None
+        # Farbskala der Heatmap; belegt eine eigene Achse neben dem Diagramm
+        self._colorbar = None
+
+        self.fig = Figure(figsize=(width, height), dpi=dpi, tight_layout=True)
+        self.fig.set_facecolor('#19232D')  # Hintergrundfarbe des gesamten Plots
+
+        # Achsen konfigurieren; die Volumenachse existiert nur im Kerzendiagramm
+        self.ax = self._style_axes(self.fig.add_subplot(111))
+        self.volume_ax = None
+
+        # Die nächste Klasse in der MRO ist die FigureCanvas des jeweiligen Backends
+        super().__init__(self.fig)
+        self.mpl_connect("resize_event", lambda event: self._update_lod(self.ax))
+        self.mpl_connect("draw_event", self._on_draw)
+
+    @metrics.timed("plot.build")
+    def plot(self, x_data: List[Any], y_data: List[Any], title: str = "", x_label: str = "", y_label: str = "",
+             diagram_typ: str = "Linie", color: str = "lime", legend: bool = False, legend_title=None, legend_text=None,
+             colorbar: bool = False
+             ):
+        """
+        Plottet die übergebenen Daten anhand der gewünschten Parameter.
+
+        Wird erneut mit demselben Diagrammtyp (Linie oder Scatter) geplottet, bleibt der vorhandene Artist erhalten
+        und wird nur aktualisiert. Reine Farbänderungen werden per Blitting über den zwischengespeicherten
+        Hintergrund gezeichnet, ohne die Figure neu aufzubauen.
+
+        :param x_data: Daten für die x-Achse.
+        :param y_data: Daten für die y-Achse.
+        :param title: Plot-Titel.
+        :param x_label: Beschriftung der x-Achse.
+        :param y_label: Beschriftung der y-Achse.
+        :param diagram_typ: Typ des Diagramms: "Linie", "Scatter" oder "Bar".
+        :param color: Farbe der Darstellung.
+        :param legend: Ob eine Legende angezeigt wird.
+        :param legend_title: Titel der Legende.
+        :param legend_text: Text der Legende.
+        :param colorbar: Ob ein Colorbar hinzugefügt wird (gilt vor allem für Scatter-Plots).
+        """
+        label = f"{x_label} vs. {y_label}"
+        state = dict(diagram_typ=diagram_typ, x_kind=np.asarray(x_data).dtype.kind, x_data=x_data, y_data=y_data,
+                     color=color, labels=(title, x_label, y_label),
+                     legend=(legend, legend_title, legend_text, label))
+        previous = self._plot_state
+        data_changed = previous is not None and not (self._same_data(x_data, previous["x_data"])
+                                                     and self._same_data(y_data, previous["y_data"]))
+        # Scatter-Punkte werden in place ersetzt, solange beide Achsen numerisch bzw. Datumswerte sind
+        scatter_numeric = state["x_kind"] in "iufM" and np.asarray(y_data).dtype.kind in "iuf"
+
+        if (self._artist is None or diagram_typ not in ("Linie", "Scatter")
+                or any(state[key] != previous[key] for key in ("diagram_typ", "x_kind"))
+                or (diagram_typ == "Scatter" and data_changed and not scatter_numeric)):
+            self._build_plot(x_data, y_data, diagram_typ, color, label, colorbar)
+            self._apply_style(title, x_label, y_label)
+            self._update_legend(legend, legend_title, legend_text)
+            self._plot_state = state
+            self.draw()
+            return
+
+        full_redraw = False
+        if data_changed:
+            self._lod_state = None
+            x_plot, y_plot, lod = self._prepare_lod(x_data, y_data, diagram_typ)
+            if diagram_typ == "Scatter":
+                x_plot = np.asarray(x_plot)
+                if x_plot.dtype.kind == "M":
+                    x_plot = mdates.date2num(x_plot)
+                self._artist.set_offsets(np.column_stack((np.asarray(x_plot, dtype=np.float64),
+                                                          np.asarray(y_plot, dtype=np.float64))))
+            else:
+                self._artist.set_data(x_plot, y_plot)
+            if lod:
+                self._lod_state = (self._artist, diagram_typ, *lod)
+            self.ax.relim()
+            self.ax.set_autoscale_on(True)
+            self.ax.autoscale_view()
+            full_redraw = True
+        if color != previous["color"]:
+            self._artist.set_color(color)
+            # Die Legende übernimmt die Farbe nur beim Erstellen
+            full_redraw = full_redraw or legend
+        if state["labels"] != previous["labels"]:
+            self._artist.set_label(label)
+            self._apply_style(title, x_label, y_label)
+            full_redraw = True
+        if full_redraw or state["legend"] != previous["legend"]:
+            self._update_legend(legend, legend_title, legend_text)
+            full_redraw = True
+        self._plot_state = state
+
+        if full_redraw:
+            self.draw_idle()
+        elif color != previous["color"]:
+            self._blit_artist()
+
+    @metrics.timed("plot.extend")
+    def extend_plot(self, x_data: np.ndarray, y_data: np.ndarray, n_new: int, color: str = None) -> bool:
+        """
+        Aktualisiert einen Linienplot, an dessen Daten neue Punkte angehängt wurden (Live-Modus), ohne ihn neu
+        aufzubauen. Der vorhandene Artist wird in place aktualisiert; umgewandelt und in die Puffer der Linie bzw. die
+        LOD-Daten übernommen werden nur die neuen Punkte. Zeigt die Achse bisher das Ende der Daten, folgt sie den
+        neuen Punkten.
+
+        :param x_data: Vollständige, nach x sortierte Daten wie beim nächsten plot()-Aufruf; der Anfang darf beim
+            Verschieben eines Zeitraums wegfallen, die letzten n_new Punkte sind neu.
+        :param y_data: Zugehörige y-Werte.
+        :param n_new: Anzahl der neuen Punkte am Ende.
+        :param color: Neue Farbe der Linie; None lässt sie unverändert.
+        :return: False, wenn kein passender Linienplot existiert; dann muss mit plot() neu gezeichnet werden.
+        """
+        state = self._plot_state
+        x_data, y_data = np.asarray(x_data), np.asarray(y_data)
+        if (self._artist is None or state is None or state["diagram_typ"] != "Linie" or not len(x_data)
+                or x_data.dtype.kind != state["x_kind"] or not 0 <= n_new <= len(x_data)):
+            return False
+
+        x_new = x_data[len(x_data) - n_new:]
+        if x_data.dtype.kind == "M":
+            x_new = mdates.date2num(x_new)
+        x_new = np.asarray(x_new, dtype=np.float64)
+        y_new = np.asarray(y_data[len(y_data) - n_new:], dtype=np.float64)
+        x_min, x_max = self.ax.get_xlim()
+
+        if self._lod_state is None:
+            # Kurze Reihen werden direkt gezeichnet; wird die Reihe zu lang, übernimmt plot() das Level of Detail
+            if self.lod and len(x_data) > 2 * self._lod_target():
+                return False
+            if self._line_data is not None and self._line_data[2] is state["x_data"]:
+                x_old, y_old = self._line_data[:2]
+            else:
+                # Erstes Fortschreiben nach plot(): die Daten des Artists einmalig umwandeln
+                x_old, y_old = np.asarray(self._artist.get_xdata()), np.asarray(self._artist.get_ydata())
+                if x_old.dtype.kind == "M":
+                    x_old = mdates.date2num(x_old)
+                x_old, y_old = np.asarray(x_old, dtype=np.float64), np.asarray(y_old, dtype=np.float64)
+            dropped = len(x_old) + n_new - len(x_data)
+            if dropped < 0 or len(y_old) != len(x_old):
+                return False
+            x_last = x_old[-1] if len(x_old) else -np.inf
+            # Fällt der Anfang weg, beginnen die bisherigen Werte nicht mehr am Pufferanfang; grow_buffer legt
+            # dann einen neuen Puffer an
+            buffers = self._lod_buffers or (None, None)
+            x_buffer = grow_buffer(buffers[0], x_old[dropped:], x_new)
+            y_buffer = grow_buffer(buffers[1], y_old[dropped:], y_new)
+            self._lod_buffers = (x_buffer, y_buffer)
+            end = len(x_old) - dropped + n_new
+            self._line_data = (x_buffer[:end], y_buffer[:end], x_data)
+            self._artist.set_data(*self._line_data[:2])
+        else:
+            artist, diagram_typ, x_values, y_values = self._lod_state
+            if len(x_new) and len(x_values) and x_new[0] < x_values[-1]:
+                return False
+            x_last = x_values[-1] if len(x_values) else -np.inf
+            # Die LOD-Daten wachsen in eigenen Puffern mit Reservekapazität
+            buffers = self._lod_buffers or (None, None)
+            x_buffer = grow_buffer(buffers[0], x_values, x_new)
+            y_buffer = grow_buffer(buffers[1], y_values, y_new)
+            self._lod_buffers = (x_buffer, y_buffer)
+            end = len(x_values) + len(x_new)
+            self._lod_state = (artist, diagram_typ, x_buffer[:end], y_buffer[:end])
+
+        if x_max >= x_last:
+            x_first = mdates.date2num(x_data[0]) if x_data.dtype.kind == "M" else float(x_data[0])
+            x_end = x_new[-1] if len(x_new) else x_last
+            # set_xlim berechnet über xlim_changed den sichtbaren LOD-Ausschnitt neu
+            self.ax.set_xlim(x_first, x_end if x_end > x_first else x_first + 1)
+            y_visible = np.asarray(self._artist.get_ydata(), dtype=np.float64)
+            if self._lod_state is None:
+                y_visible = y_data
+            y_low, y_high = np.nanmin(y_visible), np.nanmax(y_visible)
+            if np.isfinite(y_low) and np.isfinite(y_high):
+                margin = (y_high - y_low) * self.ax.margins()[1] or 1
+                self.ax.set_ylim(y_low - margin, y_high + margin)
+
+        if color is not None and color != state["color"]:
+            self._artist.set_color(color)
+        self._plot_state = dict(state, x_data=x_data, y_data=y_data, color=color or state["color"])
+        self.draw_idle()
+        return True
+
+    @staticmethod
+    def _same_data(a: Any, b: Any) -> bool:
+        """
+        Prüft, ob zwei Datenreihen dieselben Werte sind: dasselbe Objekt oder Sichten auf denselben Speicherbereich
+        (z. B. zweimal derselbe Zeitraum einer schreibgeschützten Spalte).
+        """
+        if a is b:
+            return True
+        if not isinstance(a, np.ndarray) or not isinstance(b, np.ndarray) or a.flags.writeable or b.flags.writeable:
+            return False
+        return (a.__array_interface__["data"][0] == b.__array_interface__["data"][0] and a.shape == b.shape
+                and a.strides == b.strides and a.dtype == b.dtype)
+
+    def _build_plot(self, x_data: List[Any], y_data: List[Any], diagram_typ: str, color: str, label: str,
+                    colorbar: bool):
+        """Baut die Achse mit einem neuen Daten-Artist vollständig neu auf."""
+        self._reset_axes()
+        self.ax.callbacks.connect("xlim_changed", self._update_lod)
+        x_data, y_data, lod = self._prepare_lod(x_data, y_data, diagram_typ)
+
+        if diagram_typ == "Linie":
+            artist, = self.ax.plot(x_data, y_data, marker='', linestyle='-', color=color, label=label)
+        elif diagram_typ == "Scatter":
+            artist = self.ax.scatter(x_data, y_data, c=color, label=label)
+            if colorbar:
+                # self.fig.colorbar(matplotlib.cm.ScalarMappable(cmap='OrRd'), ax=self.ax)
+                pass
+        elif diagram_typ == "Bar":
+            artist = self.ax.bar(x_data, y_data, color=color, label=label)
+        else:
+            artist, = self.ax.plot(x_data, y_data, marker='', linestyle='-', c=color, label=label)
+
+        if lod:
+            self._lod_state = (artist, diagram_typ, *lod)
+
+        # Linien und Scatter werden separat vom Hintergrund gezeichnet, damit sie per Blitting aktualisiert werden
+        # können. Balken werden bei jeder Änderung neu aufgebaut.
+        self._artist = artist if diagram_typ != "Bar" else None
+        if self._artist is not None and self.supports_blit:
+            self._artist.set_animated(True)
+
+    def _update_legend(self, legend: bool, legend_title: str = None, legend_text: str = None):
+        """Entfernt eine vorhandene Legende und erstellt sie bei Bedarf neu."""
+        old_legend = self.ax.get_legend()
+        if old_legend is not None:
+            old_legend.remove()
+
+        # Legende anpassen
+        if legend:
+            leg = self.ax.legend() if not legend_title else self.ax.legend(title=legend_title)
+            self._style_legend(leg, legend_text)
+
+    def draw(self):
+        """Zeichnet die Figure vollständig neu; die Dauer wird unter "plot.draw" erfasst."""
+        with metrics.timer("plot.draw"):
+            super().draw()
+
+    def _on_draw(self, event):
+        """Speichert nach jedem vollständigen Zeichnen den Hintergrund und zeichnet den animierten Artist darüber."""
+        self._background = self.copy_from_bbox(self.ax.bbox)
+        if self._artist is not None and self._artist.get_animated():
+            self.ax.draw_artist(self._artist)
+
+    def _blit_artist(self):
+        """Zeichnet nur den Daten-Artist über den zwischengespeicherten Hintergrund."""
+        if self._background is None or not self._artist.get_animated():
+            self.draw_idle()
+            return
+        with metrics.timer("plot.blit"):
+            self.restore_region(self._background)
+            self.ax.draw_artist(self._artist)
+            self.blit(self.ax.bbox)
+
+    def save_figure(self, file_path: str, **kwargs):
+        """
+        Speichert die Figure als Bild. Für das Blitting animierte Artists werden dabei regulär mitgezeichnet.
+
+        :param file_path: Zielpfad; das Format ergibt sich aus der Dateiendung.
+        :param kwargs: Weitere Argumente für Figure.savefig.
+        """
+        animated = self._artist is not None and self._artist.get_animated()
+        if animated:
+            self._artist.set_animated(False)
+        try:
+            with metrics.timer("plot.save"):
+                self.fig.savefig(file_path, **kwargs)
+        finally:
+            if animated:
+                self._artist.set_animated(True)
+
+    def snapshot(self) -> bytes:
+        """
+        Erstellt eine unabhängige Kopie der Figure, die mit save_snapshot in einem Hintergrund-Thread gespeichert
+        werden kann, während der Canvas weiter gezeichnet wird. Die Kopie enthält die aktuell gezeichneten (bei
+        langen Reihen bereits reduzierten) Daten und ist daher klein.
+
+        :return: Serialisierte Figure.
+        """
+        animated = self._artist is not None and self._artist.get_animated()
+        if animated:
+            self._artist.set_animated(False)
+        try:
+            return pickle.dumps(self.fig)
+        finally:
+            if animated:
+                self._artist.set_animated(True)
+            # savefig kann den Hintergrund in anderer Auflösung zwischengespeichert haben
+            self.draw_idle()
+
+    @metrics.timed("plot.build")
+    def plot_multi(self, series: Dict[str, Tuple[Any, Any]], title: str = "", x_label: str = "", y_label: str = "",
+                   legend: bool = False, cmap: str = "turbo"):
+        """
+        Überlagert viele Linien (z. B. ein Symbol-Korb) in einer einzigen LineCollection. Statt eines
+        Plot-Aufrufs pro Linie wird nur ein Artist erzeugt und gezeichnet.
+
+        :param series: Dict von Beschriftung zu (x_data, y_data).
+        :param title: Plot-Titel.
+        :param x_label: Beschriftung der x-Achse.
+        :param y_label: Beschriftung der y-Achse.
+        :param legend: Ob eine Legende angezeigt wird.
+        :param cmap: Name der Colormap, aus der die Linienfarben gewählt werden.
+        """
+        self._reset_axes()
+        self._artist = None
+        self._plot_state = None
+
+        segments = []
+        for x_data, y_data in series.values():
+            x_data = np.asarray(x_data)
+            if np.issubdtype(x_data.dtype, np.datetime64):
+                self.ax.xaxis_date()
+                x_data = mdates.date2num(x_data)
+            segments.append(np.column_stack((x_data, np.asarray(y_data, dtype=np.float64))))
+
+        colors = colormaps[cmap](np.linspace(0, 1, max(len(segments), 1)))
+        self.ax.add_collection(LineCollection(segments, colors=colors, linewidths=1))
+        self.ax.autoscale_view()
+
+        self._apply_style(title, x_label, y_label)
+
+        if legend:
+            # Platzhalter-Linien ohne Daten, damit jede Serie einen eigenen Legendeneintrag erhält
+            handles = [Line2D([], [], color=color, label=label) for label, color in zip(series, colors)]
+            leg = self.ax.legend(handles=handles, ncol=max(1, len(handles) // 10), fontsize="small")
+            self._style_legend(leg)
+
+        self.draw()
+
+    @metrics.timed("plot.build")
+    def plot_heatmap(self, matrix: np.ndarray, labels: List[str], title: str = "", cmap: str = "RdYlGn",
+                     vmin: float = -1.0, vmax: float = 1.0, colorbar_label: str = ""):
+        """
+        Zeichnet eine quadratische Matrix (z. B. Korrelationen) als Heatmap mit Farbskala. Die gesamte Matrix ist
+        ein einziges Bild; bei sehr vielen Zeilen werden nur einzelne Beschriftungen angezeigt.
+
+        :param matrix: Werte der Form (n, n); NaN bleibt leer.
+        :param labels: Beschriftung der Zeilen und Spalten.
+        :param title: Plot-Titel.
+        :param cmap: Name der Colormap.
+        :param vmin: Wert am unteren Ende der Farbskala.
+        :param vmax: Wert am oberen Ende der Farbskala.
+        :param colorbar_label: Beschriftung der Farbskala.
+        """
+        self._reset_axes()
+        self._artist = None
+        self._plot_state = None
+
+        image = self.ax.imshow(np.asarray(matrix, dtype=np.float64), cmap=cmap, vmin=vmin, vmax=vmax,
+                               interpolation="nearest", aspect="auto")
+        # Höchstens etwa 40 Beschriftungen je Achse bleiben lesbar
+        step = max(1, int(np.ceil(len(labels) / 40)))
+        ticks = np.arange(0, len(labels), step)
+        self.ax.set_xticks(ticks, [labels[i] for i in ticks], rotation=90, fontsize="small")
+        self.ax.set_yticks(ticks, [labels[i] for i in ticks], fontsize="small")
+        self._apply_style(title, "", "")
+        self.ax.grid(False)
+
+        self._colorbar = self.fig.colorbar(image, ax=self.ax)
+        self._colorbar.set_label(colorbar_label, color='white')
+        self._colorbar.ax.tick_params(colors='white')
+        self.draw()
+
+    def _lod_target(self) -> int:
+        """Anzahl der Buckets für das Level of Detail: die aktuelle Breite der Achse in Pixeln."""
+        return max(100, int(self.ax.bbox.width))
+
+    def _prepare_lod(self, x_data: List[Any], y_data: List[Any], diagram_typ: str):
+        """
+        Reduziert lange, nach x sortierte Linien- und Scatter-Daten für die erste Darstellung.
+
+        :return: Tupel (x_data, y_data, lod); lod ist (x-Werte, y-Werte) der vollständigen Daten oder None, wenn
+            nicht reduziert wird.
+        """
+        x_values = np.asarray(x_data)
+        y_values = np.asarray(y_data)
+        if (not self.lod or diagram_typ == "Bar" or len(x_values) <= 2 * self._lod_target()
+                or x_values.dtype.kind not in "iufM" or y_values.dtype.kind not in "iuf"):
+            return x_data, y_data, None
+
+        if x_values.dtype.kind == "M":
+            # Datumswerte als Matplotlib-Zahlen, damit Achsengrenzen und Daten direkt vergleichbar sind
+            self.ax.xaxis_date()
+            x_values = mdates.date2num(x_values)
+        x_values = x_values.astype(np.float64, copy=False)
+        y_values = y_values.astype(np.float64, copy=False)
+        if not is_sorted(x_values):
+            return x_data, y_data, None
+
+        x_reduced, y_reduced = self._downsample(diagram_typ, x_values, y_values)
+        return x_reduced, y_reduced, (x_values, y_values)
+
+    def _downsample(self, diagram_typ: str, x_values: np.ndarray, y_values: np.ndarray):
+        if diagram_typ == "Scatter":
+            return lttb(x_values, y_values, 2 * self._lod_target())
+        return minmax_downsample(x_values, y_values, self._lod_target())
+
+    def _update_lod(self, ax):
+        """Berechnet nach Zoom, Verschieben oder Größenänderung den sichtbaren Ausschnitt neu."""
+        if self._candle_state is not None:
+            self._update_candles()
+            return
+        if self._lod_state is None:
+            return
+        artist, diagram_typ, x_values, y_values = self._lod_state
+        x_min, x_max = ax.get_xlim()
+        # Je ein Punkt außerhalb des sichtbaren Bereichs, damit die Linie bis zum Rand reicht
+        start = max(int(np.searchsorted(x_values, x_min, side="left")) - 1, 0)
+        end = min(int(np.searchsorted(x_values, x_max, side="right")) + 1, len(x_values))
+        x_reduced, y_reduced = self._downsample(diagram_typ, x_values[start:end], y_values[start:end])
+        if diagram_typ == "Scatter":
+            artist.set_offsets(np.column_stack((x_reduced, y_reduced)))
+        else:
+            artist.set_data(x_reduced, y_reduced)
+
+    @metrics.timed("plot.build")
+    def plot_candles(self, dates: Any, open_: Any, high: Any, low: Any, close: Any, volume: Any = None,
+                     title: str = "", x_label: str = "", y_label: str = "", volume_label: str = "Volume",
+                     up_color: str = "lime", down_color: str = "crimson"):
+        """
+        Zeichnet ein Candlestick-Diagramm, optional mit Volumen-Subplot darunter.
+
+        Statt eines Rechtecks pro Kerze werden alle Körper in einer PolyCollection, alle Dochte in einer
+        LineCollection und alle Volumenbalken in einer weiteren PolyCollection gezeichnet. Gibt es mehr Kerzen als
+        sinnvoll darstellbar, werden benachbarte Kerzen zu OHLC-Buckets zusammengefasst; beim Zoomen wird der
+        sichtbare Ausschnitt neu zusammengefasst.
+
+        :param dates: x-Werte (in der Regel Datumswerte), aufsteigend sortiert.
+        :param open_: Eröffnungskurse.
+        :param high: Hochs.
+        :param low: Tiefs.
+        :param close: Schlusskurse.
+        :param volume: Volumen; None oder leer, wenn kein Volumen-Subplot gezeichnet wird.
+        :param title: Plot-Titel.
+        :param x_label: Beschriftung der x-Achse.
+        :param y_label: Beschriftung der Kursachse.
+        :param volume_label: Beschriftung der Volumenachse.
+        :param up_color: Farbe steigender Kerzen (Schluss >= Eröffnung).
+        :param down_color: Farbe fallender Kerzen.
+        """
+        x_values = np.asarray(dates)
+        with_volume = volume is not None and len(volume) > 0
+        self._reset_axes(volume=with_volume)
+        self._artist = None
+        self._plot_state = None
+        if x_values.dtype.kind == "M":
+            self.ax.xaxis_date()
+            x_values = mdates.date2num(x_values)
+        data = tuple(np.asarray(values, dtype=np.float64)
+                     for values in (x_values, open_, high, low, close, volume if with_volume else []))
+
+        wicks = LineCollection([], linewidths=1)
+        bodies = PolyCollection([], linewidths=0.5)
+        volume_bars = PolyCollection([], linewidths=0, alpha=0.6) if with_volume else None
+        self._candle_state = dict(artists=(wicks, bodies, volume_bars), data=data,
+                                  colors=(mcolors.to_rgba(up_color), mcolors.to_rgba(down_color)),
+                                  sorted=is_sorted(data[0]))
+        self._set_candles(*self._reduce_candles(*data))
+        self.ax.add_collection(wicks)
+        self.ax.add_collection(bodies)
+        self._set_candle_limits()
+
+        self._apply_style(title, "" if with_volume else x_label, y_label)
+        if with_volume:
+            self.volume_ax.add_collection(volume_bars)
+            self._apply_style("", x_label, volume_label, ax=self.volume_ax)
+            self.ax.tick_params(axis='x', labelbottom=False)
+        self.ax.callbacks.connect("xlim_changed", self._update_lod)
+        self.draw()
+
+    def _reduce_candles(self, x: np.ndarray, *ohlcv: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Fasst die Kerzen auf etwa ein Drittel der Achsenbreite in Pixeln zusammen (mindestens 3 Pixel je Kerze)."""
+        if not self.lod or not self._candle_state["sorted"]:
+            return (x, *ohlcv)
+        return ohlc_downsample(x, *ohlcv, max(50, int(self.ax.bbox.width) // 3))
+
+    def _set_candles(self, x: np.ndarray, open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     volume: np.ndarray):
+        """Berechnet die Geometrie aller Kerzen vektorisiert und überträgt sie in die Collections."""
+        wicks, bodies, volume_bars = self._candle_state["artists"]
+        up_color, down_color = self._candle_state["colors"]
+        # Kerzenbreite: 70 % des typischen Abstands zweier Kerzen
+        width = 0.7 * (float(np.median(np.diff(x))) if len(x) > 1 else 1.0)
+        left, right = x - width / 2, x + width / 2
+        face_colors = np.where((close >= open_)[:, None], up_color, down_color)
+
+        wicks.set_segments(np.stack((np.column_stack((x, low)), np.column_stack((x, high))), axis=1))
+        wicks.set_color(face_colors)
+        bodies.set_verts(self._rectangles(left, right, np.fmin(open_, close), np.fmax(open_, close)))
+        bodies.set_facecolor(face_colors)
+        bodies.set_edgecolor(face_colors)
+        if volume_bars is not None:
+            volume_bars.set_verts(self._rectangles(left, right, np.zeros_like(volume), volume))
+            volume_bars.set_facecolor(face_colors)
+            # Zusammengefasste Buckets summieren das Volumen; die Achse folgt daher dem sichtbaren Maximum
+            peak = float(np.nanmax(volume)) if len(volume) and not np.isnan(volume).all() else 0.0
+            self.volume_ax.set_ylim(0, max(peak, 1.0) * 1.05)
+
+    @staticmethod
+    def _rectangles(left: np.ndarray, right: np.ndarray, bottom: np.ndarray, top: np.ndarray) -> np.ndarray:
+        """Erzeugt die Eckpunkte vieler Rechtecke als Array der Form (n, 4, 2)."""
+        verts = np.empty((len(left), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = left
+        verts[:, 2, 0] = verts[:, 3, 0] = right
+        verts[:, 0, 1] = verts[:, 3, 1] = bottom
+        verts[:, 1, 1] = verts[:, 2, 1] = top
+        return verts
+
+    def _set_candle_limits(self):
+        """Setzt die Achsengrenzen auf den gesamten Datenbereich."""
+        x, _, high, low = self._candle_state["data"][:4]
+        if not len(x):
+            return
+        margin = 0.5 * (float(np.median(np.diff(x))) if len(x) > 1 else 1.0)
+        y_min, y_max = float(np.nanmin(low)), float(np.nanmax(high))
+        padding = 0.05 * (y_max - y_min) or 1.0
+        self.ax.set_ylim(y_min - padding, y_max + padding)
+        self.ax.set_xlim(x[0] - margin, x[-1] + margin)
+
+    def _update_candles(self):
+        """Fasst nach Zoom oder Größenänderung die sichtbaren Kerzen neu zusammen."""
+        data = self._candle_state["data"]
+        if not self._candle_state["sorted"]:
+            return
+        x_min, x_max = self.ax.get_xlim()
+        start = max(int(np.searchsorted(data[0], x_min, side="left")) - 1, 0)
+        end = min(int(np.searchsorted(data[0], x_max, side="right")) + 1, len(data[0]))
+        self._set_candles(*self._reduce_candles(*(values[start:end] if len(values) else values for values in data)))
+
+    def _reset_axes(self, volume: bool = False):
+        """
+        Leert die Achsen für einen neuen Plot. Wechselt die Aufteilung (eine Achse oder Kurs- und Volumenachse mit
+        gemeinsamer x-Achse), werden die Achsen neu angelegt.
+        """
+        self._lod_state = None
+        self._candle_state = None
+        # Die Farbskala hat die Achse verkleinert; das Layout wird daher neu angelegt
+        colorbar, self._colorbar = self._colorbar, None
+        if (self.volume_ax is not None) == volume and colorbar is None:
+            self.ax.clear()
+            if self.volume_ax is not None:
+                self.volume_ax.clear()
+            return
+
+        self.fig.clear()
+        if volume:
+            grid = self.fig.add_gridspec(2, 1, height_ratios=(3, 1))
+            self.ax = self._style_axes(self.fig.add_subplot(grid[0]))
+            self.volume_ax = self._style_axes(self.fig.add_subplot(grid[1], sharex=self.ax))
+        else:
+            self.ax = self._style_axes(self.fig.add_subplot(111))
+            self.volume_ax = None
+
+    @staticmethod
+    def _style_axes(ax):
+        """Färbt eine neue Achse passend zum dunklen Theme."""
+        ax.set_facecolor('#19232D')  # Hintergrundfarbe des Diagramms
+        ax.title.set_color('white')
+        ax.xaxis.label.set_color('white')
+        ax.yaxis.label.set_color('white')
+        ax.tick_params(axis='both', colors='white')
+        return ax
+
+    def _apply_style(self, title: str, x_label: str, y_label: str, ax=None):
+        """Setzt Titel und Achsenbeschriftungen und färbt Texte und Grid passend zum dunklen Theme."""
+        ax = ax if ax is not None else self.ax
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+
+        # Textfarbe ändern
+        ax.title.set_color('white')
+        ax.xaxis.label.set_color('white')
+        ax.yaxis.label.set_color('white')
+        ax.tick_params(axis='both', colors='white')
+
+        # Grid konfigurieren
+        ax.grid(True, axis='both', color='#404240', linestyle='-', linewidth=1)
+
+    @staticmethod
+    def _style_legend(leg, legend_text: str = None):
+        """Passt die Farben einer Legende an das dunkle Theme an und ersetzt optional deren Text."""
+        leg.get_frame().set_facecolor('#19232D')
+        leg.get_title().set_color('white')
+
+        for text in leg.get_texts():
+            text.set_text(legend_text if legend_text else text.get_text())
+            text.set_color('white')
+
+
+def save_snapshot(snapshot: bytes, file_path: str, progress: Optional[Callable[[int, int], None]] = None,
+                  cancel_event: Optional[threading.Event] = None, **kwargs) -> str:
+    """
+    Speichert eine mit PlotFigure.snapshot oder DashboardFigure.snapshot erstellte Kopie als Bild. Gezeichnet wird
+    mit dem Agg-Backend, sodass die Funktion in einem Worker laufen kann, ohne den Canvas der GUI zu berühren.
+
+    :param snapshot: Serialisierte Figure.
+    :param file_path: Zielpfad; das Format ergibt sich aus der Dateiendung.
+    :param progress: Optionaler Callback progress(erledigt, gesamt).
+    :param cancel_event: Optionales Event; ist es vor dem Zeichnen gesetzt, wird nichts gespeichert.
+    :param kwargs: Weitere Argumente für Figure.savefig.
+    :return: Pfad der geschriebenen Datei.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = pickle.loads(snapshot)
+    FigureCanvasAgg(fig)
+    if cancel_event is not None and cancel_event.is_set():
+        raise LoadCancelled()
+    with metrics.timer("plot.save"):
+        fig.savefig(file_path, **kwargs)
+    if progress is not None:
+        progress(1, 1)
+    return file_path
@@ -0,0 +1,69 @@
+import threading
+from typing import Callable, Any
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from MarketstackClient import LoadCancelled
+
+
+class WorkerSignals(QObject):
+    """Signale eines Hintergrund-Workers. Sie werden im GUI-Thread zugestellt."""
+
+    progress = Signal(int, int)
+    preview = Signal(object)
+    finished = Signal(object)
+    error = Signal(str)
+    cancelled = Signal()
+    done = Signal()
+
+
+class Worker(QRunnable):
+    """
+    Führt eine Funktion im QThreadPool aus und meldet Fortschritt, Ergebnis oder Fehler über Qt-Signale.
+
+    Die Funktion erhält zusätzlich die Keyword-Argumente "progress" (Callback progress(erledigt, gesamt)) und
+    "cancel_event" (threading.Event), über die sie Fortschritt meldet bzw. einen Abbruch erkennt.
+
+    Der Aufrufer muss eine Referenz auf den Worker halten, bis das Signal "done" eingetroffen ist; sonst gibt Python
+    die Signale frei, während der Worker noch läuft.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args, preview: bool = False, **kwargs):
+        """
+        :param fn: Auszuführende Funktion.
+        :param args: Positionsargumente für fn.
+        :param preview: Wenn True, erhält fn zusätzlich das Keyword-Argument "preview", einen Callback für
+            Zwischenergebnisse, die über das Signal "preview" gemeldet werden.
+        :param kwargs: Keyword-Argumente für fn.
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self.cancel_event = threading.Event()
+        if preview:
+            self.kwargs["preview"] = self.signals.preview.emit
+
+    def cancel(self):
+        """Fordert den Abbruch an. Das Ergebnis eines abgebrochenen Workers wird nicht mehr gemeldet."""
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, progress=self.signals.progress.emit, cancel_event=self.cancel_event,
+                             **self.kwargs)
+        except LoadCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            if self.cancel_event.is_set():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.error.emit(str(e))
+        else:
+            if self.cancel_event.is_set():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
+        finally:
+            self.signals.done.emit()
@@ -0,0 +1,34 @@
+"""
+Gemeinsame Fixtures der Tests. Die Module des Projekts liegen flach im Wurzelverzeichnis und werden über sys.path
+gefunden.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Metrics import metrics  # noqa: E402
+from MockServer import MockState, start_server  # noqa: E402
+
+
+@pytest.fixture
+def mock_api():
+    """
+    Startet MockServer-Instanzen auf freien Ports und beendet sie nach dem Test.
+
+    :return: Funktion start(state) -> Basis-URL des Servers.
+    """
+    servers = []
+
+    def start(state: MockState) -> str:
+        server = start_server(state)
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    metrics.reset()
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,79 @@
+"""Korrelation, Kovarianz und Beta aus Analytics im Vergleich zu Pandas."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import Analytics
+
+
+@pytest.fixture
+def series():
+    """Drei Symbole mit gegeneinander verschobenen Handelstagen und je eigenen Lücken (z. B. Feiertagen)."""
+    rng = np.random.default_rng(7)
+    days = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-07-01")).astype("datetime64[ns]")
+    base = np.cumsum(rng.normal(0, 1, len(days))) + 100
+    result = {}
+    for n, symbol in enumerate(["AAPL", "MSFT", "SAP"]):
+        keep = rng.random(len(days)) > 0.1 * (n + 1)
+        prices = base + (n + 1) * np.cumsum(rng.normal(0, 1, len(days)))
+        result[symbol] = (days[keep], prices[keep])
+    return result
+
+
+def to_frame(series) -> pd.DataFrame:
+    return pd.DataFrame({symbol: pd.Series(values, index=dates) for symbol, (dates, values) in series.items()})
+
+
+def test_align_matches_pandas_outer_join(series):
+    index, symbols, matrix = Analytics.align(series)
+    expected = to_frame(series)
+    assert symbols == list(expected.columns)
+    np.testing.assert_array_equal(index, expected.index.values)
+    np.testing.assert_array_equal(matrix, expected.to_numpy())
+
+
+def test_returns_match_pct_change_per_symbol(series):
+    for symbol, (dates, values) in Analytics.returns(series).items():
+        expected = pd.Series(series[symbol][1]).pct_change().to_numpy()[1:]
+        np.testing.assert_array_equal(dates, series[symbol][0][1:])
+        np.testing.assert_allclose(values, expected)
+    log_returns = Analytics.returns(series, log=True)["SAP"][1]
+    np.testing.assert_allclose(log_returns, np.diff(np.log(series["SAP"][1])))
+
+
+@pytest.mark.parametrize("min_periods", [2, 60, 1000])
+def test_correlation_matrix_matches_dataframe_corr(series, min_periods):
+    _, symbols, matrix = Analytics.align(Analytics.returns(series))
+    expected = pd.DataFrame(matrix, columns=symbols).corr(min_periods=min_periods)
+    np.testing.assert_allclose(Analytics.correlation_matrix(matrix, min_periods), expected.to_numpy(), rtol=1e-10,
+                               atol=1e-12)
+
+
+@pytest.mark.parametrize("min_periods", [2, 60, 1000])
+def test_covariance_matrix_matches_dataframe_cov(series, min_periods):
+    _, symbols, matrix = Analytics.align(Analytics.returns(series))
+    expected = pd.DataFrame(matrix, columns=symbols).cov(min_periods=min_periods)
+    np.testing.assert_allclose(Analytics.covariance_matrix(matrix, min_periods), expected.to_numpy(), rtol=1e-10,
+                               atol=1e-15)
+
+
+def test_correlation_with_too_few_common_rows_is_nan():
+    matrix = np.array([[1.0, np.nan], [2.0, np.nan], [3.0, 1.0]])
+    expected = pd.DataFrame(matrix).corr()
+    np.testing.assert_array_equal(np.isnan(Analytics.correlation_matrix(matrix)), expected.isna().to_numpy())
+
+
+@pytest.mark.parametrize("window", [5, 20])
+def test_rolling_beta_matches_pandas_rolling(series, window):
+    _, symbols, matrix = Analytics.align(series)
+    # Beta gegenüber der ersten Reihe, nur über Tage, an denen alle Symbole gehandelt wurden
+    matrix = matrix[~np.isnan(matrix).any(axis=1)]
+    returns = np.diff(matrix, axis=0) / matrix[:-1]
+    frame = pd.DataFrame(returns, columns=symbols)
+    index = frame[symbols[0]]
+
+    beta = Analytics.rolling_beta(returns[:, 1:], returns[:, 0], window)
+    for column, symbol in enumerate(symbols[1:]):
+        expected = frame[symbol].rolling(window).cov(index) / index.rolling(window).var()
+        np.testing.assert_allclose(beta[:, column], expected.to_numpy(), rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(Analytics.rolling_beta(returns[:, 1], returns[:, 0], window), beta[:, 0])
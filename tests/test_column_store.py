@@ -0,0 +1,115 @@
+"""Typisierte Spalten, Sichten ohne Kopie, Anhängen mit Reservekapazität und Sortierung im ColumnStore."""
+import numpy as np
+import pytest
+
+from ColumnStore import ColumnStore, grow_buffer
+from DataManager import DataManager
+
+
+def make_records(n: int, start_day: int = 0):
+    return [{"date": f"{np.datetime64('2024-01-01') + start_day + i}T00:00:00+0000", "close": 100.0 + i,
+             "volume": 1000 + i, "symbol": "AAPL", "dividend": None if i % 2 else 0.5} for i in range(n)]
+
+
+def test_records_become_typed_columns():
+    store = ColumnStore.from_records(make_records(4))
+    assert store.schema == {"date": np.dtype("datetime64[ns]"), "close": np.dtype(np.float64),
+                            "volume": np.dtype(np.int64), "symbol": np.dtype(object),
+                            "dividend": np.dtype(np.float64)}
+    assert np.isnan(store.column("dividend")[1])
+    # Wiederkehrende Strings teilen sich ein Objekt
+    symbols = store.column("symbol")
+    assert all(symbol is symbols[0] for symbol in symbols)
+    assert store.to_records() == make_records(4)
+
+
+def test_get_column_data_returns_read_only_view_without_copy():
+    data_manager = DataManager()
+    data_manager.set_store(ColumnStore.from_records(make_records(10)))
+    values = data_manager.get_column_data("close")
+    assert np.shares_memory(values, data_manager.store.column("close"))
+    assert values.base is not None
+    with pytest.raises(ValueError):
+        values[0] = 0
+    assert len(data_manager.get_column_data("missing")) == 0
+
+
+def test_plottable_is_cached_and_view_shares_it():
+    store = ColumnStore.from_records(make_records(10))
+    volume = store.plottable("volume")
+    assert volume.dtype == np.float64 and store.plottable("volume") is volume
+    window = store.view(slice(2, 5))
+    assert np.shares_memory(window.plottable("volume"), volume)
+    assert list(window.column("close")) == [102.0, 103.0, 104.0]
+
+
+def test_grow_buffer_reuses_spare_capacity():
+    values = np.arange(3, dtype=np.float64)
+    buffer = grow_buffer(None, values, np.array([3.0]))
+    capacity = len(buffer)
+    assert capacity >= 1024 and list(buffer[:4]) == [0, 1, 2, 3]
+    # Solange die Kapazität reicht, wird in denselben Puffer geschrieben
+    assert grow_buffer(buffer, buffer[:4], np.array([4.0])) is buffer
+    # Reicht sie nicht, verdoppelt sich der Puffer
+    full = grow_buffer(buffer, buffer[:capacity], np.array([5.0]))
+    assert full is not buffer and len(full) == 2 * capacity
+    # Eine Sicht, die nicht am Pufferanfang beginnt, erhält einen neuen Puffer
+    shifted = grow_buffer(buffer, buffer[1:4], np.array([9.0]))
+    assert shifted is not buffer and list(shifted[:4]) == [1, 2, 3, 9]
+
+
+def test_append_grows_columns_in_place_and_keeps_old_views():
+    store = ColumnStore.from_records(make_records(5))
+    old_close = store.column("close")
+    dates = store.plottable("date")
+    store.append(ColumnStore.from_records(make_records(3, start_day=5)))
+    buffer = store._buffers["close"]
+    store.append(ColumnStore.from_records(make_records(2, start_day=8)))
+
+    assert len(store) == 10
+    assert store._buffers["close"] is buffer
+    assert list(store.column("close")) == [100.0 + i for i in range(5)] + [100.0 + i for i in range(3)] + [100.0, 101.0]
+    assert len(old_close) == 5 and len(dates) == 5
+    # Die plottbare Datumsspalte und die Sortierprüfung werden fortgeschrieben
+    assert len(store.plottable("date")) == 10
+    assert store.index_range("2024-01-09", None) == slice(8, 10)
+
+
+def test_index_range_selects_sorted_window():
+    store = ColumnStore.from_records(make_records(31))
+    assert store.index_range() == slice(0, 31)
+    assert store.index_range("2024-01-05", "2024-01-07") == slice(4, 7)
+    assert store.index_range(None, "2024-01-01") == slice(0, 1)
+    assert store.index_range("2024-03-01", None) == slice(31, 31)
+    assert store.index_range(101.5, 103.0, key="close") == slice(2, 4)
+
+    reversed_store = ColumnStore.from_records(make_records(5)[::-1])
+    with pytest.raises(ValueError):
+        reversed_store.index_range("2024-01-02", None)
+
+
+def test_sorted_by_puts_missing_strings_last():
+    store = ColumnStore({"symbol": ["MSFT", None, "AAPL", "IBM", None, "AAPL"], "close": [1, 2, 3, 4, 5, 6]})
+    result = store.sorted_by("symbol")
+    assert list(result.column("symbol")) == ["AAPL", "AAPL", "IBM", "MSFT", None, None]
+    assert list(result.column("close")) == [3, 6, 4, 1, 2, 5]
+
+    ordered = ColumnStore({"symbol": ["AAPL", "MSFT"], "close": [1, 2]})
+    assert ordered.sorted_by("symbol") is ordered
+
+
+def test_split_by_groups_rows_including_missing_values():
+    store = ColumnStore({"symbol": ["MSFT", None, "AAPL", "MSFT"], "close": [1.0, 2.0, 3.0, 4.0]})
+    groups = store.split_by("symbol")
+    assert set(groups) == {"AAPL", "MSFT", None}
+    assert list(groups["MSFT"].column("close")) == [1.0, 4.0]
+    assert list(groups[None].column("close")) == [2.0]
+
+
+def test_concat_widens_types_and_fills_missing_columns():
+    first = ColumnStore({"close": [1, 2]})
+    second = ColumnStore({"close": [2.5], "volume": [7]})
+    store = ColumnStore.concat([first, second])
+    assert store.schema["close"] == np.float64
+    assert list(store.column("close")) == [1.0, 2.0, 2.5]
+    assert np.isnan(store.column("volume")[:2]).all()
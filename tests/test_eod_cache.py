@@ -0,0 +1,107 @@
+"""SQLite-Cache für Tagesdaten: TTL, LRU-Verdrängung und inkrementelles Nachladen über den DataManager."""
+from contextlib import closing
+from urllib.parse import parse_qs
+
+import pytest
+
+import EodCache as eod_cache_module
+from DataManager import DataManager
+from EodCache import EodCache
+from MarketstackClient import MarketstackClient, RequestScheduler
+from MockServer import MockState
+
+
+def bars(symbol: str, days: range):
+    return [{"date": f"2024-02-{day:02d}T00:00:00+0000", "close": float(day), "symbol": symbol} for day in days]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EodCache(str(tmp_path / "eod.sqlite"))
+
+
+def test_get_returns_rows_sorted_by_date_and_counts_hits(cache):
+    assert cache.get("AAPL") is None
+    cache.put("AAPL", bars("AAPL", range(5, 0, -1)))
+    assert [row["close"] for row in cache.get("AAPL")] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert cache.newest_date("AAPL") == "2024-02-05"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_symbols_are_dropped(cache, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(eod_cache_module.time, "time", lambda: now[0])
+    cache.ttl = 60
+    cache.put("AAPL", bars("AAPL", range(1, 4)))
+    now[0] += 59
+    assert cache.get("AAPL") is not None
+    now[0] += 2
+    assert cache.get("AAPL") is None
+    assert cache.newest_date("AAPL") is None
+
+
+def test_least_recently_used_symbols_are_evicted(cache, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(eod_cache_module.time, "time", lambda: now[0])
+    rows = bars("AAPL", range(1, 11))
+    cache.put("AAPL", rows)
+    with closing(cache._connect()) as conn:
+        size = conn.execute("SELECT size_bytes FROM symbols").fetchone()[0]
+    cache.max_bytes = int(size * 2.5)
+
+    now[0] += 1
+    cache.put("MSFT", bars("MSFT", range(1, 11)))
+    now[0] += 1
+    cache.get("AAPL")
+    now[0] += 1
+    cache.put("IBM", bars("IBM", range(1, 11)))
+    # MSFT wurde am längsten nicht verwendet
+    assert cache.get("MSFT") is None
+    assert cache.get("AAPL") is not None and cache.get("IBM") is not None
+
+
+def make_data_manager(base_url: str, cache: EodCache) -> DataManager:
+    client = MarketstackClient(base_url, page_size=100, scheduler=RequestScheduler(rate=None))
+    return DataManager(client=client, cache=cache)
+
+
+def test_cached_symbol_is_topped_up_from_its_newest_day(mock_api, cache):
+    state = MockState(days=300, rate=0)
+    data_manager = make_data_manager(mock_api(state), cache)
+    # Die ersten 200 Tage liegen bereits im Cache
+    history = data_manager.client.fetch_eod("key", "AAPL", sort="ASC")
+    cache.put("AAPL", history[:200])
+    state.seen.clear()
+
+    store = data_manager.fetch_api("key", "AAPL")
+    assert len(store) == 300
+    assert len(cache.get("AAPL")) == 300
+    # Nachgeladen wurde nur ab dem Tag nach dem neuesten gecachten Datensatz
+    queries = [parse_qs(query) for query in state.seen]
+    assert len(queries) == 1 and queries[0]["date_from"] == [history[200]["date"][:10]]
+
+
+def test_full_load_is_cached_page_by_page(mock_api, cache):
+    state = MockState(days=250, rate=0)
+    data_manager = make_data_manager(mock_api(state), cache)
+    stores = data_manager.fetch_api_batch("key", ["AAPL", "MSFT"])
+    assert {symbol: len(store) for symbol, store in stores.items()} == {"AAPL": 250, "MSFT": 250}
+    assert len(cache.get("AAPL")) == 250 and len(cache.get("MSFT")) == 250
+
+
+def test_failed_load_leaves_no_partial_history(mock_api, cache):
+    state = MockState(days=500, rate=0)
+    data_manager = make_data_manager(mock_api(state), cache)
+    client, calls = data_manager.client, []
+    get_json = client.get_json
+
+    def failing_get_json(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 3:
+            raise RuntimeError("Verbindung unterbrochen")
+        return get_json(*args, **kwargs)
+
+    client.get_json = failing_get_json
+    with pytest.raises(ValueError):
+        data_manager.fetch_api("key", "AAPL")
+    assert cache.get("AAPL") is None
@@ -0,0 +1,82 @@
+"""JSON- und CSV-Export in Teilstücken im Vergleich zum früheren Export über json.dump und DataFrame.to_csv."""
+import gzip
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ColumnStore import ColumnStore
+from DataManager import DataManager
+from MarketstackClient import LoadCancelled
+
+
+def make_data_manager(n: int = 23) -> DataManager:
+    records = [{"open": 10.0 + i, "close": 10.5 + i, "volume": 100 + i, "adj_high": None if i % 4 else 11.25 + i,
+                "symbol": "AAPL", "exchange": "XNAS", "name": "Äpfel & Co",
+                "date": f"{np.datetime64('2024-01-01') + i}T00:00:00+0000"} for i in range(n)]
+    data_manager = DataManager()
+    data_manager.set_store(ColumnStore.from_records(records))
+    return data_manager
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 5, 1000])
+def test_json_export_matches_json_dump(tmp_path, chunk_rows):
+    data_manager = make_data_manager()
+    records = data_manager.to_records()
+    path = tmp_path / "eod.json"
+    data_manager.save_json(str(path), chunk_rows=chunk_rows)
+    assert path.read_text(encoding="utf-8") == json.dumps(records, ensure_ascii=False, indent=4)
+
+    compact = tmp_path / "eod_compact.json"
+    data_manager.save_json(str(compact), indent=None, chunk_rows=chunk_rows)
+    assert compact.read_text(encoding="utf-8") == json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 5, 1000])
+def test_csv_export_matches_dataframe_to_csv(tmp_path, chunk_rows):
+    data_manager = make_data_manager()
+    path = tmp_path / "eod.csv"
+    data_manager.save_csv(str(path), chunk_rows=chunk_rows)
+    expected = tmp_path / "expected.csv"
+    pd.DataFrame(data_manager.to_records()).to_csv(expected, index=False)
+    assert path.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+
+
+def test_gzip_export_round_trips(tmp_path):
+    data_manager = make_data_manager()
+    for name, save in (("eod.json.gz", data_manager.save_json), ("eod.csv.gz", data_manager.save_csv)):
+        path = tmp_path / name
+        save(str(path), chunk_rows=7)
+        with gzip.open(path, "rb") as f:
+            assert f.read(1)
+        store = DataManager.read_file(str(path))
+        np.testing.assert_array_equal(store.plottable("close"), data_manager.store.plottable("close"))
+        np.testing.assert_array_equal(store.plottable("date"), data_manager.store.plottable("date"))
+
+
+def test_export_reports_progress(tmp_path):
+    data_manager = make_data_manager()
+    progress = []
+    data_manager.save_json(str(tmp_path / "eod.json"), progress=lambda done, total: progress.append((done, total)),
+                           chunk_rows=10)
+    assert progress[-1] == (23, 23)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+def test_cancelled_export_keeps_existing_file(tmp_path):
+    path = tmp_path / "eod.json"
+    path.write_text("alt", encoding="utf-8")
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(LoadCancelled):
+        make_data_manager().save_json(str(path), cancel_event=cancel_event, chunk_rows=5)
+    assert path.read_text(encoding="utf-8") == "alt"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["eod.json"]
+
+
+def test_empty_store_exports_empty_array(tmp_path):
+    path = tmp_path / "eod.json"
+    DataManager().save_json(str(path))
+    assert json.loads(path.read_text(encoding="utf-8")) == []
@@ -0,0 +1,98 @@
+"""Gestreamter Import von JSON- und CSV-Dateien in Teilstücken."""
+import gzip
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import DataManager as data_manager_module
+from ColumnStore import ColumnStore
+from DataManager import DataManager
+from MarketstackClient import LoadCancelled
+
+
+def make_records(n: int):
+    # Absteigend wie die API; der Import sortiert nach Datum
+    return [{"open": 10.0 + i, "close": 10.5 + i, "volume": 100 + i, "symbol": "AAPL",
+             "adj_high": None if i % 3 else 11.0 + i,
+             "date": f"{np.datetime64('2024-01-01') + (n - 1 - i)}T00:00:00+0000"} for i in range(n)]
+
+
+def expected_store(records) -> ColumnStore:
+    return ColumnStore.from_records(records).sorted_by("date")
+
+
+def assert_same_store(actual: ColumnStore, expected: ColumnStore):
+    assert actual.keys() == expected.keys()
+    for key in expected.keys():
+        np.testing.assert_array_equal(actual.column(key), expected.column(key))
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_json_is_read_in_chunks(tmp_path, monkeypatch, compressed):
+    # Kleine Lesepuffer, damit Datensätze über Blockgrenzen hinweg zusammengesetzt werden müssen
+    monkeypatch.setattr(data_manager_module, "FILE_BLOCK_SIZE", 64)
+    records = make_records(57)
+    path = tmp_path / ("eod.json.gz" if compressed else "eod.json")
+    with (gzip.open(path, "wt", encoding="utf-8") if compressed else open(path, "w", encoding="utf-8")) as f:
+        json.dump(records, f, indent=4)
+
+    previews, progress = [], []
+    store = DataManager.read_file(str(path), progress=lambda done, total: progress.append(done),
+                                  preview=previews.append, chunk_rows=10)
+    assert_same_store(store, expected_store(records))
+    assert len(previews) == 1 and len(previews[0]) == 10
+    assert progress[-1] == 1000 and progress == sorted(progress)
+
+
+def test_csv_is_read_in_chunks(tmp_path):
+    records = make_records(45)
+    path = tmp_path / "eod.csv"
+    pd.DataFrame(records).to_csv(path, index=False)
+
+    previews = []
+    store = DataManager.read_file(str(path), preview=previews.append, chunk_rows=20)
+    expected = ColumnStore.from_frame(pd.read_csv(path)).sorted_by("date")
+    assert_same_store(store, expected)
+    assert len(previews[0]) == 20
+
+
+def test_chunked_json_matches_single_pass(tmp_path):
+    records = make_records(30)
+    path = tmp_path / "eod.json"
+    path.write_text(json.dumps(records, separators=(",", ":")), encoding="utf-8")
+    single = DataManager.read_file(str(path), chunk_rows=1000)
+    for chunk_rows in (1, 7, 30):
+        assert_same_store(DataManager.read_file(str(path), chunk_rows=chunk_rows), single)
+
+
+def test_cancelled_import_raises(tmp_path):
+    path = tmp_path / "eod.json"
+    path.write_text(json.dumps(make_records(20)), encoding="utf-8")
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(LoadCancelled):
+        DataManager.read_file(str(path), cancel_event=cancel_event, chunk_rows=5)
+
+
+@pytest.mark.parametrize("content, message", [
+    ('{"data": []}', "Array"),
+    ("[1, 2, 3]", "Element 1 ist kein Objekt"),
+    ('[{"date": "2024-01-01", "close": 1}, "x"]', "Element 2 ist kein Objekt"),
+    ('[{"date": "2024-01-01", "close": 1, "meta": {"a": 1}}]', "Feld 'meta' in Element 1"),
+    ('[{"date": "2024-01-01", "close": 1, "tags": [1]}]', "Feld 'tags' in Element 1"),
+    ('[{"date": "2024-01-01", "close": 1}', "nicht abgeschlossen"),
+])
+def test_invalid_json_reports_format_errors(tmp_path, content, message):
+    path = tmp_path / "eod.json"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError, match=message):
+        DataManager.read_file(str(path))
+
+
+def test_empty_json_array_gives_empty_store(tmp_path):
+    path = tmp_path / "eod.json"
+    path.write_text("[]", encoding="utf-8")
+    assert len(DataManager.read_file(str(path))) == 0
@@ -0,0 +1,62 @@
+"""Seitenweiser Abruf des MarketstackClient gegen den lokalen MockServer."""
+from urllib.parse import parse_qs
+
+import numpy as np
+
+from DataManager import DataManager
+from MarketstackClient import MarketstackClient, RequestScheduler
+from MockServer import MockState
+
+
+def make_client(base_url: str, **kwargs) -> MarketstackClient:
+    return MarketstackClient(base_url, scheduler=RequestScheduler(rate=None), **kwargs)
+
+
+def test_fetch_walks_offset_pages_until_total(mock_api):
+    state = MockState(days=250, rate=0)
+    client = make_client(mock_api(state), page_size=100)
+    progress = []
+    rows = client.fetch_eod("key", "AAPL,MSFT", progress=lambda done, total: progress.append((done, total)))
+    client.close()
+
+    # 2 Symbole x 250 Tage = 500 Datensätze in 5 Seiten zu je 100
+    assert len(rows) == 500
+    offsets = sorted(int(parse_qs(query)["offset"][0]) for query in state.seen)
+    assert offsets == [0, 100, 200, 300, 400]
+    assert all(int(parse_qs(query)["limit"][0]) == 100 for query in state.seen)
+    assert state.counts["served"] == 5
+    assert progress[-1] == (5, 5)
+
+
+def test_fetch_respects_concurrency_limit(mock_api):
+    state = MockState(days=900, rate=0, delay=0.05)
+    client = make_client(mock_api(state), page_size=100, max_concurrency=3)
+    rows = client.fetch_eod("key", "AAPL")
+    client.close()
+
+    assert len(rows) == 900
+    # Die Seiten nach der ersten laufen parallel, aber nie mehr als max_concurrency gleichzeitig
+    assert state.max_in_flight == 3
+
+
+def test_merged_pages_keep_offset_order(mock_api):
+    state = MockState(days=350, rate=0, delay=0.01)
+    client = make_client(mock_api(state), page_size=50, max_concurrency=4)
+    rows = client.fetch_eod("key", "AAPL", sort="ASC")
+    client.close()
+
+    dates = [row["date"] for row in rows]
+    assert len(dates) == 350
+    assert dates == sorted(dates) and len(set(dates)) == len(dates)
+
+
+def test_loaded_store_is_in_ascending_date_order(mock_api):
+    # Der MockServer liefert wie die API standardmäßig die neuesten Tage zuerst (sort=DESC)
+    state = MockState(days=420, rate=0)
+    data_manager = DataManager(client=make_client(mock_api(state), page_size=100))
+    store = data_manager.fetch_api("key", "AAPL")
+    data_manager.client.close()
+
+    dates = store.plottable("date")
+    assert len(dates) == 420
+    assert np.all(np.diff(dates) > np.timedelta64(0, "ns"))
@@ -0,0 +1,71 @@
+"""Vektorisierte Umwandlung der Plot-Spalten im Vergleich zur früheren Umwandlung Wert für Wert."""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ColumnStore import ColumnStore
+from DataManager import DataManager
+
+
+def convert_per_value(values):
+    """Umwandlung wie zuvor in update_custom_plot: erst fromisoformat, dann float."""
+    result = []
+    for value in values:
+        if isinstance(value, str):
+            try:
+                result.append(datetime.datetime.fromisoformat(value))
+                continue
+            except ValueError:
+                pass
+        result.append(float(value))
+    return result
+
+
+def as_datetime64(values):
+    return np.array([value.astimezone(datetime.timezone.utc).replace(tzinfo=None) for value in values],
+                    dtype="datetime64[ns]")
+
+
+RECORDS = [{"date": f"2024-03-{day:02d}T00:00:00+0000", "close": 100 + day * 0.25, "volume": 1000 * day,
+            "open": str(99 + day), "symbol": "AAPL"} for day in range(1, 21)]
+
+
+@pytest.mark.parametrize("key", ["close", "volume", "open"])
+def test_numeric_columns_match_per_value_conversion(key):
+    data_manager = DataManager()
+    data_manager.set_store(ColumnStore.from_records(RECORDS))
+    expected = convert_per_value([record[key] for record in RECORDS])
+    np.testing.assert_array_equal(data_manager.get_plot_data(key), np.array(expected, dtype=np.float64))
+
+
+def test_dates_match_per_value_conversion():
+    data_manager = DataManager()
+    data_manager.set_store(ColumnStore.from_records(RECORDS))
+    expected = as_datetime64(convert_per_value([record["date"] for record in RECORDS]))
+    np.testing.assert_array_equal(data_manager.get_plot_data("date"), expected)
+
+
+def test_csv_columns_match_per_value_conversion(tmp_path):
+    path = tmp_path / "eod.csv"
+    pd.DataFrame(RECORDS).to_csv(path, index=False)
+    store = DataManager.read_file(str(path))
+    frame = pd.read_csv(path)
+    np.testing.assert_array_equal(store.plottable("date"),
+                                  as_datetime64(convert_per_value(frame["date"].tolist())))
+    np.testing.assert_array_equal(store.plottable("close"), np.array(convert_per_value(frame["close"].tolist())))
+
+
+def test_conversion_runs_once_per_column():
+    store = ColumnStore({"value": ["1.5", "2", None, "4"]})
+    first = store.plottable("value")
+    np.testing.assert_array_equal(first, [1.5, 2.0, np.nan, 4.0])
+    assert store.plottable("value") is first
+    assert not first.flags.writeable
+
+
+def test_text_columns_are_not_plottable():
+    store = ColumnStore.from_records(RECORDS)
+    with pytest.raises(ValueError):
+        store.plottable("symbol")
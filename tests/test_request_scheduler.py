@@ -0,0 +1,119 @@
+"""Anfragelimit, Wiederholungen und Zusammenfassen gleicher Anfragen gegen den lokalen MockServer."""
+import threading
+import time
+from urllib.parse import parse_qs
+
+import pytest
+
+from MarketstackClient import LoadCancelled, MarketstackClient, RequestScheduler, TokenBucket
+from Metrics import metrics
+from MockServer import MockState
+
+
+def test_rate_limited_requests_are_retried(mock_api):
+    # Der Client hält sich an ein höheres Limit als der Server und läuft deshalb in 429-Antworten
+    state = MockState(days=300, rate=10, burst=2)
+    client = MarketstackClient(mock_api(state), page_size=50,
+                               scheduler=RequestScheduler(rate=100, burst=6, backoff=0.05, max_retries=8))
+    rows = client.fetch_eod("key", "AAPL")
+    client.close()
+
+    counters = metrics.snapshot()["counters"]
+    assert len(rows) == 300
+    assert state.counts["rate_limited"] > 0
+    assert counters["api.rate_limited"] == state.counts["rate_limited"]
+    assert counters["api.retries"] >= state.counts["rate_limited"]
+
+
+def test_server_errors_are_retried(mock_api):
+    state = MockState(days=400, rate=0, fail_rate=0.3, seed=1)
+    client = MarketstackClient(mock_api(state), page_size=50,
+                               scheduler=RequestScheduler(rate=None, backoff=0.01, max_retries=10))
+    rows = client.fetch_eod("key", "AAPL")
+    client.close()
+
+    assert len(rows) == 400
+    assert state.counts["failed"] > 0
+    assert metrics.snapshot()["counters"]["api.retries"] >= state.counts["failed"]
+
+
+def test_token_bucket_holds_the_server_rate(mock_api):
+    rate, burst, pages = 10, 2, 9
+    state = MockState(days=pages * 50, rate=rate, burst=burst)
+    client = MarketstackClient(mock_api(state), page_size=50, max_concurrency=4,
+                               scheduler=RequestScheduler(rate=rate, burst=burst, backoff=0.05))
+    start = time.perf_counter()
+    rows = client.fetch_eod("key", "AAPL")
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    assert len(rows) == pages * 50
+    # Kein 429: der Client hat das Limit des Servers eingehalten, statt es auszutesten
+    assert state.counts["rate_limited"] == 0
+    # Die ersten burst Anfragen starten sofort, danach höchstens burst je Zeitfenster von burst / rate Sekunden
+    assert elapsed >= (pages - 1) // burst * burst / rate * 0.9
+
+
+def test_token_bucket_blocks_until_a_token_returns():
+    bucket = TokenBucket(rate=20, burst=2)
+    for _ in range(2):
+        bucket.acquire()
+        bucket.release()
+    assert not bucket.try_acquire()
+    start = time.perf_counter()
+    bucket.acquire()
+    # Das erste Token kehrt burst / rate = 0,1 s nach seinem release zurück
+    assert 0.05 <= time.perf_counter() - start <= 0.5
+
+
+def test_duplicate_fetches_are_coalesced(mock_api):
+    state = MockState(days=400, rate=0, delay=0.05)
+    client = MarketstackClient(mock_api(state), page_size=100, scheduler=RequestScheduler(rate=None))
+    results = [None, None]
+
+    def load(index: int):
+        results[index] = client.fetch_eod("key", "AAPL")
+
+    threads = [threading.Thread(target=load, args=(index,)) for index in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert len(results[0]) == 400
+    # Beide Aufrufer erhalten dieselben Datensätze, jede Seite wurde genau einmal angefragt
+    assert results[0] == results[1]
+    assert sorted(int(parse_qs(query)["offset"][0]) for query in state.seen) == [0, 100, 200, 300]
+    assert all(count == 1 for count in state.seen.values())
+    assert metrics.snapshot()["counters"]["api.coalesced"] >= 1
+
+
+def test_coalesced_call_runs_once_and_waiter_can_cancel():
+    scheduler = RequestScheduler(rate=None)
+    release, calls = threading.Event(), []
+
+    def request():
+        calls.append(1)
+        release.wait(5)
+        return "ok"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(scheduler.call("key", request)))
+    leader.start()
+    while not calls:
+        time.sleep(0.01)
+
+    cancel = threading.Event()
+    cancel.set()
+    # Ein wartender Aufrufer bricht über sein Event ab (Timeout von concurrent.futures im Warten)
+    with pytest.raises(LoadCancelled):
+        scheduler.call("key", request, cancel)
+    waiter = threading.Thread(target=lambda: results.append(scheduler.call("key", request)))
+    waiter.start()
+    release.set()
+    leader.join()
+    waiter.join()
+
+    assert results == ["ok", "ok"]
+    assert len(calls) == 1
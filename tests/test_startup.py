@@ -0,0 +1,17 @@
+"""
+Prüft die Startzeit der Anwendung: Der Import des Hauptmoduls muss im Zeitbudget bleiben und darf keine der
+aufgeschobenen Bibliotheken laden.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Benchmark import STARTUP_BUDGET_MS, STARTUP_DEFERRED, measure_startup  # noqa: E402
+
+
+def test_startup_defers_heavy_imports_and_meets_budget():
+    result = measure_startup()
+    imported = {name.split(".")[0] for name in result["imported"]}
+    assert not imported & set(STARTUP_DEFERRED), f"Beim Start importiert: {sorted(imported & set(STARTUP_DEFERRED))}"
+    assert result["total_ms"] < STARTUP_BUDGET_MS, f"Import dauert {result['total_ms']:.1f} ms"